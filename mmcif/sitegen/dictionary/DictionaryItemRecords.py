@@ -0,0 +1,244 @@
+##
+# File:    DictionaryItemRecords.py
+# Date:    18-Oct-2026
+# Version: 0.001
+#
+# Updates:
+#   18-Oct-2026  -  take relationship lists from the shared relationship graph
+#   19-Oct-2026  -  read the item definition tables in a single walk rather than with per-item api accessors
+##
+"""
+Extract the item-level dictionary content used to render item pages in a single walk over the item definitions.
+
+"""
+__docformat__ = "restructuredtext en"
+__author__ = "John Westbrook"
+__email__ = "jwest@rcsb.rutgers.edu"
+__license__ = "Apache 2.0"
+
+import logging
+
+from mmcif.api.PdbxContainers import CifName
+
+from mmcif.sitegen.dictionary.DictionaryRelationshipGraph import DictionaryRelationshipGraph
+
+logger = logging.getLogger(__name__)
+
+
+class DictionaryItemRecords(object):
+    """Collect item attributes from a dictionary API instance into per-item records.
+
+    Each record is a dictionary with the keys listed in ``recordKeys``.  The tables of each item definition
+    (``_itemTableD``) are read in a single walk over the definition containers of the dictionary, and the record
+    values are assembled from these with the conventions of the corresponding dictionary api accessors (e.g.
+    DictionaryApi.getEnumListAltWithDetail()).  Data type details and subcategory descriptions are taken from
+    tables read once for the dictionary and the parent/child relationships from the dictionary relationship
+    graph (DictionaryRelationshipGraph).
+    """
+
+    # Item definition tables and the attributes read from each -
+    _itemTableD = {
+        "item": ("mandatory_code",),
+        "ndb_item": ("mandatory_code",),
+        "pdbx_item": ("mandatory_code",),
+        "item_description": ("description",),
+        "ndb_item_description": ("description",),
+        "pdbx_item_description": ("description",),
+        "item_examples": ("case", "detail"),
+        "ndb_item_examples": ("case", "detail"),
+        "pdbx_item_examples": ("case", "detail"),
+        "pdbx_item_context": ("type",),
+        "item_type": ("code",),
+        "ndb_item_type": ("code",),
+        "pdbx_item_type": ("code",),
+        "item_default": ("value",),
+        "item_units": ("code",),
+        "pdbx_item_enumeration_details": ("closed_flag",),
+        "item_enumeration": ("value", "detail"),
+        "pdbx_item_enumeration": ("value", "detail"),
+        "item_range": ("minimum", "maximum"),
+        "ndb_item_range": ("minimum", "maximum"),
+        "pdbx_item_range": ("minimum", "maximum"),
+        "item_related": ("related_name", "function_code"),
+        "item_dependent": ("dependent_name",),
+        "item_sub_category": ("id",),
+        "item_aliases": ("alias_name", "dictionary", "version"),
+    }
+
+    recordKeys = (
+        "itemName",
+        "categoryName",
+        "attributeName",
+        "mandatoryCode",
+        "mandatoryCodeAlt",
+        "description",
+        "descriptionAlt",
+        "exampleList",
+        "exampleListAlt",
+        "context",
+        "typeCode",
+        "typePrimitive",
+        "typeRegex",
+        "typeDetail",
+        "typeCodeAlt",
+        "typeRegexAlt",
+        "defaultValue",
+        "units",
+        "enumClosedFlag",
+        "enumListWithDetail",
+        "enumListAltWithDetail",
+        "boundaryList",
+        "boundaryListAlt",
+        "parentList",
+        "ultimateParent",
+        "childList",
+        "relatedList",
+        "dependentList",
+        "subCategoryList",
+        "aliasList",
+    )
+
+    def __init__(self, dictApiObj, relationshipGraphObj=None, verbose=False):
+        self.__verbose = verbose
+        self.__dApi = dictApiObj
+        self.__rG = relationshipGraphObj if relationshipGraphObj is not None else DictionaryRelationshipGraph(dictApiObj, verbose=verbose)
+        self.__recordD = None
+
+    def get(self, itemName):
+        """Return the record for the input item or None if the item is not defined."""
+        return self.getRecords().get(itemName)
+
+    def getRecords(self):
+        """Return the dictionary of item records {itemName: record, ...} building it on first use."""
+        if self.__recordD is None:
+            self.__recordD = self.__build()
+        return self.__recordD
+
+    def __build(self):
+        recordD = {}
+        # code -> (primitive_code, construct, detail)
+        typeD = {row[0]: (row[1], row[2], row[3]) for row in self.__dApi.getDataTypeList()}
+        subCategoryD = dict(self.__dApi.getSubCategoryList())
+        definitionD = self.__dApi.getDefinitionIndex()
+        # Items that fail are logged and omitted -
+        tableD = {}
+        for categoryName in self.__dApi.getCategoryList():
+            for itemName in self.__dApi.getItemNameList(categoryName):
+                try:
+                    tableD[itemName] = self.__readItemTables(definitionD.get(itemName, []))
+                except Exception as e:
+                    logger.exception("Failing to read definition tables for %s with %s", itemName, str(e))
+        #
+        for itemName in tableD:
+            try:
+                recordD[itemName] = self.__makeRecord(itemName, tableD, typeD, subCategoryD)
+            except Exception as e:
+                logger.exception("Failing to make record for %s with %s", itemName, str(e))
+        logger.debug("Extracted %d item records", len(recordD))
+        return recordD
+
+    def __readItemTables(self, definitionList):
+        """Return the first row values {(table, attribute): value, ...} and the column values {(table, attribute): [value, ...], ...}
+        of the item tables in the input definition containers.  As in the dictionary api, the first row value of a later
+        definition replaces that of an earlier one and column values are concatenated across definitions.
+        """
+        valueD = {}
+        columnD = {}
+        for dObj in definitionList:
+            for tableName in dObj.getObjNameList():
+                if tableName not in self._itemTableD:
+                    continue
+                dc = dObj.getObj(tableName)
+                rowList = dc.getRowList()
+                attributeNameList = self._itemTableD[tableName]
+                for idx, attributeName in enumerate(dc.getAttributeList()):
+                    if attributeName not in attributeNameList:
+                        continue
+                    ky = (tableName, attributeName)
+                    if rowList:
+                        valueD[ky] = rowList[0][idx]
+                    columnD.setdefault(ky, []).extend([row[idx] for row in rowList])
+        return valueD, columnD
+
+    def __getTypeCode(self, itemName, tableD):
+        """Return the item type code or that of the ultimate parent item if the code is missing (c.f. DictionaryApi.getTypeCode())."""
+        typeCode = tableD[itemName][0].get(("item_type", "code"))
+        if not typeCode or typeCode in [".", "?"]:
+            parentItemName = self.__rG.getUltimateParent(itemName)
+            if parentItemName and parentItemName != itemName:
+                return tableD[parentItemName][0].get(("item_type", "code")) if parentItemName in tableD else None
+        return typeCode
+
+    def __getTupleList(self, columnD, tableName, *attributeNames):
+        """Return [(value1, value2, ...), ...] for the input columns truncated to the shortest column (c.f. DictionaryApi.getBoundaryList())."""
+        return list(zip(*[columnD.get((tableName, attributeName), []) for attributeName in attributeNames]))
+
+    def __getTypeRegexAlt(self, typeCodeList, typeD):
+        for code in typeCodeList:
+            if code in typeD:
+                return typeD[code][1]
+        return None
+
+    def __getPairList(self, columnD, tableName, attributeName1, attributeName2):
+        """Return [(value1, value2), ...] or [(value1, None), ...] if the columns differ in length (c.f. DictionaryApi.getExampleList())."""
+        v1L = columnD.get((tableName, attributeName1), [])
+        v2L = columnD.get((tableName, attributeName2), [])
+        return list(zip(v1L, v2L)) if len(v1L) == len(v2L) else [(v1, None) for v1 in v1L]
+
+    def __getEnumListWithDetail(self, columnD, tableName):
+        """Return the sorted list of unique enumerations [(value, detail or None), ...] (c.f. DictionaryApi.getEnumListWithDetail())."""
+        eVL = columnD.get((tableName, "value"), [])
+        eDL = columnD.get((tableName, "detail"), [])
+        dD = {}
+        if len(eVL) == len(eDL):
+            for eV, eD in zip(eVL, eDL):
+                dD[eV] = (eV, None) if not eD or eD in [".", "?"] else (eV, eD)
+        else:
+            for eV in eVL:
+                dD[eV] = (eV, None)
+        return [dD[ky] for ky in sorted(dD.keys())]
+
+    def __makeRecord(self, itemName, tableD, typeD, subCategoryD):
+        valueD, columnD = tableD[itemName]
+        categoryName = CifName.categoryPart(itemName)
+        attributeName = CifName.attributePart(itemName)
+        rD = {"itemName": itemName, "categoryName": categoryName, "attributeName": attributeName}
+        # Alternate (pdbx or ndb) values without fall back to the standard values -
+        rD["mandatoryCode"] = valueD.get(("item", "mandatory_code"))
+        vAlt = valueD.get(("pdbx_item", "mandatory_code"))
+        rD["mandatoryCodeAlt"] = vAlt if vAlt is not None else valueD.get(("ndb_item", "mandatory_code"))
+        rD["description"] = valueD.get(("item_description", "description"))
+        vAlt = valueD.get(("pdbx_item_description", "description"))
+        rD["descriptionAlt"] = vAlt if vAlt is not None else valueD.get(("ndb_item_description", "description"))
+        rD["exampleList"] = self.__getPairList(columnD, "item_examples", "case", "detail")
+        rD["exampleListAlt"] = self.__getPairList(columnD, "pdbx_item_examples", "case", "detail") or self.__getPairList(columnD, "ndb_item_examples", "case", "detail")
+        rD["context"] = list(set(columnD.get(("pdbx_item_context", "type"), [])))
+        #
+        typeCode = self.__getTypeCode(itemName, tableD)
+        typePrimitive, typeRegex, typeDetail = typeD.get(typeCode, (None, None, None))
+        rD["typeCode"] = typeCode
+        rD["typePrimitive"] = typePrimitive
+        rD["typeRegex"] = typeRegex
+        rD["typeDetail"] = typeDetail
+        typeCodePdbx = valueD.get(("pdbx_item_type", "code"))
+        typeCodeNdb = valueD.get(("ndb_item_type", "code"))
+        rD["typeCodeAlt"] = typeCodePdbx if typeCodePdbx is not None else typeCodeNdb
+        rD["typeRegexAlt"] = self.__getTypeRegexAlt([typeCodePdbx, typeCodeNdb], typeD)
+        #
+        rD["defaultValue"] = valueD.get(("item_default", "value"))
+        rD["units"] = valueD.get(("item_units", "code"))
+        rD["enumClosedFlag"] = valueD.get(("pdbx_item_enumeration_details", "closed_flag"))
+        rD["enumListWithDetail"] = self.__getEnumListWithDetail(columnD, "item_enumeration")
+        rD["enumListAltWithDetail"] = self.__getEnumListWithDetail(columnD, "pdbx_item_enumeration") or rD["enumListWithDetail"]
+        rD["boundaryList"] = self.__getTupleList(columnD, "item_range", "minimum", "maximum")
+        rD["boundaryListAlt"] = self.__getTupleList(columnD, "pdbx_item_range", "minimum", "maximum") or self.__getTupleList(columnD, "ndb_item_range", "minimum", "maximum")
+        #
+        parentList = self.__rG.getParentItems(itemName)
+        rD["parentList"] = parentList
+        rD["ultimateParent"] = self.__rG.getUltimateParent(itemName) if parentList else None
+        rD["childList"] = self.__rG.getChildItems(itemName)
+        rD["relatedList"] = self.__getTupleList(columnD, "item_related", "related_name", "function_code")
+        rD["dependentList"] = list(set(columnD.get(("item_dependent", "dependent_name"), [])))
+        rD["subCategoryList"] = [(subCategory, subCategoryD.get(subCategory, "")) for subCategory in set(columnD.get(("item_sub_category", "id"), []))]
+        rD["aliasList"] = self.__getTupleList(columnD, "item_aliases", "alias_name", "dictionary", "version")
+        return rD
@@ -6,6 +6,7 @@
 #
 # Updates:
 #     7-Jul-2018  ep  mmcif_ma and remove generation of mmcif_mdb to registry
+#    18-Oct-2026      add optional enumeration table row limit
 ##
 """
 Classes providing a registry of essential information about known data dictionaries and data item coverage statistics.
@@ -94,3 +95,11 @@ class DictionaryRegistry(object):
         except Exception as e:
             logger.debug("Failing with %s", str(e))
             return None
+
+    def getEnumRowLimit(self, dictionaryName):
+        """Return the maximum number of enumeration rows rendered in the item pages of the dictionary (optional)"""
+        try:
+            return self.__dictInfoD[dictionaryName]["enumRowLimit"]
+        except Exception as e:
+            logger.debug("Failing with %s", str(e))
+            return None
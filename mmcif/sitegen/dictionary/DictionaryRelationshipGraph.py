@@ -0,0 +1,136 @@
+##
+# File:    DictionaryRelationshipGraph.py
+# Date:    18-Oct-2026
+# Version: 0.001
+#
+# Updates:
+#  19-Oct-2026  strip self parents from copies of the dictionary api parent lists
+##
+"""
+Parent/child relationship graph for the data items and categories in a dictionary.
+
+"""
+__docformat__ = "restructuredtext en"
+__author__ = "John Westbrook"
+__email__ = "jwest@rcsb.rutgers.edu"
+__license__ = "Apache 2,0"
+
+import logging
+
+from mmcif.api.PdbxContainers import CifName
+
+logger = logging.getLogger(__name__)
+
+
+class DictionaryRelationshipGraph(object):
+    """Item and category level parent/child adjacency, ultimate parents and relationship edges
+    for a dictionary, built in a single pass on first use.
+
+    Item parent and child lists preserve the order of the dictionary api full parent and child
+    lists (excluding self parents).  Returned lists are shared and should not be modified.
+    """
+
+    def __init__(self, dictApiObj, verbose=False):
+        self.__verbose = verbose
+        self.__dApi = dictApiObj
+        self.__parentD = None
+        self.__childD = None
+        self.__ultimateParentD = None
+        self.__parentCategoryD = None
+        self.__childCategoryD = None
+        self.__edgeList = None
+
+    def __build(self):
+        """Query the parent and child items of each defined item and of every item these reference."""
+        parentD = {}
+        childD = {}
+        itemNameList = []
+        for categoryName in self.__dApi.getCategoryList():
+            itemNameList.extend(self.__dApi.getItemNameList(categoryName))
+        #
+        edgeList = []
+        pendingList = list(itemNameList)
+        while pendingList:
+            nextList = []
+            for itemName in pendingList:
+                if itemName in parentD:
+                    continue
+                categoryName = CifName.categoryPart(itemName)
+                attributeName = CifName.attributePart(itemName)
+                # Copies - the dictionary api returns (and strips self parents from) its cached lists in place
+                parentD[itemName] = [parentItemName for parentItemName in self.__dApi.getFullParentList(categoryName, attributeName) if parentItemName != itemName]
+                childD[itemName] = list(self.__dApi.getFullChildList(categoryName, attributeName))
+                for parentItemName in parentD[itemName]:
+                    edgeList.append((itemName, parentItemName))
+                nextList.extend(parentD[itemName])
+                nextList.extend(childD[itemName])
+            pendingList = [itemName for itemName in nextList if itemName not in parentD]
+        #
+        parentCategoryD = {}
+        childCategoryD = {}
+        for itemName in itemNameList:
+            categoryName = CifName.categoryPart(itemName)
+            pS = parentCategoryD.setdefault(categoryName, set())
+            pS.update([CifName.categoryPart(parentItemName) for parentItemName in parentD[itemName]])
+            cS = childCategoryD.setdefault(categoryName, set())
+            cS.update([CifName.categoryPart(childItemName) for childItemName in childD[itemName]])
+        #
+        self.__parentD = parentD
+        self.__childD = childD
+        self.__ultimateParentD = {}
+        self.__parentCategoryD = {k: sorted(v) for k, v in parentCategoryD.items()}
+        self.__childCategoryD = {k: sorted(v) for k, v in childCategoryD.items()}
+        self.__edgeList = edgeList
+        logger.debug("Relationship graph items %d edges %d", len(parentD), len(edgeList))
+
+    def __getParentD(self):
+        if self.__parentD is None:
+            self.__build()
+        return self.__parentD
+
+    def getParentItems(self, itemName):
+        """Return the list of parent items of the input item."""
+        return self.__getParentD().get(itemName, [])
+
+    def getChildItems(self, itemName):
+        """Return the list of child items of the input item."""
+        self.__getParentD()
+        return self.__childD.get(itemName, [])
+
+    def getUltimateParent(self, itemName):
+        """Return the ultimate parent item reached by following the first parent of each item, or
+        the input item if it has no parents (c.f. DictionaryApi.getUltimateParent()).
+        """
+        parentD = self.__getParentD()
+        if itemName not in self.__ultimateParentD:
+            pathList = [itemName]
+            pL = parentD.get(itemName, [])
+            while pL and pL[0] not in pathList:
+                pathList.append(pL[0])
+                pL = parentD.get(pL[0], [])
+            if pL:
+                logger.warning("Parent relationship cycle for %s at %s", itemName, pL[0])
+            self.__ultimateParentD[itemName] = pathList[-1]
+        return self.__ultimateParentD[itemName]
+
+    def getParentCategories(self, categoryName):
+        """Return the sorted list of categories containing parents of the items in the input category."""
+        self.__getParentD()
+        return self.__parentCategoryD.get(categoryName, [])
+
+    def getChildCategories(self, categoryName):
+        """Return the sorted list of categories containing children of the items in the input category."""
+        self.__getParentD()
+        return self.__childCategoryD.get(categoryName, [])
+
+    def getAdjacentCategories(self, categoryName):
+        """Return the sorted list of the input category and its parent and child categories."""
+        return sorted(set([categoryName] + self.getParentCategories(categoryName) + self.getChildCategories(categoryName)))
+
+    def getEdgeList(self):
+        """Return the list of item relationship edges [(childItemName, parentItemName), ...]"""
+        self.__getParentD()
+        return self.__edgeList
+
+    def getItemCount(self):
+        return len(self.__getParentD())
@@ -0,0 +1,301 @@
+##
+# File:    DictionarySearchIndex.py
+# Date:    18-Oct-2026
+# Version: 0.001
+#
+# Updates:
+##
+"""
+Build a static inverted index of dictionary content for client-side search.
+
+"""
+__docformat__ = "restructuredtext en"
+__author__ = "John Westbrook"
+__email__ = "jwest@rcsb.rutgers.edu"
+__license__ = "Apache 2,0"
+
+import json
+import logging
+import os
+import re
+
+from mmcif.sitegen.dictionary.DictionaryItemRecords import DictionaryItemRecords
+
+logger = logging.getLogger(__name__)
+
+
+class DictionarySearchIndex(object):
+    """Inverted index over dictionary category and item names, descriptions, enumeration values and aliases.
+
+    The index is written as a set of JSON files in the dictionary search directory:
+
+        meta.json           - index version, document count and chunk size, token prefix length, shard prefixes and
+                              the page url prefix for each document type
+        docs-<n>.json       - documents docId = n * docChunkSize + i as [name, type ('c'ategory or 'i'tem), description snippet]
+        shard-<prefix>.json - postings {token: [docId, fieldMask, docId, fieldMask, ...], ...} for tokens with this prefix
+        search.js           - query script for these files
+
+    Field mask bits identify where a token occurs (see fieldBitD) and are used to rank results.
+    """
+
+    fieldBitD = {"name": 1, "description": 2, "enumeration": 4, "alias": 8}
+    _tokenPattern = re.compile(r"[a-z0-9]+")
+    _stopWords = frozenset(
+        ["a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "in", "is", "it", "of", "on", "or", "that", "the", "this", "to", "which", "with"]
+    )
+
+    def __init__(self, dictApiObj, pathInfoObj, itemRecordsObj=None, prefixLength=2, snippetLength=160, docChunkSize=500, verbose=False):
+        self.__verbose = verbose
+        self.__dApi = dictApiObj
+        self.__pI = pathInfoObj
+        self.__itemRecords = itemRecordsObj if itemRecordsObj is not None else DictionaryItemRecords(dictApiObj, verbose=verbose)
+        self.__prefixLength = prefixLength
+        self.__snippetLength = snippetLength
+        self.__docChunkSize = docChunkSize
+        self.__docList = []
+        self.__postingD = {}
+
+    def getDocumentList(self):
+        """Return the list of indexed documents [name, type, page url, description snippet] ordered by docId."""
+        return self.__docList
+
+    def getPostings(self):
+        """Return the inverted index {token: {docId: fieldMask, ...}, ...}"""
+        return self.__postingD
+
+    def tokenize(self, text):
+        if not text:
+            return []
+        return [tok for tok in self._tokenPattern.findall(text.lower()) if len(tok) > 1 and tok not in self._stopWords]
+
+    def __getNameTokens(self, name):
+        """Name tokens include the whole name (without the leading underscore) and each of its word parts."""
+        tL = self.tokenize(name)
+        nm = name.lower().lstrip("_")
+        if nm:
+            tL.append(nm)
+            if "." in nm:
+                tL.append(nm.split(".")[0])
+        return tL
+
+    def __getValueTokens(self, value):
+        """Enumeration value tokens include the whole value when it is a single word joined by '_' or '.'"""
+        tL = self.tokenize(value)
+        vS = value.lower().lstrip("_") if value else ""
+        if vS and ("_" in vS or "." in vS) and not any(c.isspace() for c in vS):
+            tL.append(vS)
+        return tL
+
+    def __addDocument(self, name, docType, url, description, fieldTextD):
+        docId = len(self.__docList)
+        snippet = " ".join(description.split()) if description else ""
+        if len(snippet) > self.__snippetLength:
+            snippet = snippet[: self.__snippetLength].rsplit(" ", 1)[0] + " ..."
+        self.__docList.append([name, docType, url, snippet])
+        #
+        for field, tokenList in fieldTextD.items():
+            bit = self.fieldBitD[field]
+            for tok in tokenList:
+                dD = self.__postingD.setdefault(tok, {})
+                dD[docId] = dD.get(docId, 0) | bit
+
+    def build(self):
+        """Build the index from the dictionary categories and items."""
+        self.__docList = []
+        self.__postingD = {}
+        try:
+            recordD = self.__itemRecords.getRecords()
+            for categoryName in self.__dApi.getCategoryList():
+                description = self.__dApi.getCategoryDescription(categoryName)
+                self.__addDocument(
+                    categoryName,
+                    "category",
+                    self.__pI.getContentTypeObjUrl(contentObjName=categoryName, contentType="Categories"),
+                    description,
+                    {"name": self.__getNameTokens(categoryName), "description": self.tokenize(description)},
+                )
+                for itemName in self.__dApi.getItemNameList(categoryName):
+                    rD = recordD.get(itemName)
+                    if rD is None:
+                        continue
+                    enumTokenList = []
+                    for eV in (rD["enumListWithDetail"] or []) + (rD["enumListAltWithDetail"] or []):
+                        enumTokenList.extend(self.__getValueTokens(eV[0]))
+                    aliasTokenList = []
+                    for aliasTup in rD["aliasList"] or []:
+                        aliasTokenList.extend(self.__getNameTokens(aliasTup[0]))
+                    self.__addDocument(
+                        itemName,
+                        "item",
+                        self.__pI.getContentTypeObjUrl(contentObjName=itemName, contentType="Items"),
+                        rD["description"],
+                        {"name": self.__getNameTokens(itemName), "description": self.tokenize(rD["description"]), "enumeration": enumTokenList, "alias": aliasTokenList},
+                    )
+            logger.debug("Search index documents %d tokens %d", len(self.__docList), len(self.__postingD))
+            return True
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+        return False
+
+    def __getShards(self):
+        shardD = {}
+        for tok in sorted(self.__postingD):
+            pL = []
+            for docId, mask in sorted(self.__postingD[tok].items()):
+                pL.extend([docId, mask])
+            shardD.setdefault(tok[: self.__prefixLength], {})[tok] = pL
+        return shardD
+
+    def __writeJson(self, filePath, obj):
+        with open(filePath, "w", encoding="utf-8") as ofh:
+            json.dump(obj, ofh, separators=(",", ":"), ensure_ascii=False)
+
+    def write(self):
+        """Write the index files and query script to the dictionary search directory."""
+        try:
+            pth = self.__pI.getDictSearchPath()
+            if not os.access(pth, os.W_OK):
+                os.makedirs(pth, 0o755)
+            for fn in os.listdir(pth):
+                if (fn.startswith("shard-") or fn.startswith("docs-")) and fn.endswith(".json"):
+                    os.remove(os.path.join(pth, fn))
+            #
+            shardD = self.__getShards()
+            for prefix, tokenD in shardD.items():
+                self.__writeJson(os.path.join(pth, "shard-%s.json" % prefix), tokenD)
+            numChunks = 0
+            for ii in range(0, len(self.__docList), self.__docChunkSize):
+                chunkL = [[doc[0], doc[1][0], doc[3]] for doc in self.__docList[ii : ii + self.__docChunkSize]]
+                self.__writeJson(os.path.join(pth, "docs-%d.json" % numChunks), chunkL)
+                numChunks += 1
+            self.__writeJson(
+                os.path.join(pth, "meta.json"),
+                {
+                    "version": 1,
+                    "dictionary": self.__pI.getDictDirectoryName(),
+                    "docCount": len(self.__docList),
+                    "docChunkSize": self.__docChunkSize,
+                    "docChunkCount": numChunks,
+                    "pageUrls": {
+                        "c": os.path.join(os.path.dirname(self.__pI.getContentTypeIndexUrl("Categories")), ""),
+                        "i": os.path.join(os.path.dirname(self.__pI.getContentTypeIndexUrl("Items")), ""),
+                    },
+                    "prefixLength": self.__prefixLength,
+                    "fieldBits": self.fieldBitD,
+                    "shards": sorted(shardD.keys()),
+                },
+            )
+            with open(os.path.join(pth, "search.js"), "w", encoding="utf-8") as ofh:
+                ofh.write(self.__getQueryScript())
+            logger.info("Search index for %s documents %d tokens %d shards %d", self.__pI.getDictDirectoryName(), len(self.__docList), len(self.__postingD), len(shardD))
+            return True
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+        return False
+
+    def __getQueryScript(self):
+        """Static query script -  dictionarySearch(baseUrl, queryText, callback) passes a ranked list of
+        {name, type, url, snippet} results to callback.  All query tokens must match; the final token
+        also matches as a prefix.  Query words containing '_' or '.' are matched as whole (or leading parts of)
+        category and item names.
+        """
+        return """/* Client-side search over the static dictionary index files in this directory. */
+var dictionarySearch = (function () {
+    var cache = {};
+    var stopWords = %s;
+
+    function getJson(url) {
+        if (!cache[url]) {
+            cache[url] = fetch(url).then(function (r) {
+                return r.ok ? r.json() : {};
+            });
+        }
+        return cache[url];
+    }
+
+    function tokenize(text) {
+        var tokens = [];
+        text.toLowerCase().split(/\\s+/).forEach(function (w) {
+            w = w.replace(/^_+/, "");
+            if (/[_.]/.test(w)) {
+                tokens.push(w);
+            } else {
+                (w.match(/[a-z0-9]+/g) || []).forEach(function (t) {
+                    if (t.length > 1 && stopWords.indexOf(t) < 0) {
+                        tokens.push(t);
+                    }
+                });
+            }
+        });
+        return tokens;
+    }
+
+    function score(mask) {
+        return (mask & 1 ? 8 : 0) + (mask & 8 ? 4 : 0) + (mask & 4 ? 2 : 0) + (mask & 2 ? 1 : 0);
+    }
+
+    return function (baseUrl, queryText, callback, maxResults) {
+        maxResults = maxResults || 50;
+        var tokens = tokenize(queryText);
+        if (!tokens.length) {
+            callback([]);
+            return;
+        }
+        getJson(baseUrl + "/meta.json").then(function (meta) {
+            var n = meta.prefixLength;
+            var shardNames = tokens.map(function (t) {
+                return t.substring(0, n);
+            });
+            return Promise.all(shardNames.map(function (p) {
+                return meta.shards.indexOf(p) < 0 ? Promise.resolve({}) : getJson(baseUrl + "/shard-" + p + ".json");
+            })).then(function (shards) {
+                var scores = null;
+                tokens.forEach(function (t, i) {
+                    var shard = shards[i];
+                    var keys = (i === tokens.length - 1) ? Object.keys(shard).filter(function (k) {
+                        return k.indexOf(t) === 0;
+                    }) : (shard[t] ? [t] : []);
+                    var tScores = {};
+                    keys.forEach(function (k) {
+                        var p = shard[k];
+                        var exact = (k === t) ? 2 : 1;
+                        for (var j = 0; j < p.length; j += 2) {
+                            tScores[p[j]] = Math.max(tScores[p[j]] || 0, exact * score(p[j + 1]));
+                        }
+                    });
+                    if (scores === null) {
+                        scores = tScores;
+                    } else {
+                        var merged = {};
+                        Object.keys(scores).forEach(function (d) {
+                            if (d in tScores) {
+                                merged[d] = scores[d] + tScores[d];
+                            }
+                        });
+                        scores = merged;
+                    }
+                });
+                var ids = Object.keys(scores).map(Number).sort(function (a, b) {
+                    return (scores[b] - scores[a]) || (a - b);
+                }).slice(0, maxResults);
+                var chunks = ids.map(function (d) {
+                    return Math.floor(d / meta.docChunkSize);
+                });
+                return Promise.all(chunks.map(function (c) {
+                    return getJson(baseUrl + "/docs-" + c + ".json");
+                })).then(function (docChunks) {
+                    callback(ids.map(function (d, i) {
+                        var doc = docChunks[i][d %% meta.docChunkSize];
+                        return {
+                            name: doc[0],
+                            type: doc[1] === "c" ? "category" : "item",
+                            url: meta.pageUrls[doc[1]] + doc[0].split("/").join("_over_") + ".html",
+                            snippet: doc[2]
+                        };
+                    }));
+                });
+            });
+        });
+    };
+})();
+""" % json.dumps(sorted(self._stopWords))
@@ -0,0 +1,89 @@
+##
+# File:    FigureCache.py
+# Date:    18-Oct-2026
+# Version: 0.001
+#
+# Updates:
+##
+"""
+Persistent content-addressed cache of rendered figures.
+
+"""
+__docformat__ = "restructuredtext en"
+__author__ = "John Westbrook"
+__email__ = "jwest@rcsb.rutgers.edu"
+__license__ = "Apache 2,0"
+
+import hashlib
+import logging
+import os
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+class FigureCache(object):
+    """Cache of rendered figures keyed by a hash of the layout input and options.
+
+    Figures are stored as <cachePath>/<key[:2]>/<key>.<figFormat>.  Lookups and stores may be made
+    concurrently from multiple threads.
+    """
+
+    def __init__(self, cachePath, verbose=False):
+        self.__verbose = verbose
+        self.__cachePath = cachePath
+        self.__lock = threading.Lock()
+        self.__statsD = {"hits": 0, "misses": 0, "stores": 0, "bytesRead": 0, "bytesStored": 0}
+
+    @staticmethod
+    def getKey(layoutText, figFormat="svg", size=None, engine=""):
+        """Return the cache key for the input layout instructions, output format, size and layout engine identifier."""
+        hObj = hashlib.sha256()
+        for val in [engine, figFormat, str(size), layoutText]:
+            hObj.update(val.encode("utf-8"))
+            hObj.update(b"\0")
+        return hObj.hexdigest()
+
+    def __getPath(self, key, figFormat):
+        return os.path.join(self.__cachePath, key[:2], key + "." + figFormat)
+
+    def __count(self, **kwargs):
+        with self.__lock:
+            for ky, val in kwargs.items():
+                self.__statsD[ky] += val
+
+    def get(self, key, figFormat="svg"):
+        """Return the cached figure data (bytes) for the input key or None if it is not in the cache."""
+        try:
+            with open(self.__getPath(key, figFormat), "rb") as ifh:
+                data = ifh.read()
+            self.__count(hits=1, bytesRead=len(data))
+            return data
+        except (IOError, OSError):
+            pass
+        self.__count(misses=1)
+        return None
+
+    def put(self, key, data, figFormat="svg"):
+        """Store the figure data (bytes) for the input key."""
+        filePath = self.__getPath(key, figFormat)
+        tmpPath = "%s.%d.%d.tmp" % (filePath, os.getpid(), threading.get_ident())
+        try:
+            pth = os.path.dirname(filePath)
+            if not os.access(pth, os.W_OK):
+                os.makedirs(pth, 0o755, exist_ok=True)
+            with open(tmpPath, "wb") as ofh:
+                ofh.write(data)
+            os.replace(tmpPath, filePath)
+            self.__count(stores=1, bytesStored=len(data))
+            return True
+        except Exception as e:
+            logger.error("Failing to cache %s with %s", filePath, str(e))
+            if os.path.exists(tmpPath):
+                os.remove(tmpPath)
+        return False
+
+    def getStats(self):
+        """Return cache statistics {"hits", "misses", "stores", "bytesRead", "bytesStored"} for this instance."""
+        with self.__lock:
+            return dict(self.__statsD)
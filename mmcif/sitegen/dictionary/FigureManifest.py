@@ -0,0 +1,118 @@
+##
+# File:    FigureManifest.py
+# Date:    18-Oct-2026
+# Version: 0.001
+#
+# Updates:
+#  19-Oct-2026  record the simplification of degraded figures
+#  19-Oct-2026  record the fingerprint of the figure layout inputs
+##
+"""
+Manifest of the category relationship figures generated for a dictionary.
+
+"""
+__docformat__ = "restructuredtext en"
+__author__ = "John Westbrook"
+__email__ = "jwest@rcsb.rutgers.edu"
+__license__ = "Apache 2,0"
+
+import hashlib
+import logging
+import os
+import re
+
+from rcsb.utils.io.MarshalUtil import MarshalUtil
+
+logger = logging.getLogger(__name__)
+
+
+class FigureManifest(object):
+    """Record the category figures that exist for a dictionary with their dimensions and content hashes.
+
+    Figure variants are 'full' for the unfiltered diagram or the delivery type ('archive', 'cc', 'prd', 'family')
+    used to filter the diagram.  The manifest is stored as JSON:
+
+        {"version": 1, "figures": {categoryName: {variant: {"fileName": ..., "width": ..., "height": ..., "hash": ...}, ...}, ...}}
+
+    Figures simplified to complete their layout (see NeighborFigures.layoutDegradedNeighborFigure()) also record
+    the simplification as "degraded", and figures may record the fingerprint of their layout inputs as "source"
+    (see NeighborFigures.getFigureFingerprint()).
+    """
+
+    _svgDimensionPattern = re.compile(r"<svg\b[^>]*?\bwidth=\"([^\"]*)\"[^>]*?\bheight=\"([^\"]*)\"", re.DOTALL)
+
+    def __init__(self, manifestPath, verbose=False):
+        self.__verbose = verbose
+        self.__manifestPath = manifestPath
+        self.__figureD = {}
+
+    @staticmethod
+    def getFigureFileName(categoryName, variant="full", figFormat="svg"):
+        """Return the conventional figure file name for the input category and figure variant."""
+        if variant == "full":
+            return categoryName + "_neighbors." + figFormat
+        return categoryName + "_neighbors_" + variant + "." + figFormat
+
+    def read(self):
+        """Read the manifest file.  Returns False if the manifest is missing or cannot be read."""
+        self.__figureD = {}
+        if not os.access(self.__manifestPath, os.R_OK):
+            logger.debug("No figure manifest at %s", self.__manifestPath)
+            return False
+        try:
+            mU = MarshalUtil()
+            obj = mU.doImport(self.__manifestPath, fmt="json")
+            self.__figureD = obj["figures"]
+            return True
+        except Exception as e:
+            logger.exception("Failing for %r with %s", self.__manifestPath, str(e))
+        return False
+
+    def write(self):
+        try:
+            mU = MarshalUtil()
+            return mU.doExport(self.__manifestPath, {"version": 1, "figures": self.__figureD}, fmt="json", indent=1)
+        except Exception as e:
+            logger.exception("Failing for %r with %s", self.__manifestPath, str(e))
+        return False
+
+    def clear(self):
+        self.__figureD = {}
+
+    def addFigure(self, categoryName, variant, figFilePath, degradation=None, source=None):
+        """Add the existing figure file for the input category and variant to the manifest."""
+        try:
+            with open(figFilePath, "rb") as ifh:
+                data = ifh.read()
+            width = height = None
+            mObj = self._svgDimensionPattern.search(data[:4096].decode("utf-8", "replace"))
+            if mObj:
+                width, height = mObj.group(1), mObj.group(2)
+            self.__figureD.setdefault(categoryName, {})[variant] = {
+                "fileName": os.path.basename(figFilePath),
+                "width": width,
+                "height": height,
+                "hash": hashlib.sha1(data).hexdigest(),
+            }
+            if degradation:
+                self.__figureD[categoryName][variant]["degraded"] = degradation
+            if source:
+                self.__figureD[categoryName][variant]["source"] = source
+            return True
+        except Exception as e:
+            logger.error("Failing for %r with %s", figFilePath, str(e))
+        return False
+
+    def getFigure(self, categoryName, variant="full"):
+        """Return the manifest entry for the input category and variant or None if there is no figure."""
+        try:
+            return self.__figureD[categoryName][variant]
+        except KeyError:
+            return None
+
+    def getFigureKeyList(self):
+        """Return the (categoryName, variant) of each figure in the manifest."""
+        return [(categoryName, variant) for categoryName, vD in self.__figureD.items() for variant in vD]
+
+    def getFigureCount(self):
+        return sum([len(vD) for vD in self.__figureD.values()])
@@ -7,6 +7,19 @@
 # Updates:
 #    8-Oct-2013  -  Reorder category page sections --
 #   29-Dec-2020  -  Cleanup and py39
+#   18-Oct-2026  -  Internal renderers return immutable markup fragments
+#   18-Oct-2026  -  Optional streaming output for index pages
+#   18-Oct-2026  -  Precompute icon anchor markup for all content icon types
+#   18-Oct-2026  -  Render item pages from item records extracted in a single walk
+#   18-Oct-2026  -  Cache item and category link list fragments shared across pages
+#   18-Oct-2026  -  Locate category figures using the figure manifest
+#   18-Oct-2026  -  Alphabetical index pages with lazily loaded fragments
+#   18-Oct-2026  -  Optional row limit for enumeration tables with the complete table loaded on demand
+#   18-Oct-2026  -  Share the dictionary relationship graph with item records and figures
+#   19-Oct-2026  -  Add category relationship overview figures to the category group pages
+#   19-Oct-2026  -  Optional inline compressed primary figure on category pages
+#   19-Oct-2026  -  Fingerprints of the inputs of category and item pages for incremental builds
+#   19-Oct-2026  -  Generate lazily loaded index fragments one at a time for immediate output
 ##
 # pylint: disable=too-many-lines
 """
@@ -18,13 +31,23 @@ __author__ = "John Westbrook"
 __email__ = "jwest@rcsb.rutgers.edu"
 __license__ = "Apache 2,0"
 
+import base64
+import gzip
+import hashlib
+import itertools
+import json
 import logging
 import os
+import re
 
 from mmcif.api.PdbxContainers import CifName
 
+from mmcif.sitegen.dictionary.DictionaryItemRecords import DictionaryItemRecords
+from mmcif.sitegen.dictionary.DictionaryRelationshipGraph import DictionaryRelationshipGraph
+from mmcif.sitegen.dictionary.FigureManifest import FigureManifest
 from mmcif.sitegen.dictionary.HtmlMarkupUtils import HtmlComponentMarkupUtils
 from mmcif.sitegen.dictionary.HtmlMarkupUtils import HtmlMarkupUtils
+from mmcif.sitegen.dictionary.OverviewFigures import OverviewFigures
 
 logger = logging.getLogger(__name__)
 
@@ -38,8 +61,12 @@ class HtmlContentUtils(object):
         self.__debug = False
         self.__dApi = dictApiObj
         self.__pI = pathInfoObj
+        # Item attributes are extracted for all items on first use -
+        self.__relationshipGraph = DictionaryRelationshipGraph(self.__dApi, verbose=self.__verbose)
+        self.__itemRecords = DictionaryItemRecords(self.__dApi, relationshipGraphObj=self.__relationshipGraph, verbose=self.__verbose)
         self.__html = HtmlComponentMarkupUtils(verbose=self.__verbose)
-        self.__mU = HtmlMarkupUtils(verbose=self.__verbose)
+        # Item and category names are escaped repeatedly across index and group pages -
+        self.__mU = HtmlMarkupUtils(verbose=self.__verbose, escapeCacheSize=8192)
 
         self.__glyphPathKey = "/assets/images/glyphicons-dot-com/png/glyphicons_044_keys.png"
         self.__glyphPathBang = "/assets/images/glyphicons-dot-com/png/glyphicons_196_circle_exclamation_mark.png"
@@ -55,11 +82,147 @@ class HtmlContentUtils(object):
         self.__glyphPathRegex = "/assets/images/misc/regex-35.png"
         self.__glyphPathDiagram = "/assets/images/glyphicons-dot-com/png/glyphicons_138_picture.png"
         self.__glyphPathParent = "/assets/images/misc/parent-child-40.png"
+        #
+        self.__iconAnchorAndClassD = self.__makeIconAnchorAndClassTable()
 
         self.__itemCounts = {"archive": {}, "prd": {}, "cc": {}}
         self.__categoryCounts = {"archive": {}, "prd": {}, "cc": {}}
+        #
+        # Rendered fragments shared by several pages {(fragmentType, name): fragment, ...}
+        self.__fragmentCacheD = {}
+        #
+        self.__figureManifest = None
+        #
+        # Maximum number of enumeration table rows rendered in item pages (None for no limit) and
+        # the complete tables deferred to data files {dataName: tableObj, ...}
+        self.__enumRowLimit = None
+        self.__deferredTableD = {}
+        #
+        # Maximum compressed size (bytes) of the primary category figure embedded in category pages (None to link all figures)
+        self.__inlineFigureMaxBytes = None
+
+    def setEnumTableRowLimit(self, maxRows):
+        """Set the maximum number of enumeration rows rendered in item pages (None or 0 for no limit).
+
+        The complete enumeration tables for items exceeding this limit are collected for output as page
+        data files (see popDeferredTables()) and loaded by the item page on request.
+        """
+        self.__enumRowLimit = maxRows if maxRows and maxRows > 0 else None
+
+    def popDeferredTables(self):
+        """Return and clear the tables deferred from the item pages rendered since the last call.
+
+        Returns:
+            dict: {dataName: {"columns": [...], "rowCount": n, "rows": [[cell markup, ...], ...]}, ...} for
+                  output with HtmlGenerator.writeDataFile(dataName, "Items", tableObj)
+        """
+        tD = self.__deferredTableD
+        self.__deferredTableD = {}
+        return tD
+
+    def setFigureManifest(self, figureManifestObj):
+        """Set the manifest (FigureManifest) of the category figures available for this dictionary.
+
+        Without a manifest, figure files are located by probing the category image directory.
+        """
+        self.__figureManifest = figureManifestObj
+
+    def setInlineFigures(self, inlineFigures=True, maxBytes=65536):
+        """Embed the primary relationship figure of each category page in the page (gzip compressed and
+        base64 encoded, inflated in the browser when the figure is viewed) linking the other figure variants.
+
+        Figures with compressed size exceeding 'maxBytes' and figures with links relative to the figure
+        location (SvgMinifier relativeLinks) are linked.
+        """
+        self.__inlineFigureMaxBytes = maxBytes if inlineFigures else None
+
+    def getItemRecords(self):
+        """Return the item record (DictionaryItemRecords) instance used to render item pages."""
+        return self.__itemRecords
+
+    def getRelationshipGraph(self):
+        """Return the dictionary relationship graph (DictionaryRelationshipGraph) instance."""
+        return self.__relationshipGraph
+
+    def getPageFingerprint(self, contentObjName, contentType):
+        """Return a fingerprint (hex digest) of the content used to render the input category or item page
+        (contentType 'Categories' or 'Items') or None for other pages.
+
+        The fingerprint covers the definition, coverage values, linked object names and figures shown in
+        the page and the rendering options of this instance, but not the page templates (see PageManifest).
+        """
+        if contentType == "Categories":
+            inputL = self.__getCategoryPageInputs(contentObjName)
+        elif contentType == "Items":
+            inputL = self.__getItemPageInputs(contentObjName)
+        else:
+            return None
+        return hashlib.sha1(json.dumps(inputL, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+    def __getCoverageInputs(self, nameList, countD):
+        return [countD.get(name) for name in nameList] + [self.__itemCounts["archive"].get("_entry.id")]
+
+    def __getCategoryPageInputs(self, categoryName):
+        itemNameList = self.__getOrderedItemNameList(categoryName)
+        recordD = self.__itemRecords.getRecords()
+        itemInputL = [(itemName, recordD.get(itemName, {}).get("mandatoryCode"), recordD.get(itemName, {}).get("mandatoryCodeAlt")) for itemName in itemNameList]
+        figureInputL = []
+        for variant, url in sorted(self.__getCategoryFigureUrlD(categoryName).items()):
+            figureInputL.append((variant, url))
+            if self.__inlineFigureMaxBytes is not None:
+                fD = self.__figureManifest.getFigure(categoryName, variant) if self.__figureManifest is not None else None
+                fileName = fD["fileName"] if fD else FigureManifest.getFigureFileName(categoryName, variant)
+                try:
+                    st = os.stat(os.path.join(self.__pI.getDictCategoryImagePath(), fileName))
+                    figureInputL.append((st.st_size, st.st_mtime_ns))
+                except OSError:
+                    pass
+        return [
+            "Categories",
+            categoryName,
+            self.__dApi.getCategoryContextList(categoryName),
+            self.__dApi.getCategoryMandatoryCode(categoryName),
+            sorted(self.__dApi.getCategoryGroupList(categoryName)),
+            self.__dApi.getCategoryDescription(categoryName),
+            self.__dApi.getCategoryDescriptionAlt(categoryName, fallBack=False),
+            self.__dApi.getCategoryNxMappingDetails(categoryName),
+            self.__dApi.getCategoryExampleList(categoryName),
+            self.__dApi.getCategoryExampleListAlt(categoryName, fallBack=False),
+            sorted(self.__dApi.getCategoryKeyList(categoryName)),
+            itemInputL,
+            [self.__getCoverageInputs([categoryName], self.__categoryCounts[deliveryType]) for deliveryType in ["archive", "cc", "prd"]],
+            [self.__getCoverageInputs(itemNameList, self.__itemCounts[deliveryType]) for deliveryType in ["archive", "cc", "prd"]],
+            figureInputL,
+            self.__inlineFigureMaxBytes,
+        ]
+
+    def __getItemPageInputs(self, itemName):
+        rD = self.__itemRecords.get(itemName)
+        if rD and rD["dependentList"]:
+            # dependent items are listed in arbitrary order -
+            rD = dict(rD, dependentList=sorted(rD["dependentList"]))
+        return [
+            "Items",
+            itemName,
+            rD,
+            [self.__getCoverageInputs([itemName], self.__itemCounts[deliveryType]) for deliveryType in ["archive", "cc", "prd"]],
+            self.__enumRowLimit,
+        ]
+
+    def clearFragmentCache(self):
+        """Discard cached link list fragments.  Fragments depend on the dictionary and the item
+        coverage counts and are cleared automatically when the item counts are updated.
+        """
+        self.__fragmentCacheD = {}
+
+    def __getCachedFragment(self, fragmentType, name, renderMethod):
+        ky = (fragmentType, name)
+        if ky not in self.__fragmentCacheD:
+            self.__fragmentCacheD[ky] = renderMethod(name)
+        return self.__fragmentCacheD[ky]
 
     def setItemCounts(self, itemNameD, deliveryType="archive"):
+        self.clearFragmentCache()
         for itemName, itemCount in itemNameD.items():
             self.__itemCounts[deliveryType][itemName] = itemCount
             categoryName = CifName.categoryPart(itemName)
@@ -110,15 +273,36 @@ class HtmlContentUtils(object):
         else:
             return "0.0"
 
-    def __renderTable(self, rowList, columnNameList, newLines="verbatim", columnNameFormat="html", dataFormat="ascii", markupMath=False):
+    def __renderTable(self, rowList, columnNameList, newLines="verbatim", columnNameFormat="html", dataFormat="ascii", markupMath=False, maxRows=None, dataUrl=None):
+        """Render a table of the input rows.  If 'maxRows' is set, only the leading rows are rendered followed
+        by a link to the complete table rows in 'dataUrl'.
+        """
         html = HtmlComponentMarkupUtils(verbose=self.__verbose)
         html.clear()
         html.beginTable(columnNameList=columnNameList, fmt=columnNameFormat)
-        for row in rowList:
+        for row in rowList[:maxRows]:
             html.addTableRow(rowValueList=row, fmt=dataFormat, newLines=newLines, markupMath=markupMath)
 
         html.endTable()
-        return html.getHtmlList()
+        if maxRows is not None and len(rowList) > maxRows:
+            html.addDeferredTableRows(dataUrl, maxRows, len(rowList))
+        return html.getHtmlFragment()
+
+    def __deferTable(self, dataName, rowList, columnNameList, newLines="verbatim", dataFormat="ascii"):
+        """Record the complete rows of a table deferred to a data file and return the data file url."""
+        html = HtmlComponentMarkupUtils(verbose=self.__verbose)
+        self.__deferredTableD[dataName] = {
+            "columns": columnNameList,
+            "rowCount": len(rowList),
+            "rows": [html.getTableCellList(row, fmt=dataFormat, newLines=newLines) for row in rowList],
+        }
+        return self.__pI.getContentTypeDataUrl(dataName, contentType="Items")
+
+    def __getPageHtmlList(self):
+        """Flush any remaining streamed markup and return the page markup that was not streamed."""
+        self.__html.flush()
+        self.__html.setOutputStream(None)
+        return self.__html.getHtmlList()
 
     def makeDictionaryIndex(self, downloadPath, dictionaryName, title=None, description=None, authors=None, maintainers=None, order="reverse"):
         """Render the main dictionary index page -"""
@@ -253,11 +437,48 @@ class HtmlContentUtils(object):
             linkUrl = self.__pI.getContentTypeObjUrl(contentObjName=contentName, contentType=contentType)
             html.addLinkListItem(linkUrl, contentName, fmt="ascii", active=False)
         html.endLinkListGroup()
-        return html.getHtmlList()
+        return html.getHtmlFragment()
+
+    def __makeIconAnchorAndClassTable(self):
+        """Return a dictionary of icon anchor markup and CSS class for each supported content icon type.
+
+        Icon types are composed from a base type and the usage flags '+database', '+chem-dict' and '+bird-dict'
+        (in this order), as assigned in __assignItemIconType() and __assignCategoryIconType().
+        """
+        baseTypeList = [
+            "none",
+            "key",
+            "default",
+            "download",
+            "help",
+            "general",
+            "mandatory",
+            "info",
+            "deposit-info",
+            "deposit-mandatory",
+            "regex",
+            "parent-child",
+            "related-item",
+            "all-mandatory",
+        ]
+        flagList = ["+database", "+chem-dict", "+bird-dict"]
+        suffixList = ["".join(fL) for ii in range(len(flagList) + 1) for fL in itertools.combinations(flagList, ii)]
+        #
+        iconD = {"category-image": self.__buildIconAnchorAndClass("category-image")}
+        for baseType in baseTypeList:
+            for suffix in suffixList:
+                iconD[baseType + suffix] = self.__buildIconAnchorAndClass(baseType + suffix)
+        return iconD
 
     def __getIconAnchorAndClass(self, contentIconType, cssClass="pull-right"):
-        #
         _ = cssClass
+        try:
+            return self.__iconAnchorAndClassD[contentIconType]
+        except KeyError:
+            return self.__buildIconAnchorAndClass(contentIconType)
+
+    def __buildIconAnchorAndClass(self, contentIconType):
+        #
         if contentIconType in ["key", "key+database", "key+chem-dict", "key+bird-dict"]:
             iconText = self.__mU.getGlyphAnchor(tipText="Category key item", glyphPath=self.__glyphPathKey)
             addClass = "key-item"
@@ -337,12 +558,13 @@ class HtmlContentUtils(object):
             listValue = linkAnchor + iconText
             html.addListItem(listValue, fmt="html", active=False, cssClass=addClass)
         html.endListGroup()
-        return html.getHtmlList()
+        return html.getHtmlFragment()
 
     def makeCategoryGroupPage(self, groupName):
         """Render the category group page -"""
         self.__html.clear()
         self.__html.beginContainer()
+        self.__addOverviewFigure(groupName)
         #
         pId = 0
         descriptionS = self.__dApi.getCategoryGroupDescription(groupName)
@@ -351,8 +573,7 @@ class HtmlContentUtils(object):
             pId += 1
             pIdS = "p" + str(pId)
             openF = True
-            iconTypeList = self.__assignCategoryIconType(catNameList)
-            catHtmlList = self.__renderLinkGroupWithIcons(catNameList, iconTypeList, contentType="Categories")
+            catHtmlList = self.__getCachedFragment("group-categories", groupName, self.__renderGroupCategoryLinkList)
             self.__html.addAccordionPanel(
                 title=groupName,
                 subTitle=descriptionS,
@@ -366,8 +587,17 @@ class HtmlContentUtils(object):
         self.__html.endContainer()
         return self.__html.getHtmlList()
 
-    def makeCategoryGroupIndex(self, openFirst=True, leadingList=None):
-        """Render the category group index page - Each category group expand to a list of categories."""
+    def __renderGroupCategoryLinkList(self, groupName):
+        catNameList = self.__dApi.getCategoryGroupCategories(groupName)
+        iconTypeList = self.__assignCategoryIconType(catNameList)
+        return self.__renderLinkGroupWithIcons(catNameList, iconTypeList, contentType="Categories")
+
+    def makeCategoryGroupIndex(self, openFirst=True, leadingList=None, outputStream=None):
+        """Render the category group index page - Each category group expand to a list of categories.
+
+        If an 'outputStream' is provided, markup is written to the stream as each panel is completed
+        and the returned list is empty.
+        """
         gList = self.__dApi.getCategoryGroups()
         if leadingList is not None:
             groupNameList = []
@@ -381,7 +611,9 @@ class HtmlContentUtils(object):
             groupNameList = gList
         #
         self.__html.clear()
+        self.__html.setOutputStream(outputStream)
         self.__html.beginContainer()
+        self.__addOverviewFigure()
         #
         self.__html.beginAccordionPanelGroup(panelGroupId="pg1")
         pId = 0
@@ -398,8 +630,7 @@ class HtmlContentUtils(object):
                 else:
                     openF = False
 
-                iconTypeList = self.__assignCategoryIconType(catNameList)
-                catHtmlList = self.__renderLinkGroupWithIcons(catNameList, iconTypeList, contentType="Categories")
+                catHtmlList = self.__getCachedFragment("group-categories", groupName, self.__renderGroupCategoryLinkList)
                 self.__html.addAccordionPanel(
                     title=groupName,
                     subTitle=descriptionS,
@@ -410,23 +641,25 @@ class HtmlContentUtils(object):
                     toggleText="View/Hide category list",
                     topId=groupName,
                 )
+                self.__html.flush()
                 ii += 1
 
         self.__html.endAccordionPanelGroup()
         self.__html.endContainer()
         #
-        return self.__html.getHtmlList()
+        return self.__getPageHtmlList()
 
     def __assignItemIconType(self, itemNameList):
         iconTypeList = []
         #
         categoryName = CifName.categoryPart(itemNameList[0])
         keyItemNameList = self.__dApi.getCategoryKeyList(categoryName)
+        recordD = self.__itemRecords.getRecords()
         for itemName in itemNameList:
             tType = "none"
-            attributeName = CifName.attributePart(itemName)
-            aMan = self.__dApi.getMandatoryCode(categoryName, attributeName) in ["yes", "y"]
-            dMan = self.__dApi.getMandatoryCodeAlt(categoryName, attributeName, fallBack=False) in ["yes", "y"]
+            rD = recordD.get(itemName, {})
+            aMan = rD.get("mandatoryCode") in ["yes", "y"]
+            dMan = rD.get("mandatoryCodeAlt") in ["yes", "y"]
             inArchive = self.__getItemCount(itemName, deliveryType="archive") > 0
             inChemDict = self.__getItemCount(itemName, deliveryType="cc") > 0
             inBirdDict = self.__getItemCount(itemName, deliveryType="prd") > 0
@@ -486,28 +719,36 @@ class HtmlContentUtils(object):
         itemNameList.extend(tList)
         return itemNameList
 
+    def __getItemLinkList(self, categoryName):
+        """Return the (cached) item count and item link list fragment for the input category."""
+        return self.__getCachedFragment("category-items", categoryName, self.__renderItemLinkList)
+
     def __renderItemLinkList(self, categoryName):
-        htmlList = []
+        htmlList = ()
         itemNameList = self.__getOrderedItemNameList(categoryName)
         if len(itemNameList) > 0:
             iconTypeList = self.__assignItemIconType(itemNameList)
             htmlList = self.__renderLinkGroupWithIcons(itemNameList, iconTypeList, contentType="Items")
         return len(itemNameList), htmlList
 
-    def makeItemCategoryIndex(self, openFirst=True):
+    def makeItemCategoryIndex(self, openFirst=True, outputStream=None):
         """Render the item & category index page. For the item index the 'openFirst' argument can be used to open
         the first accordion component exposing the list of data items within the category.
+
+        If an 'outputStream' is provided, markup is written to the stream as each panel is completed
+        and the returned list is empty.
         """
         catNameList = self.__dApi.getCategoryList()
 
         #
         self.__html.clear()
+        self.__html.setOutputStream(outputStream)
         self.__html.beginContainer()
         #
         self.__html.beginAccordionPanelGroup(panelGroupId="pg1")
         pId = 0
         for ii, catName in enumerate(catNameList):
-            itemCount, htmlList = self.__renderItemLinkList(catName)
+            itemCount, htmlList = self.__getItemLinkList(catName)
             pId += 1
             pIdS = "p" + str(pId)
 
@@ -522,12 +763,13 @@ class HtmlContentUtils(object):
             self.__html.addAccordionPanel(
                 title=categoryTitle, subTitle=subTitle, panelTextList=htmlList, panelId=pIdS, panelGroupId="pg1", openFlag=openF, toggleText="Item list view/hide"
             )
+            self.__html.flush()
 
         self.__html.endAccordionPanelGroup()
         self.__html.endContainer()
         #
 
-        return self.__html.getHtmlList()
+        return self.__getPageHtmlList()
 
     def __makeItemCategoryIndex(self, categoryNameList, pgId="cita", openFirst=False):
         """Render a related list of categories with expandable item lists. For the item index the 'openFirst' argument can be used to open
@@ -543,7 +785,7 @@ class HtmlContentUtils(object):
         html.beginAccordionPanelGroup(panelGroupId=pgId)
 
         for ii, categoryName in enumerate(categoryNameList):
-            itemCount, htmlList = self.__renderItemLinkList(categoryName)
+            itemCount, htmlList = self.__getItemLinkList(categoryName)
             pIdS = idPrefix + str(ii + 1)
             categoryUrl = self.__pI.getContentTypeObjUrl(contentObjName=categoryName, contentType="Categories")
             categoryTitle = self.__mU.getAnchor(contentUrl=categoryUrl, contentLabel=categoryName, cssClassString="my-link-color", fmt="ascii")
@@ -558,28 +800,26 @@ class HtmlContentUtils(object):
         html.endAccordionPanelGroup()
         html.endContainer()
         #
-        return html.getHtmlList()
+        return html.getHtmlFragment()
 
-    def makeItemCategoryAlphaIndex(self, openFirst=False):
+    def makeItemCategoryAlphaIndex(self, openFirst=False, outputStream=None):
         """Embed the categories in another accordion group.
 
         Render the item & category index page. For the item index the 'openFirst' argument can be used to open
             the first accordion component exposing the list of data items within the category.
+
+        If an 'outputStream' is provided, markup is written to the stream as each panel is completed
+        and the returned list is empty.
         """
         idPrefix = "alIdA"
         pgId = idPrefix
         #
         # Organize categories by leading character ...
         #
-        catNameListFull = self.__dApi.getCategoryList()
-        cIdx = {}
-        for catName in catNameListFull:
-            aC = catName[0]
-            if aC not in cIdx:
-                cIdx[aC] = []
-            cIdx[aC].append(catName)
+        cIdx = self.__getAlphaCategoryIndex()
         #
         self.__html.clear()
+        self.__html.setOutputStream(outputStream)
         self.__html.beginContainer()
         self.__html.beginAccordionPanelGroup(panelGroupId=pgId)
         #
@@ -602,33 +842,113 @@ class HtmlContentUtils(object):
             subTitle = "Categories " + self.__mU.getBadge(len(abbrevNameList))
             title = self.__mU.getIndexTitle(cN.upper())
             self.__html.addAccordionPanel(title=title, subTitle=subTitle, panelTextList=htmlList, panelId=pIdS, panelGroupId=pgId, openFlag=openF, toggleText="Category list view/hide")
+            self.__html.flush()
 
         self.__html.endAccordionPanelGroup()
         self.__html.endContainer()
         #
 
+        return self.__getPageHtmlList()
+
+    def __getAlphaCategoryIndex(self):
+        """Return the dictionary categories organized by leading character {char: [categoryName, ...], ...}"""
+        cIdx = {}
+        for catName in self.__dApi.getCategoryList():
+            aC = catName[0]
+            if aC not in cIdx:
+                cIdx[aC] = []
+            cIdx[aC].append(catName)
+        return cIdx
+
+    def __makeLazyAlphaIndex(self, cIdx, fragmentPrefix, contentType, openFirst):
+        """Render the alphabetical index shell with a lazily loaded fragment placeholder in each panel."""
+        idPrefix = "alIdA"
+        pgId = idPrefix
+        self.__html.clear()
+        self.__html.setOutputStream(None)
+        self.__html.beginContainer()
+        self.__html.beginAccordionPanelGroup(panelGroupId=pgId)
+        for ii, cN in enumerate(sorted(cIdx.keys())):
+            pIdS = idPrefix + str(ii + 1)
+            fragmentUrl = self.__pI.getContentTypeFragmentUrl(fragmentPrefix + cN, contentType)
+            openF = openFirst and ii == 0
+            subTitle = "Categories " + self.__mU.getBadge(len(cIdx[cN]))
+            title = self.__mU.getIndexTitle(cN.upper())
+            self.__html.addAccordionPanel(
+                title=title,
+                subTitle=subTitle,
+                panelTextList=[self.__mU.getLazyFragment(fragmentUrl)],
+                panelId=pIdS,
+                panelGroupId=pgId,
+                openFlag=openF,
+                toggleText="Category list view/hide",
+            )
+        self.__html.endAccordionPanelGroup()
+        self.__html.endContainer()
+        self.__html.addLazyFragmentLoader()
         return self.__html.getHtmlList()
 
-    def makeCategoryAlphaIndex(self, openFirst=True):
+    def __getFragmentHtmlList(self, fragment):
+        html = HtmlComponentMarkupUtils(verbose=self.__verbose)
+        html.addContent(fragment)
+        return html.getHtmlList()
+
+    def makeItemCategoryAlphaIndexLazy(self, openFirst=False):
+        """Render the item & category alphabetical index as a light page shell with the category and item lists
+        for each leading character in separate fragments loaded when the corresponding panel is opened.
+
+        Fragments are rendered one at a time as the returned generator is consumed so that each may be
+        written out before the next is built.
+
+        Returns:
+            (list, generator): page markup list, generator of (fragmentName, fragment markup list) for fragments of content type 'Items'
+        """
+        cIdx = self.__getAlphaCategoryIndex()
+        return self.__makeLazyAlphaIndex(cIdx, "item-index-", "Items", openFirst), self.__genItemCategoryAlphaFragments(cIdx)
+
+    def __genItemCategoryAlphaFragments(self, cIdx):
+        idPrefix = "alIdA"
+        for ii, cN in enumerate(sorted(cIdx.keys())):
+            pgIdS = idPrefix + cN + str(ii + 1)
+            fragment = self.__makeItemCategoryIndex(categoryNameList=cIdx[cN], pgId=pgIdS, openFirst=False)
+            yield "item-index-" + cN, self.__getFragmentHtmlList(fragment)
+
+    def makeCategoryAlphaIndexLazy(self, openFirst=True):
+        """Render the category alphabetical index as a light page shell with the category list for each
+        leading character in separate fragments loaded when the corresponding panel is opened.
+
+        Fragments are rendered one at a time as the returned generator is consumed.
+
+        Returns:
+            (list, generator): page markup list, generator of (fragmentName, fragment markup list) for fragments of content type 'Categories'
+        """
+        cIdx = self.__getAlphaCategoryIndex()
+        return self.__makeLazyAlphaIndex(cIdx, "category-index-", "Categories", openFirst), self.__genCategoryAlphaFragments(cIdx)
+
+    def __genCategoryAlphaFragments(self, cIdx):
+        for cN in sorted(cIdx.keys()):
+            iconTypeList = self.__assignCategoryIconType(cIdx[cN])
+            fragment = self.__renderLinkGroupWithIcons(cIdx[cN], iconTypeList, contentType="Categories")
+            yield "category-index-" + cN, self.__getFragmentHtmlList(fragment)
+
+    def makeCategoryAlphaIndex(self, openFirst=True, outputStream=None):
         """Embed the categories in another accordion group.
 
         Render the item & category index page. For the item index the 'openFirst' argument can be used to open
             the first accordion component exposing the list of data items within the category.
+
+        If an 'outputStream' is provided, markup is written to the stream as each panel is completed
+        and the returned list is empty.
         """
         idPrefix = "alIdA"
         pgId = idPrefix
         #
         # Organize categories by leading character ...
         #
-        catNameListFull = self.__dApi.getCategoryList()
-        cIdx = {}
-        for catName in catNameListFull:
-            aC = catName[0]
-            if aC not in cIdx:
-                cIdx[aC] = []
-            cIdx[aC].append(catName)
+        cIdx = self.__getAlphaCategoryIndex()
         #
         self.__html.clear()
+        self.__html.setOutputStream(outputStream)
         self.__html.beginContainer()
         self.__html.beginAccordionPanelGroup(panelGroupId=pgId)
         #
@@ -650,12 +970,13 @@ class HtmlContentUtils(object):
             subTitle = "Categories " + self.__mU.getBadge(len(abbrevNameList))
             title = self.__mU.getIndexTitle(cN.upper())
             self.__html.addAccordionPanel(title=title, subTitle=subTitle, panelTextList=htmlList, panelId=pIdS, panelGroupId=pgId, openFlag=openF, toggleText="Category list view/hide")
+            self.__html.flush()
 
         self.__html.endAccordionPanelGroup()
         self.__html.endContainer()
         #
 
-        return self.__html.getHtmlList()
+        return self.__getPageHtmlList()
 
     def makeCategoryIndex(self):
         """Render the category index page -"""
@@ -698,7 +1019,7 @@ class HtmlContentUtils(object):
                 title=panelTitle + str(ii + 1), subTitle=None, panelTextList=[ht], panelId=pId, panelGroupId=pgIdI, openFlag=opF, toggleText="View/Hide " + panelTitle
             )
         html.endPanel()
-        return html.getHtmlList()
+        return html.getHtmlFragment()
 
     def __contentPanelListAlt(self, panelTitle, subPanelTitle, idPrefix, contentList):
         """Collapsable outer panel encapsulates examples in collapsable panels."""
@@ -718,7 +1039,7 @@ class HtmlContentUtils(object):
                 title=subPanelTitle + str(ii + 1), subTitle=None, panelTextList=[ht], panelId=pId, panelGroupId=pgIdI, openFlag=opF, toggleText="View/Hide " + subPanelTitle
             )
 
-        hL = html.getHtmlList()
+        hL = html.getHtmlFragment()
         html.clear()
 
         # Insert the individual examples into an enclosing collapsable panel --
@@ -730,7 +1051,7 @@ class HtmlContentUtils(object):
         html.beginAccordionPanelGroup(panelGroupId=pgIdI)
         html.addAccordionPanel(title=panelTitle, subTitle=subTitle, panelTextList=hL, panelId=pId, panelGroupId=pgIdI, openFlag=True, toggleText="View/hide " + panelTitle)
         html.endAccordionPanelGroup()
-        return html.getHtmlList()
+        return html.getHtmlFragment()
 
     def __renderExamples(self, exampleList, titleSingle, titleMulti, idSuffix="a"):
         exCount = len(exampleList)
@@ -745,37 +1066,56 @@ class HtmlContentUtils(object):
                 eTup = exampleList[0]
                 ht = self.__mU.getFormatted(eTup[0], wrapper="pre", fmt="none")
                 html.addAccordionPanel(title=titleSingle, subTitle=None, panelTextList=[ht], panelId=pId, panelGroupId=pgId, openFlag=True, toggleText="View/hide Example")
-        return html.getHtmlList()
+        return html.getHtmlFragment()
 
-    def __addCategoryFigures(self, categoryName):
-        #
-        imgDirUrl = self.__pI.getDictCategoryImageDirUrl()
-        imgDirPath = self.__pI.getDictCategoryImagePath()
-        imgCount = 0
+    def __getCategoryFigureUrlD(self, categoryName):
+        """Return a dictionary of URLs for the available figures of the input category {variant: url, ...}.
 
-        imgFilePath = os.path.join(imgDirPath, categoryName + "_neighbors.svg")
-        okFull = os.access(imgFilePath, os.F_OK)
-        if okFull:
-            imgCount += 1
-        imgFilePath = os.path.join(imgDirPath, categoryName + "_neighbors_archive.svg")
-        okAbbrev = os.access(imgFilePath, os.F_OK)
-        if okAbbrev:
-            imgCount += 1
-
-        imgFilePath = os.path.join(imgDirPath, categoryName + "_neighbors_cc.svg")
-        okCc = os.access(imgFilePath, os.F_OK)
-        if okCc:
-            imgCount += 1
-
-        imgFilePath = os.path.join(imgDirPath, categoryName + "_neighbors_prd.svg")
-        okPrd = os.access(imgFilePath, os.F_OK)
-        if okPrd:
-            imgCount += 1
+        Figure URLs from the manifest carry a content hash query parameter so that browsers pick up regenerated figures.
+        """
+        imgDirUrl = self.__pI.getDictCategoryImageDirUrl()
+        urlD = {}
+        if self.__figureManifest is not None:
+            for variant in ["full", "archive", "cc", "prd", "family"]:
+                fD = self.__figureManifest.getFigure(categoryName, variant)
+                if fD:
+                    urlD[variant] = os.path.join(imgDirUrl, fD["fileName"]) + "?v=" + fD["hash"][:12]
+        else:
+            imgDirPath = self.__pI.getDictCategoryImagePath()
+            for variant in ["full", "archive", "cc", "prd", "family"]:
+                fileName = FigureManifest.getFigureFileName(categoryName, variant)
+                if os.access(os.path.join(imgDirPath, fileName), os.F_OK):
+                    urlD[variant] = os.path.join(imgDirUrl, fileName)
+        return urlD
+
+    def __getInlineFigureData(self, categoryName, variant):
+        """Return the base64 encoded gzip compressed SVG figure for the input category and variant or None."""
+        fD = self.__figureManifest.getFigure(categoryName, variant) if self.__figureManifest is not None else None
+        fileName = fD["fileName"] if fD else FigureManifest.getFigureFileName(categoryName, variant)
+        try:
+            with open(os.path.join(self.__pI.getDictCategoryImagePath(), fileName), "r", encoding="utf-8") as ifh:
+                svgText = ifh.read()
+        except Exception as e:
+            logger.debug("No inline figure for %s %s with %s", categoryName, variant, str(e))
+            return None
+        # Links relative to the figure location are not valid in the page -
+        if re.search(r"href=\"(?![/#]|[a-z]+:)", svgText):
+            return None
+        iS = svgText.find("<svg")
+        data = gzip.compress(svgText[iS:].encode("utf-8"), mtime=0) if iS >= 0 else b""
+        if not data or len(data) > self.__inlineFigureMaxBytes:
+            return None
+        return base64.b64encode(data).decode("ascii")
 
-        imgFilePath = os.path.join(imgDirPath, categoryName + "_neighbors_family.svg")
-        okFamily = os.access(imgFilePath, os.F_OK)
-        if okFamily:
-            imgCount += 1
+    def __addCategoryFigures(self, categoryName):
+        #
+        urlD = self.__getCategoryFigureUrlD(categoryName)
+        okFull = "full" in urlD
+        okAbbrev = "archive" in urlD
+        okCc = "cc" in urlD
+        okPrd = "prd" in urlD
+        okFamily = "family" in urlD
+        imgCount = len(urlD)
 
         if not (okFull or okAbbrev or okCc or okPrd or okFamily):
             return
@@ -864,36 +1204,65 @@ class HtmlContentUtils(object):
         #
         # Now write the markup for the dialogs --
         #
+        inlineD = {}
+        if self.__inlineFigureMaxBytes:
+            variant = [vT for vT in ["full", "archive", "cc", "prd", "family"] if vT in urlD][0]
+            inlineD[variant] = self.__getInlineFigureData(categoryName, variant)
+        #
         if okFull:
-            imgFileUrl = os.path.join(imgDirUrl, categoryName + "_neighbors.svg")
+            imgFileUrl = urlD["full"]
             titleText = "Category Relationship Diagram for %s" % str(categoryName).upper()
             self.__html.addModalImageDialog(
-                modalId="image-modal-full-1", modalTitle=titleText, imagePath=imgFileUrl, imageText=titleText, cssModalSect="my-image-scrollable", cssModalClose="btn-default"
+                modalId="image-modal-full-1",
+                modalTitle=titleText,
+                imagePath=imgFileUrl,
+                imageText=titleText,
+                cssModalSect="my-image-scrollable",
+                cssModalClose="btn-default",
+                imageData=inlineD.get("full"),
             )
 
         if okAbbrev:
-            imgFileUrl = os.path.join(imgDirUrl, categoryName + "_neighbors_archive.svg")
+            imgFileUrl = urlD["archive"]
             titleText = "Abbreviated Category Relationship Diagram for %s" % str(categoryName).upper()
             self.__html.addModalImageDialog(
-                modalId="image-modal-abbrev-1", modalTitle=titleText, imagePath=imgFileUrl, imageText=titleText, cssModalSect="my-image-scrollable", cssModalClose="btn-default"
+                modalId="image-modal-abbrev-1",
+                modalTitle=titleText,
+                imagePath=imgFileUrl,
+                imageText=titleText,
+                cssModalSect="my-image-scrollable",
+                cssModalClose="btn-default",
+                imageData=inlineD.get("archive"),
             )
 
         if okCc:
-            imgFileUrl = os.path.join(imgDirUrl, categoryName + "_neighbors_cc.svg")
+            imgFileUrl = urlD["cc"]
             titleText = "Category Relationship Diagram for %s" % str(categoryName).upper()
             self.__html.addModalImageDialog(
-                modalId="image-modal-cc-1", modalTitle=titleText, imagePath=imgFileUrl, imageText=titleText, cssModalSect="my-image-scrollable", cssModalClose="btn-default"
+                modalId="image-modal-cc-1",
+                modalTitle=titleText,
+                imagePath=imgFileUrl,
+                imageText=titleText,
+                cssModalSect="my-image-scrollable",
+                cssModalClose="btn-default",
+                imageData=inlineD.get("cc"),
             )
 
         if okPrd:
-            imgFileUrl = os.path.join(imgDirUrl, categoryName + "_neighbors_prd.svg")
+            imgFileUrl = urlD["prd"]
             titleText = "Category Relationship Diagram for %s" % str(categoryName).upper()
             self.__html.addModalImageDialog(
-                modalId="image-modal-bird-1", modalTitle=titleText, imagePath=imgFileUrl, imageText=titleText, cssModalSect="my-image-scrollable", cssModalClose="btn-default"
+                modalId="image-modal-bird-1",
+                modalTitle=titleText,
+                imagePath=imgFileUrl,
+                imageText=titleText,
+                cssModalSect="my-image-scrollable",
+                cssModalClose="btn-default",
+                imageData=inlineD.get("prd"),
             )
 
         if okFamily:
-            imgFileUrl = os.path.join(imgDirUrl, categoryName + "_neighbors_family.svg")
+            imgFileUrl = urlD["family"]
             titleText = "Category Relationship Diagram for %s" % str(categoryName).upper()
             self.__html.addModalImageDialog(
                 modalId="image-modal-bird-family-1",
@@ -902,7 +1271,43 @@ class HtmlContentUtils(object):
                 imageText=titleText,
                 cssModalSect="my-image-scrollable",
                 cssModalClose="btn-default",
+                imageData=inlineD.get("family"),
             )
+        if any(inlineD.values()):
+            self.__html.addInlineFigureLoader()
+
+    def __addOverviewFigure(self, groupName=None):
+        """Add the category relationship overview figure of the input category group (or the dictionary) if it exists."""
+        fileName = OverviewFigures.getFigureFileName(groupName)
+        if not os.access(os.path.join(self.__pI.getDictOverviewImagePath(), fileName), os.F_OK):
+            return
+        imgFileUrl = os.path.join(self.__pI.getDictOverviewImageDirUrl(), fileName)
+        if groupName:
+            titleText = "Category Relationship Overview for Group %s" % groupName
+            descriptionText = "View the relationships between the categories in group <b>%s</b>" % groupName
+        else:
+            titleText = "Category Relationship Overview"
+            descriptionText = "View the relationships between all dictionary data categories <b>clustered by category group</b>"
+        iconText, addClass = self.__getIconAnchorAndClass(contentIconType="category-image", cssClass="pull-right")
+        self.__html.beginContainer(cType="row")
+        self.__html.beginPanel("Category Relationship Overview " + iconText, style="panel-default " + addClass, fmt="html")
+        self.__html.beginContainer(cType="row")
+        self.__html.beginContainer(cType="col-md-1 col-md-offset-1")
+        htText = self.__mU.getImage(src="/assets/images/cr-figure-icon.svg", altText="Category relationship overview", width=70, height=70, cssClassAdd="img-thumbnail")
+        bText = self.__mU.getButtonAnchor(
+            contentLabel=htText, url="#image-modal-overview-1", fmt="html", cssClassAdd="btn-wwpdb-green btn-wwpdb-lg", dataAttributes='data-toggle="modal"'
+        )
+        self.__html.addContent([bText])
+        self.__html.endContainer()
+        self.__html.beginContainer(cType="col-md-6")
+        self.__html.addContent([descriptionText])
+        self.__html.endContainer()
+        self.__html.endContainer()
+        self.__html.endPanel()
+        self.__html.endContainer()
+        self.__html.addModalImageDialog(
+            modalId="image-modal-overview-1", modalTitle=titleText, imagePath=imgFileUrl, imageText=titleText, cssModalSect="my-image-scrollable", cssModalClose="btn-default"
+        )
 
     def __renderCategoryPage(self, categoryName):
         """Render the information page for the input category."""
@@ -1045,7 +1450,7 @@ class HtmlContentUtils(object):
             self.__html.endContainer()
 
         #
-        _, htmlList = self.__renderItemLinkList(categoryName)
+        _, htmlList = self.__getItemLinkList(categoryName)
         self.__html.beginContainer(cType="row")
         self.__html.addAccordionPanel(
             title="Category Data Items", subTitle=None, panelTextList=htmlList, panelId="pit0", panelGroupId="pgit0", openFlag=True, toggleText="View/hide item list"
@@ -1096,10 +1501,14 @@ class HtmlContentUtils(object):
         idSuffix="a",
         openFlag=True,
         toggleText="View/Hide Table",
+        maxRows=None,
+        dataUrl=None,
     ):
         """"""
         _ = contentObjName
-        htmlList = self.__renderTable(rowList=rowList, columnNameList=columnNameList, columnNameFormat=columnNameFormat, dataFormat=dataFormat, newLines=newLines)
+        htmlList = self.__renderTable(
+            rowList=rowList, columnNameList=columnNameList, columnNameFormat=columnNameFormat, dataFormat=dataFormat, newLines=newLines, maxRows=maxRows, dataUrl=dataUrl
+        )
         #
         pgId = "pgapwt" + idSuffix
         pId = "papwt" + idSuffix
@@ -1122,15 +1531,19 @@ class HtmlContentUtils(object):
 
     def __renderItemPage(self, itemName):
         """Render the information page for the input item."""
-        categoryName = CifName.categoryPart(itemName)
-        attributeName = CifName.attributePart(itemName)
+        rD = self.__itemRecords.get(itemName)
+        if rD is None:
+            logger.warning("+ERROR item %s is not defined", itemName)
+            return []
+        categoryName = rD["categoryName"]
+        attributeName = rD["attributeName"]
         #
         self.__html.clear()
         self.__html.beginContainer()
         #
         #
-        mandatoryCode = self.__dApi.getMandatoryCode(categoryName, attributeName)
-        mandatoryCodeAlt = self.__dApi.getMandatoryCodeAlt(categoryName, attributeName, fallBack=False)
+        mandatoryCode = rD["mandatoryCode"]
+        mandatoryCodeAlt = rD["mandatoryCodeAlt"]
 
         # -- general info --
         self.__html.beginContainer()
@@ -1167,7 +1580,7 @@ class HtmlContentUtils(object):
         self.__html.endContainer()
 
         # -- description --
-        description = self.__dApi.getDescription(categoryName, attributeName)
+        description = rD["description"]
         iconText, addClass = self.__getIconAnchorAndClass(contentIconType="info", cssClass="pull-right")
         self.__html.beginContainer(cType="row")
         self.__html.beginPanel("Item Description " + iconText, style="panel-default " + addClass, fmt="html")
@@ -1178,7 +1591,7 @@ class HtmlContentUtils(object):
         self.__html.endContainer()
 
         #
-        altDescription = self.__dApi.getDescriptionAlt(categoryName, attributeName, fallBack=False)
+        altDescription = rD["descriptionAlt"]
         if self.__notNull(altDescription):
             iconText, addClass = self.__getIconAnchorAndClass(contentIconType="deposit-info", cssClass="pull-right")
             self.__html.beginContainer(cType="row")
@@ -1190,14 +1603,14 @@ class HtmlContentUtils(object):
 
         #
         # -- examples --
-        exampleList = self.__dApi.getExampleList(categoryName, attributeName)
+        exampleList = rD["exampleList"]
         htmlList = self.__renderExamples(exampleList, "Item Example", "Item Examples", idSuffix="a")
 
         self.__html.beginContainer(cType="row")
         self.__html.addContent(htmlList)
         self.__html.endContainer()
         #
-        altExampleList = self.__dApi.getExampleListAlt(categoryName, attributeName, fallBack=False)
+        altExampleList = rD["exampleListAlt"]
         htmlList = self.__renderExamples(altExampleList, "Additional Item Example for Depositors", "Additional Item Examples for Depositors", idSuffix="b")
 
         self.__html.beginContainer(cType="row")
@@ -1207,23 +1620,23 @@ class HtmlContentUtils(object):
         # --------------------------------------------------------------------------------------------
         #  Context -
         #
-        context = self.__dApi.getContextList(categoryName, attributeName)
+        context = rD["context"]
 
         #
         #  ---Data type -
         #
-        typeCode = self.__dApi.getTypeCode(categoryName, attributeName)
-        typePrimitive = self.__dApi.getTypePrimitive(categoryName, attributeName)
-        typeDetail = self.__dApi.getTypeDetail(categoryName, attributeName)
-        typeRegex = self.__dApi.getTypeRegex(categoryName, attributeName)
+        typeCode = rD["typeCode"]
+        typePrimitive = rD["typePrimitive"]
+        typeDetail = rD["typeDetail"]
+        typeRegex = rD["typeRegex"]
         #
-        typeCodeAlt = self.__dApi.getTypeCodeAlt(categoryName, attributeName, fallBack=False)
-        typeRegexAlt = self.__dApi.getTypeRegexAlt(categoryName, attributeName, fallBack=False)
+        typeCodeAlt = rD["typeCodeAlt"]
+        typeRegexAlt = rD["typeRegexAlt"]
         #
 
-        defaultValue = self.__dApi.getDefaultValue(categoryName, attributeName)
-        units = self.__dApi.getUnits(categoryName, attributeName)
-        enumClosedFlag = self.__dApi.getEnumerationClosedFlag(categoryName, attributeName)
+        defaultValue = rD["defaultValue"]
+        units = rD["units"]
+        enumClosedFlag = rD["enumClosedFlag"]
         # if enumClosedFlag is not None:
         #    logger.debug("+INFO - closed flag - category %s attribute %s  = %r\n " % (categoryName,attributeName,enumClosedFlag))
 
@@ -1268,11 +1681,17 @@ class HtmlContentUtils(object):
         self.__html.endContainer()
 
         #
-        # Only enum values with details
+        # Only enum values with details - long tables may be deferred to a data file
         #
-        enumListWithDetail = self.__dApi.getEnumListWithDetail(categoryName, attributeName)
+        deferredCount = 0
+        enumListWithDetail = rD["enumListWithDetail"]
         if enumListWithDetail is not None and len(enumListWithDetail) > 0:
             columnNameList = ["Allowed&nbsp;Value", "Details"]
+            maxRows = dataUrl = None
+            if self.__enumRowLimit and len(enumListWithDetail) > self.__enumRowLimit:
+                maxRows = self.__enumRowLimit
+                dataUrl = self.__deferTable(itemName + "_enum", enumListWithDetail, columnNameList, newLines="verbatim", dataFormat="ascii")
+                deferredCount += 1
             self.__addAccordionPanelWithTable(
                 rowList=enumListWithDetail,
                 columnNameList=columnNameList,
@@ -1284,11 +1703,18 @@ class HtmlContentUtils(object):
                 idSuffix="enum",
                 openFlag=True,
                 toggleText="View/Hide Table",
+                maxRows=maxRows,
+                dataUrl=dataUrl,
             )
 
-        enumListAltWithDetail = self.__dApi.getEnumListAltWithDetail(categoryName, attributeName)
+        enumListAltWithDetail = rD["enumListAltWithDetail"]
         if enumListAltWithDetail is not None and len(enumListAltWithDetail) > 0:
             columnNameList = ["Allowed&nbsp;Value", "Details"]
+            maxRows = dataUrl = None
+            if self.__enumRowLimit and len(enumListAltWithDetail) > self.__enumRowLimit:
+                maxRows = self.__enumRowLimit
+                dataUrl = self.__deferTable(itemName + "_enumalt", enumListAltWithDetail, columnNameList, newLines="verbatim", dataFormat="ascii")
+                deferredCount += 1
             self.__addAccordionPanelWithTable(
                 rowList=enumListAltWithDetail,
                 columnNameList=columnNameList,
@@ -1300,13 +1726,15 @@ class HtmlContentUtils(object):
                 idSuffix="enumalt",
                 openFlag=True,
                 toggleText="View/Hide Table",
+                maxRows=maxRows,
+                dataUrl=dataUrl,
             )
 
         #
         # Boundary values -
         #  (min, max)
         skipEquivalentBounds = True
-        bndList = self.__dApi.getBoundaryList(categoryName, attributeName)
+        bndList = rD["boundaryList"]
         boundaryList = []
         for bnd in bndList:
             bMin = bnd[0]
@@ -1331,7 +1759,7 @@ class HtmlContentUtils(object):
                 newLines="verbatim",
             )
         #
-        bndList = self.__dApi.getBoundaryListAlt(categoryName, attributeName, fallBack=False)
+        bndList = rD["boundaryListAlt"]
         boundaryListAlt = []
         for bnd in bndList:
             bMin = bnd[0]
@@ -1359,23 +1787,23 @@ class HtmlContentUtils(object):
         # --
         # Parent-child -
         #
-        parentList = self.__dApi.getFullParentList(categoryName, attributeName, stripSelfParent=True)
+        parentList = rD["parentList"]
         if parentList is not None and len(parentList) > 0:
             self.__addPanelWithInLineItemList(sorted(parentList), "Parent Data Items", contentObjName="parent-child")
             #
-            uP = self.__dApi.getUltimateParent(categoryName, attributeName)
+            uP = rD["ultimateParent"]
             if uP != parentList[0]:
                 self.__addPanelWithInLineItemList([uP], "Leading Parent Item", contentObjName="parent-child")
                 logger.debug("Ultimate parent of %s is %s", parentList[0], uP)
             if len(parentList) > 1:
                 logger.debug("Multiple parents for %s  %s %r", categoryName, attributeName, parentList)
 
-        childList = self.__dApi.getFullChildList(categoryName, attributeName)
+        childList = rD["childList"]
         if childList is not None and len(childList) > 0:
             self.__addPanelWithInLineItemList(sorted(childList), "Child Data Items", contentObjName="parent-child")
 
         #
-        relatedList = self.__dApi.getItemRelatedList(categoryName, attributeName)
+        relatedList = rD["relatedList"]
         if relatedList is not None and len(relatedList) > 0:
             rList = []
             for itemName, relationType in relatedList:
@@ -1394,16 +1822,12 @@ class HtmlContentUtils(object):
                 newLines="verbatim",
             )
         #
-        dependentList = self.__dApi.getItemDependentNameList(categoryName, attributeName)
+        dependentList = rD["dependentList"]
         if dependentList is not None and len(dependentList) > 0:
             self.__addPanelWithInLineItemList(dependentList, "Dependent Items", contentObjName="related-item")
 
-        subCategoryList = self.__dApi.getItemSubCategoryIdList(categoryName, attributeName)
-        if subCategoryList is not None and len(subCategoryList) > 0:
-            dList = []
-            for subCategory in subCategoryList:
-                dS = self.__dApi.getSubCategoryDescription(subCategory)
-                dList.append((subCategory, dS))
+        dList = rD["subCategoryList"]
+        if dList is not None and len(dList) > 0:
             # self.__addPanelWithDescriptionList(dList,'SubCategories',contentObjName='default')
             columnNameList = ["Subcategory&nbsp;Name", "Subcategory&nbsp;Description"]
             self.__addPanelWithTable(
@@ -1412,7 +1836,7 @@ class HtmlContentUtils(object):
         #
         # --  aliases
         #
-        aliasTupleList = self.__dApi.getItemAliasList(categoryName, attributeName)
+        aliasTupleList = rD["aliasList"]
         if aliasTupleList is not None and len(aliasTupleList) > 0:
             columnNameList = ["Alias&nbsp;Item&nbsp;Name", "Dictionary&nbsp;Name", "Dictionary&nbsp;Version"]
             self.__addPanelWithTable(
@@ -1422,6 +1846,8 @@ class HtmlContentUtils(object):
         # ----------------------------------------------------------------------------------------------
 
         self.__html.endContainer()
+        if deferredCount:
+            self.__html.addDeferredTableLoader()
         return self.__html.getHtmlList()
 
     def makeItemPage(self, itemName):
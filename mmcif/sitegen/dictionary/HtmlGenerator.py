@@ -7,6 +7,12 @@
 #  Updates:
 #   10-Mar-2018 jdw Py2-P3 and refactor for Python packaging --
 #   30-Dec-2020 jdw cleanup and Py39
+#   18-Oct-2026     add streaming page output (openHtmlFile/closeHtmlFile)
+#   18-Oct-2026     add writer for lazily loaded page fragments
+#   18-Oct-2026     add writer for compressed page data files
+#   19-Oct-2026     create the dictionary overview image directory
+#   19-Oct-2026     add htmlFile() context manager - discard partial streamed pages on failure
+#   19-Oct-2026     raise from htmlFile() when a streamed page cannot be completed
 ##
 """
 Classes to manage creation of files and directories representing PDBx/mmCIF
@@ -19,6 +25,9 @@ __email__ = "jwest@rcsb.rutgers.edu"
 __license__ = "Apache 2,0"
 
 
+import contextlib
+import gzip
+import json
 import logging
 import os
 import shutil
@@ -177,6 +186,10 @@ class HtmlGenerator(object):
                 os.makedirs(pth, 0o755)
 
             pth = self.__pI.getDictItemImagePath()
+            if not os.access(pth, os.F_OK):
+                os.makedirs(pth, 0o755)
+
+            pth = self.__pI.getDictOverviewImagePath()
             if not os.access(pth, os.F_OK):
                 os.makedirs(pth, 0o755)
             return True
@@ -191,6 +204,62 @@ class HtmlGenerator(object):
         Input HTML content list is inserted within the body of the page.
 
         """
+        ofh = self.openHtmlFile(contentObjName, title, subTitle, contentType, navBarContentType=navBarContentType)
+        if ofh is None:
+            return False
+        try:
+            ofh.write("%s" % "\n".join(htmlContentList))
+        except Exception as e:
+            logger.error("failed for %s", ofh.name)
+            logger.exception("Failing with %s", str(e))
+            self.discardHtmlFile(ofh)
+            return False
+        return self.closeHtmlFile(ofh)
+
+    def writeHtmlFragment(self, fragmentName, contentType, htmlContentList):
+        """Write a page fragment (markup without the page header and trailer) to be loaded on demand by a page."""
+        filePath = None
+        try:
+            filePath = self.__pI.getContentTypeFragmentPath(fragmentName, contentType)
+            pth, _ = os.path.split(filePath)
+            if not os.access(pth, os.W_OK):
+                os.makedirs(pth, 0o755)
+            with open(filePath, "w", encoding="utf-8") as ofh:
+                ofh.write("%s\n" % "\n".join(htmlContentList))
+            return True
+        except Exception as e:
+            logger.error("failed for %s", filePath)
+            logger.exception("Failing with %s", str(e))
+        return False
+
+    def writeDataFile(self, dataName, contentType, obj):
+        """Write page data loaded on demand by a page as gzip compressed JSON."""
+        filePath = None
+        try:
+            filePath = self.__pI.getContentTypeDataPath(dataName, contentType)
+            pth, _ = os.path.split(filePath)
+            if not os.access(pth, os.W_OK):
+                os.makedirs(pth, 0o755)
+            with open(filePath, "wb") as ofh:
+                with gzip.GzipFile(fileobj=ofh, mode="wb", mtime=0) as gfh:
+                    gfh.write(json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8"))
+            return True
+        except Exception as e:
+            logger.error("failed for %s", filePath)
+            logger.exception("Failing with %s", str(e))
+        return False
+
+    def openHtmlFile(self, contentObjName, title, subTitle, contentType, navBarContentType="default"):
+        """Open a standard page for streaming output and write the common header and navbar.
+
+        Page content is then written directly to the returned file handle (e.g. by a component
+        builder with this output stream) and the page is completed by closeHtmlFile() or abandoned
+        by discardHtmlFile().  See htmlFile() for a context manager wrapping this sequence.
+
+        Returns: open file handle or None on failure
+        """
+        filePath = None
+        ofh = None
         try:
             navBarContentSelector = contentType if navBarContentType == "default" else navBarContentType
             filePath = self.__pI.getContentTypeObjPath(contentObjName, contentType)
@@ -202,8 +271,20 @@ class HtmlGenerator(object):
             ofh.write("%s\n" % ht.getPageHeader(title=pageTitle))
             ofh.write("%s\n" % ht.getPageTitle(title, subTitle))
             ofh.write("%s\n" % ht.getTopNavbar("Browse:", navBarContentSelector, self.__pI))
-            ofh.write("%s" % "\n".join(htmlContentList))
+            return ofh
+        except Exception as e:
+            logger.error("failed for %s", filePath)
+            logger.exception("Failing with %s", str(e))
+            if ofh:
+                self.discardHtmlFile(ofh)
+        return None
 
+    def closeHtmlFile(self, ofh):
+        """Write the common page trailer and close a page opened by openHtmlFile()."""
+        filePath = None
+        try:
+            filePath = ofh.name
+            ht = HtmlTemplates()
             ofh.write("%s\n" % ht.getPageTrailer())
             ofh.close()
             st = os.stat(filePath)
@@ -214,6 +295,44 @@ class HtmlGenerator(object):
             logger.exception("Failing with %s", str(e))
         return False
 
+    def discardHtmlFile(self, ofh):
+        """Close and remove an incomplete page opened by openHtmlFile()."""
+        filePath = None
+        try:
+            filePath = ofh.name
+            ofh.close()
+            if os.path.exists(filePath):
+                os.remove(filePath)
+            return True
+        except Exception as e:
+            logger.error("failed for %s", filePath)
+            logger.exception("Failing with %s", str(e))
+        return False
+
+    @contextlib.contextmanager
+    def htmlFile(self, contentObjName, title, subTitle, contentType, navBarContentType="default"):
+        """Context manager for a streamed page (c.f. openHtmlFile()) yielding the open file handle or None on failure.
+
+        The page is completed on exit, or closed and removed if the enclosed block raises an exception
+        so that no truncated page is left in place.  A page that cannot be completed is also removed
+        and OSError is raised.
+
+        Example:
+            with hg.htmlFile("index", title="Category Index", subTitle=subTitle, contentType="Categories") as ofh:
+                if ofh:
+                    hcU.makeCategoryAlphaIndex(outputStream=ofh)
+        """
+        ofh = self.openHtmlFile(contentObjName, title, subTitle, contentType, navBarContentType=navBarContentType)
+        try:
+            yield ofh
+        except BaseException:
+            if ofh:
+                self.discardHtmlFile(ofh)
+            raise
+        if ofh and not self.closeHtmlFile(ofh):
+            self.discardHtmlFile(ofh)
+            raise OSError("Failing to complete page %s" % ofh.name)
+
 
 if __name__ == "__main__":
     pass
@@ -6,7 +6,9 @@
 #
 # Updates:
 #  28-Dec-2020 jdw - refactor and py39 update
-#
+#  18-Oct-2026     - add placeholders and loader for lazily loaded page fragments
+#  18-Oct-2026     - add loader for table rows deferred to compressed data files
+#  19-Oct-2026     - add modal dialogs with inline compressed figures and their loader
 ##
 """
 Utility methods for creating HTML markup.
@@ -18,7 +20,7 @@ __email__ = "jwest@rcsb.rutgers.edu"
 __license__ = "Apache 2,0"
 
 
-import copy
+import functools
 import logging
 import re
 from itertools import cycle
@@ -36,14 +38,26 @@ class HtmlMarkupUtils(object):
         ">": "&gt;",
         "<": "&lt;",
     }
+    _htmlEscapeTranslation = str.maketrans(_htmlEscapeTable)
+    _htmlEscapePattern = re.compile("[%s]" % re.escape("".join(_htmlEscapeTable)))
 
-    def __init__(self, verbose=False):
-        """"""
+    def __init__(self, verbose=False, escapeCacheSize=0):
+        """Optionally memoize escaped text in a bounded cache of escapeCacheSize entries (default: 0, no cache)."""
         self.__verbose = verbose
+        if escapeCacheSize and escapeCacheSize > 0:
+            self.__escape = functools.lru_cache(maxsize=escapeCacheSize)(self.__escapeText)
+        else:
+            self.__escape = self.__escapeText
+
+    def __escapeText(self, text):
+        # Most dictionary text contains no special characters - return it as is.
+        if HtmlMarkupUtils._htmlEscapePattern.search(text) is None:
+            return text
+        return text.translate(HtmlMarkupUtils._htmlEscapeTranslation)
 
     def htmlEscape(self, text):
         """Produce entities within text."""
-        return "".join(HtmlMarkupUtils._htmlEscapeTable.get(c, c) for c in text)
+        return self.__escape(text)
 
     def escapeText(self, inputText, fmt="ascii", markupMath=False):
         if inputText is None:
@@ -128,6 +142,10 @@ class HtmlMarkupUtils(object):
         else:
             return '<span class="badge">%s</span>' % badgeText
 
+    def getLazyFragment(self, fragmentUrl, loadingText="Loading ..."):
+        """Placeholder for page content loaded from 'fragmentUrl' when the enclosing accordion panel is opened."""
+        return '<div class="lazy-fragment" data-fragment-url="%s">%s</div>' % (fragmentUrl, loadingText)
+
     def getIndexTitle(self, title):
         # return '<h3> - &nbsp;%s &nbsp; - </h3>' % title
         return "-&nbsp;%s &nbsp;-" % title
@@ -137,21 +155,71 @@ class HtmlComponentMarkupUtils(object):
     """Utility methods for creating markup for HTML components such as tables, panels,
     accordions, list-groups, description lists, ...
 
+    Markup is accumulated as a list of strings and immutable fragments (tuples).  A fragment
+    returned by getHtmlFragment() may be embedded in another component by reference, so nested
+    components are composed without copying their content.  getHtmlList() flattens the result.
+
+    When an output stream is set, flush() writes the accumulated markup to the stream and
+    releases it.  The streamed text is identical to the newline joined content of getHtmlList().
     """
 
-    def __init__(self, verbose=False):
+    def __init__(self, verbose=False, outputStream=None):
         """"""
         self.__verbose = verbose
         self.__oL = []
         self.__mU = HtmlMarkupUtils(verbose=self.__verbose)
+        self.__ofh = None
+        self.__streamLineCount = 0
+        self.setOutputStream(outputStream)
 
     def getHtmlList(self):
-        """Return a copy of the state of the generated HTML."""
-        return copy.deepcopy(self.__oL)
+        """Return a copy of the state of the generated HTML as a flat list of markup strings."""
+        oL = []
+        self.__flatten(self.__oL, oL)
+        return oL
+
+    def getHtmlFragment(self):
+        """Return the state of the generated HTML as an immutable fragment."""
+        return tuple(self.__oL)
+
+    def __flatten(self, fragment, oL):
+        for obj in fragment:
+            if isinstance(obj, tuple):
+                self.__flatten(obj, oL)
+            else:
+                oL.append(obj)
+
+    def __addFragment(self, htmlList):
+        """Embed fragments by reference and extend with the content of lists."""
+        if isinstance(htmlList, tuple):
+            self.__oL.append(htmlList)
+        else:
+            self.__oL.extend(htmlList)
 
     def clear(self):
         self.__oL = []
 
+    def setOutputStream(self, outputStream):
+        """Set the writable stream (e.g. an open file) that receives flushed markup, or None to retain all markup."""
+        self.__ofh = outputStream
+        self.__streamLineCount = 0
+
+    def flush(self):
+        """Write accumulated markup to the output stream and release it.  No-op without an output stream.
+
+        Returns: number of markup lines written
+        """
+        if self.__ofh is None:
+            return 0
+        oL = self.getHtmlList()
+        if oL:
+            if self.__streamLineCount > 0:
+                self.__ofh.write("\n")
+            self.__ofh.write("\n".join(oL))
+            self.__streamLineCount += len(oL)
+        self.__oL = []
+        return len(oL)
+
     def beginContainer(self, cType="row"):
         self.__oL.append('<div class="%s">' % cType)
 
@@ -159,7 +227,7 @@ class HtmlComponentMarkupUtils(object):
         self.__oL.append("</div>")
 
     def addContent(self, htmlList):
-        self.__oL.extend(htmlList)
+        self.__addFragment(htmlList)
 
     def beginPanel(self, title, style="panel-default", fmt="ascii"):
         self.__oL.append('<div class="panel %s">' % style)
@@ -188,19 +256,34 @@ class HtmlComponentMarkupUtils(object):
         self.__oL.append("</thead>")
         self.__oL.append("<tbody>")
 
-    def addTableRow(self, rowValueList, fmt="ascii", newLines="verbatim", markupMath=False):
-        self.__oL.append("<tr>")
+    def getTableCellList(self, rowValueList, fmt="ascii", newLines="verbatim", markupMath=False):
+        """Return the markup for each cell in the input table row."""
+        oL = []
         for rowValue in rowValueList:
             val = self.__mU.escapeText(rowValue, fmt=fmt, markupMath=markupMath)
 
             if newLines == "verbatim":
                 tV = val.replace("\n", "<br />")
-                self.__oL.append('<td class="my-monospace">%s</td>' % tV)
+                oL.append('<td class="my-monospace">%s</td>' % tV)
             else:
-                self.__oL.append("<td>%s</td>" % val)
+                oL.append("<td>%s</td>" % val)
+        return oL
 
+    def addTableRow(self, rowValueList, fmt="ascii", newLines="verbatim", markupMath=False):
+        self.__oL.append("<tr>")
+        self.__oL.extend(self.getTableCellList(rowValueList, fmt=fmt, newLines=newLines, markupMath=markupMath))
         self.__oL.append("</tr>")
 
+    def addDeferredTableRows(self, dataUrl, rowCount, totalRowCount):
+        """Link to the complete rows of the preceding table which are loaded from 'dataUrl' on request
+        (see addDeferredTableLoader()).
+        """
+        self.__oL.append('<div class="deferred-table" data-table-url="%s">' % dataUrl)
+        self.__oL.append(
+            '<p>Showing the first %d of %d values. <button type="button" class="btn btn-default btn-xs">Show all values</button></p>' % (rowCount, totalRowCount)
+        )
+        self.__oL.append("</div>")
+
     def endTable(self):
         self.__oL.append("</tbody>")
         self.__oL.append("</table>")
@@ -280,7 +363,7 @@ class HtmlComponentMarkupUtils(object):
         self.__oL.append('      <div class="panel-body">')
         self.__oL.append("<!-- BEGIN inserted markup -->")
         if panelTextList:
-            self.__oL.extend(panelTextList)
+            self.__addFragment(panelTextList)
         self.__oL.append("<!-- END inserted markup -->")
         self.__oL.append("      </div> <!-- end panel body-->")
         self.__oL.append("    </div> <!-- end panel-collapse -->")
@@ -323,8 +406,11 @@ class HtmlComponentMarkupUtils(object):
     def endInLineList(self):
         self.__oL.append("</ul>")
 
-    def addModalImageDialog(self, modalId=None, modalTitle="", imagePath="", imageText="", cssModalSect="my-image-scrollable", cssModalClose="btn-wwpdb-green"):
+    def addModalImageDialog(self, modalId=None, modalTitle="", imagePath="", imageText="", cssModalSect="my-image-scrollable", cssModalClose="btn-wwpdb-green", imageData=None):
         """
+         With 'imageData' (base64 encoded gzip compressed SVG) the figure is embedded in the page and inflated
+         when the dialog is first shown (see addInlineFigureLoader()) with 'imagePath' as the fallback.
+
          Template markup --
          <!-- Button trigger modal -->
          <a data-toggle="modal" href="#myModal" class="btn btn-primary btn-lg">Launch demo modal</a>
@@ -364,7 +450,10 @@ class HtmlComponentMarkupUtils(object):
         # self.__oL.append('                       <object type="image/svg+xml" data="%s" border="1"></object>' % imagePath)
         # self.__oL.append('                       <iframe class="my-image-iframe" width="100%s" height="700" src="%s"></iframe>'  % ('%',imagePath))
         # self.__oL.append('                       <iframe class="my-iframe-handle" src="%s"></iframe>' % (imagePath))
-        self.__oL.append('                       <img class="my-iframe-handle" src="%s">' % (imagePath))
+        if imageData:
+            self.__oL.append('                       <div class="inline-figure" data-figure-gz="%s" data-figure-url="%s">Loading ...</div>' % (imageData, imagePath))
+        else:
+            self.__oL.append('                       <img class="my-iframe-handle" src="%s">' % (imagePath))
         self.__oL.append("                  </div>")
         self.__oL.append("            </div>")
         self.__oL.append('            <div class="modal-footer">')
@@ -374,6 +463,113 @@ class HtmlComponentMarkupUtils(object):
         self.__oL.append("   </div><!-- /.modal-dialog -->")
         self.__oL.append("</div><!-- /.modal -->")
 
+    def addLazyFragmentLoader(self):
+        """Script to load the lazy fragment placeholders (HtmlMarkupUtils.getLazyFragment()) within accordion
+        panels as each panel is opened.  Panels open on page load are filled immediately.
+
+        jQuery and the Bootstrap plugins are loaded at the end of the page so the handlers are
+        installed once the document has been parsed.
+        """
+        self.__oL.append("<script>")
+        self.__oL.append('document.addEventListener("DOMContentLoaded", function () {')
+        self.__oL.append("    function loadFragments(panel) {")
+        self.__oL.append('        $(panel).children(".panel-body").children(".lazy-fragment[data-fragment-url]").each(function () {')
+        self.__oL.append("            var el = $(this);")
+        self.__oL.append('            var url = el.attr("data-fragment-url");')
+        self.__oL.append('            el.removeAttr("data-fragment-url");')
+        self.__oL.append("            el.load(url, function (response, status) {")
+        self.__oL.append('                if (status === "error") {')
+        self.__oL.append('                    el.attr("data-fragment-url", url);')
+        self.__oL.append('                    el.text("This content could not be loaded.");')
+        self.__oL.append("                } else if ($.fn.tooltip) {")
+        self.__oL.append("                    el.find('[data-toggle=\"tooltip\"]').tooltip();")
+        self.__oL.append("                }")
+        self.__oL.append("            });")
+        self.__oL.append("        });")
+        self.__oL.append("    }")
+        self.__oL.append('    $(document).on("show.bs.collapse", ".panel-collapse", function (e) {')
+        self.__oL.append("        if (e.target === this) {")
+        self.__oL.append("            loadFragments(this);")
+        self.__oL.append("        }")
+        self.__oL.append("    });")
+        self.__oL.append('    $(".panel-collapse.in").each(function () {')
+        self.__oL.append("        loadFragments(this);")
+        self.__oL.append("    });")
+        self.__oL.append("});")
+        self.__oL.append("</script>")
+
+    def addDeferredTableLoader(self):
+        """Script to replace the rows of a table preceding a deferred table link (addDeferredTableRows()) with the
+        complete rows from its data file when requested.
+
+        The data file is gzip compressed JSON {"rows": [[cell markup, ...], ...], ...}.  The content is inflated
+        in the browser unless the server has already done so by declaring the gzip content encoding.
+        """
+        self.__oL.append("<script>")
+        self.__oL.append('document.addEventListener("DOMContentLoaded", function () {')
+        self.__oL.append("    function inflate(buffer) {")
+        self.__oL.append("        var bytes = new Uint8Array(buffer);")
+        self.__oL.append("        if (bytes.length > 1 && bytes[0] === 0x1f && bytes[1] === 0x8b) {")
+        self.__oL.append('            return new Response(new Blob([bytes]).stream().pipeThrough(new DecompressionStream("gzip"))).text();')
+        self.__oL.append("        }")
+        self.__oL.append("        return Promise.resolve(new TextDecoder().decode(bytes));")
+        self.__oL.append("    }")
+        self.__oL.append('    document.querySelectorAll(".deferred-table[data-table-url]").forEach(function (el) {')
+        self.__oL.append('        var button = el.querySelector("button");')
+        self.__oL.append('        button.addEventListener("click", function () {')
+        self.__oL.append("            button.disabled = true;")
+        self.__oL.append('            fetch(el.getAttribute("data-table-url")).then(function (r) {')
+        self.__oL.append("                if (!r.ok) {")
+        self.__oL.append('                    throw new Error("status " + r.status);')
+        self.__oL.append("                }")
+        self.__oL.append("                return r.arrayBuffer();")
+        self.__oL.append("            }).then(inflate).then(function (text) {")
+        self.__oL.append('                var tbody = el.previousElementSibling.querySelector("tbody");')
+        self.__oL.append("                tbody.innerHTML = JSON.parse(text).rows.map(function (row) {")
+        self.__oL.append('                    return "<tr>" + row.join("") + "</tr>";')
+        self.__oL.append('                }).join("");')
+        self.__oL.append("                el.parentNode.removeChild(el);")
+        self.__oL.append("            }).catch(function () {")
+        self.__oL.append("                button.disabled = false;")
+        self.__oL.append('                button.textContent = "Retry - the complete table could not be loaded";')
+        self.__oL.append("            });")
+        self.__oL.append("        });")
+        self.__oL.append("    });")
+        self.__oL.append("});")
+        self.__oL.append("</script>")
+
+    def addInlineFigureLoader(self):
+        """Script to inflate the inline figures of modal dialogs (addModalImageDialog(imageData=...)) as each
+        dialog is shown.  Browsers without DecompressionStream load the figure file instead.
+        """
+        self.__oL.append("<script>")
+        self.__oL.append('document.addEventListener("DOMContentLoaded", function () {')
+        self.__oL.append("    function showFigure(el) {")
+        self.__oL.append('        var data = el.getAttribute("data-figure-gz");')
+        self.__oL.append('        el.removeAttribute("data-figure-gz");')
+        self.__oL.append("        function loadFile() {")
+        self.__oL.append('            var img = document.createElement("img");')
+        self.__oL.append('            img.className = "my-iframe-handle";')
+        self.__oL.append('            img.src = el.getAttribute("data-figure-url");')
+        self.__oL.append("            el.replaceChildren(img);")
+        self.__oL.append("        }")
+        self.__oL.append('        if (typeof DecompressionStream === "undefined") {')
+        self.__oL.append("            loadFile();")
+        self.__oL.append("            return;")
+        self.__oL.append("        }")
+        self.__oL.append("        var bytes = Uint8Array.from(atob(data), function (c) {")
+        self.__oL.append("            return c.charCodeAt(0);")
+        self.__oL.append("        });")
+        self.__oL.append('        new Response(new Blob([bytes]).stream().pipeThrough(new DecompressionStream("gzip"))).text().then(function (svgText) {')
+        self.__oL.append("            el.innerHTML = svgText;")
+        self.__oL.append("        }).catch(loadFile);")
+        self.__oL.append("    }")
+        self.__oL.append('    $(document).on("show.bs.modal", ".modal", function () {')
+        self.__oL.append('        this.querySelectorAll(".inline-figure[data-figure-gz]").forEach(showFigure);')
+        self.__oL.append("    });")
+        self.__oL.append("});")
+        self.__oL.append("</script>")
+
 
 if __name__ == "__main__":
     pass
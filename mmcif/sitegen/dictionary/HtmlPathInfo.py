@@ -8,6 +8,12 @@
 #
 #  30-Sep-2013  jdw add paths for directories containing images -
 #  28-Dec-2020  jdw cleanup and py39
+#  18-Oct-2026      add path for the category figure manifest
+#  18-Oct-2026      add paths for lazily loaded page fragments
+#  18-Oct-2026      add path for the dictionary search index
+#  18-Oct-2026      add paths for compressed page data files
+#  19-Oct-2026      add paths for the dictionary overview figures
+#  19-Oct-2026      add path for the page manifest
 ##
 """
 Classes to manage physical organization and path information for the HTML rendering of dictionaries.
@@ -96,6 +102,18 @@ class HtmlPathInfo(object):
     def getContentTypeObjPath(self, contentObjName, contentType):
         return os.path.join(self.__topPath, self.__dictDirectoryName, contentType, self.__escapeFileName(contentObjName) + ".html")
 
+    def getContentTypeFragmentUrl(self, fragmentName, contentType):
+        return os.path.join("/", self.__htmlTopDir, self.__dictDirectoryName, contentType, "fragments", self.__escapeFileName(fragmentName) + ".html")
+
+    def getContentTypeFragmentPath(self, fragmentName, contentType):
+        return os.path.join(self.__topPath, self.__dictDirectoryName, contentType, "fragments", self.__escapeFileName(fragmentName) + ".html")
+
+    def getContentTypeDataUrl(self, dataName, contentType):
+        return os.path.join("/", self.__htmlTopDir, self.__dictDirectoryName, contentType, "data", self.__escapeFileName(dataName) + ".json.gz")
+
+    def getContentTypeDataPath(self, dataName, contentType):
+        return os.path.join(self.__topPath, self.__dictDirectoryName, contentType, "data", self.__escapeFileName(dataName) + ".json.gz")
+
     def getContentTypePath(self, contentType):
         return os.path.join(self.__topPath, self.__dictDirectoryName, contentType)
 
@@ -108,6 +126,24 @@ class HtmlPathInfo(object):
     def getDictCategoryImageDirUrl(self):
         return os.path.join("/", self.__htmlTopDir, self.__dictDirectoryName, "Images", "Categories")
 
+    def getDictCategoryImageManifestPath(self):
+        return os.path.join(self.__topPath, self.__dictDirectoryName, "Images", "Categories", "figure-manifest.json")
+
+    def getDictPageManifestPath(self):
+        return os.path.join(self.__topPath, self.__dictDirectoryName, "page-manifest.json")
+
+    def getDictOverviewImagePath(self):
+        return os.path.join(self.__topPath, self.__dictDirectoryName, "Images", "Overview")
+
+    def getDictOverviewImageDirUrl(self):
+        return os.path.join("/", self.__htmlTopDir, self.__dictDirectoryName, "Images", "Overview")
+
+    def getDictSearchPath(self):
+        return os.path.join(self.__topPath, self.__dictDirectoryName, "Search")
+
+    def getDictSearchUrl(self):
+        return os.path.join("/", self.__htmlTopDir, self.__dictDirectoryName, "Search")
+
     def getDictItemImagePath(self):
         return os.path.join(self.__topPath, self.__dictDirectoryName, "Images", "Items")
 
@@ -0,0 +1,348 @@
+##
+# File:    NeighborFigureRenderer.py
+# Date:    18-Oct-2026
+# Version: 0.001
+#
+# Updates:
+##
+"""
+Built-in layout and SVG rendering of category neighbor diagrams.
+
+"""
+__docformat__ = "restructuredtext en"
+__author__ = "John Westbrook"
+__email__ = "jwest@rcsb.rutgers.edu"
+__license__ = "Apache 2,0"
+
+import logging
+import re
+from xml.sax.saxutils import escape, quoteattr
+
+from mmcif.api.PdbxContainers import CifName
+
+logger = logging.getLogger(__name__)
+
+# Cell background colors for category highlights and key items in neighbor diagrams
+categoryColorD = {
+    "op1": "#7fc97f",
+    "other": "#beaed4",
+    "op2": "#fdc086",
+    "key": "#ffff99",
+    "op4": "#386cb0",
+    "current": "#f0027f",
+    "adjacent": "#99c49b",
+}
+
+# Helvetica character widths (1/1000 em) for the printable ASCII characters (32-126)
+# fmt: off
+_helveticaWidthL = [
+    278, 278, 355, 556, 556, 889, 667, 191, 333, 333, 389, 584, 278, 333, 278, 278,
+    556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 278, 278, 584, 584, 584, 556,
+    1015, 667, 667, 722, 722, 667, 611, 778, 722, 278, 500, 667, 556, 833, 722, 778,
+    667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 278, 278, 278, 469, 556,
+    333, 556, 556, 500, 556, 556, 278, 556, 556, 222, 222, 500, 222, 833, 556, 556,
+    556, 556, 333, 500, 278, 556, 500, 722, 500, 500, 500, 334, 260, 334, 584,
+]
+# fmt: on
+
+
+class NeighborFigureRenderer(object):
+    """Layered layout and SVG output for the category neighbor diagrams described by NeighborFigures.getNeighborhoodView().
+
+    Categories are drawn as tables of item rows, as in the GraphViz 'dot' depiction, and are placed in ranks with
+    child categories above their parent categories.  Relationship edges run from the west side of the child item
+    row to the west side of the parent item row (or between the east sides of rows in the same category).  Text
+    extents are estimated from Helvetica font metrics.
+    """
+
+    def __init__(self, fontFace="helvetica", fontSizeCategory="10", fontSizeAttribute="9", titleFontFace="helvetica", titleFontSize="18", subTitleFontSize="14"):
+        self.__fontFamily = "Helvetica,sans-Serif" if fontFace.lower() == "helvetica" else fontFace
+        self.__titleFontFamily = "Helvetica,sans-Serif" if titleFontFace.lower() == "helvetica" else titleFontFace
+        self.__fontSizeCategory = float(fontSizeCategory)
+        self.__fontSizeAttribute = float(fontSizeAttribute)
+        self.__titleFontSize = float(titleFontSize)
+        self.__subTitleFontSize = float(subTitleFontSize)
+        #
+        self.__cellPadding = 4.0
+        self.__rowHeight = round(max(self.__fontSizeCategory, self.__fontSizeAttribute) * 1.2 + 2.0 * self.__cellPadding + 0.5, 1)
+        self.__nodeSep = 36.0
+        self.__rankSep = 54.0
+        self.__arrowLength = 10.0
+        self.__arrowHalfWidth = 3.5
+        self.__margin = 4.0
+
+    def __textWidth(self, text, fontSize, bold=False):
+        width = sum([_helveticaWidthL[ord(ch) - 32] if 32 <= ord(ch) < 127 else 556 for ch in text]) * fontSize / 1000.0
+        # bold face widths are estimated from the regular face -
+        return width * 1.06 if bold else width
+
+    def __fmt(self, val):
+        return ("%.2f" % val).rstrip("0").rstrip(".")
+
+    def __getNodeGeometry(self, node):
+        """Return the width, height and row index {itemName: row} of the table depicting the input node."""
+        widthList = [self.__textWidth(node["categoryName"].upper(), self.__fontSizeCategory)]
+        widthList.extend([self.__textWidth(row["attributeName"], self.__fontSizeAttribute) for row in node["rowList"]])
+        if node["truncated"]:
+            widthList.append(self.__textWidth("... and others ...", self.__fontSizeAttribute))
+        width = max(widthList) + 2.0 * (self.__cellPadding + 1.0)
+        numRows = 1 + len(node["rowList"]) + (1 if node["truncated"] else 0)
+        rowD = {row["itemName"]: ii + 1 for ii, row in enumerate(node["rowList"])}
+        return width, numRows * self.__rowHeight, rowD
+
+    def __assignRanks(self, categoryNameList, edgeSet):
+        """Return {categoryName: rank} placing children above parents (longest path layering after reversing back edges)."""
+        succD = {categoryName: [] for categoryName in categoryNameList}
+        for child, parent in sorted(edgeSet):
+            succD[child].append(parent)
+        # Depth first search in depiction order to drop edges closing a cycle -
+        stateD = {}
+        dagEdgeList = []
+        orderList = []
+        for start in categoryNameList:
+            if start in stateD:
+                continue
+            stack = [(start, iter(succD[start]))]
+            stateD[start] = 1
+            while stack:
+                categoryName, it = stack[-1]
+                nxt = next(it, None)
+                if nxt is None:
+                    stateD[categoryName] = 2
+                    orderList.append(categoryName)
+                    stack.pop()
+                elif nxt not in stateD:
+                    dagEdgeList.append((categoryName, nxt))
+                    stateD[nxt] = 1
+                    stack.append((nxt, iter(succD[nxt])))
+                elif stateD[nxt] == 2:
+                    dagEdgeList.append((categoryName, nxt))
+        #
+        predD = {categoryName: [] for categoryName in categoryNameList}
+        for child, parent in dagEdgeList:
+            predD[parent].append(child)
+        rankD = {}
+        for categoryName in reversed(orderList):
+            rankD[categoryName] = max([rankD[child] + 1 for child in predD[categoryName]], default=0)
+        return rankD
+
+    def __orderRanks(self, rankD, categoryNameList, edgeSet, numSweeps=4):
+        """Return the list of ranks [[categoryName, ...], ...] ordered to reduce edge crossings (barycenter heuristic)."""
+        rankList = [[] for _ in range(max(rankD.values()) + 1)] if rankD else []
+        for categoryName in categoryNameList:
+            rankList[rankD[categoryName]].append(categoryName)
+        adjD = {categoryName: [] for categoryName in categoryNameList}
+        for child, parent in edgeSet:
+            adjD[child].append(parent)
+            adjD[parent].append(child)
+        for sweep in range(numSweeps):
+            posD = {}
+            for rL in rankList:
+                for ii, categoryName in enumerate(rL):
+                    posD[categoryName] = (ii + 0.5) / len(rL)
+            rankIndexList = range(len(rankList)) if sweep % 2 == 0 else range(len(rankList) - 1, -1, -1)
+            for ir in rankIndexList:
+                rL = rankList[ir]
+                keyD = {}
+                for categoryName in rL:
+                    nL = [posD[nName] for nName in adjD[categoryName] if rankD[nName] != ir]
+                    keyD[categoryName] = sum(nL) / len(nL) if nL else posD[categoryName]
+                rL.sort(key=lambda categoryName, keyD=keyD: keyD[categoryName])
+                for ii, categoryName in enumerate(rL):
+                    posD[categoryName] = (ii + 0.5) / len(rL)
+        return rankList
+
+    def layout(self, view):
+        """Return the layout of the input view (see NeighborFigures.getNeighborhoodView()).
+
+        Returns:
+            dict: {"width": ..., "height": ..., "nodeD": {categoryName: {"x", "y", "width", "height", "rowD"}},
+                   "edgeList": [{"childItemName", "parentItemName", "pointList": [(x, y) x 4], "arrowList": [(x, y) x 3]}, ...]}
+                   with coordinates in points from the top left corner of the diagram.
+        """
+        nodeD = {}
+        categoryNameList = []
+        for node in view["nodeList"]:
+            width, height, rowD = self.__getNodeGeometry(node)
+            nodeD[node["categoryName"]] = {"x": 0.0, "y": 0.0, "width": width, "height": height, "rowD": rowD}
+            categoryNameList.append(node["categoryName"])
+        #
+        edgeSet = set()
+        for childItemName, parentItemName in view["edgeList"]:
+            catChild = CifName.categoryPart(childItemName)
+            catParent = CifName.categoryPart(parentItemName)
+            if catChild != catParent and catChild in nodeD and catParent in nodeD:
+                edgeSet.add((catChild, catParent))
+        rankD = self.__assignRanks(categoryNameList, edgeSet)
+        rankList = self.__orderRanks(rankD, categoryNameList, edgeSet)
+        #
+        # Pack the ranks from left to right, center each rank and stack the ranks from the top -
+        rankWidthList = [sum([nodeD[categoryName]["width"] for categoryName in rL]) + self.__nodeSep * (len(rL) - 1) for rL in rankList]
+        maxWidth = max(rankWidthList, default=0.0)
+        y = 0.0
+        for rL, rankWidth in zip(rankList, rankWidthList):
+            x = (maxWidth - rankWidth) / 2.0
+            for categoryName in rL:
+                nodeD[categoryName]["x"] = x
+                nodeD[categoryName]["y"] = y
+                x += nodeD[categoryName]["width"] + self.__nodeSep
+            y += max([nodeD[categoryName]["height"] for categoryName in rL]) + self.__rankSep
+        #
+        edgeList = []
+        for childItemName, parentItemName in view["edgeList"]:
+            catChild = CifName.categoryPart(childItemName)
+            catParent = CifName.categoryPart(parentItemName)
+            if catChild not in nodeD or catParent not in nodeD:
+                continue
+            side = 1.0 if catChild == catParent else -1.0
+            x0, y0 = self.__getPortPoint(nodeD[catChild], childItemName, side)
+            x1, y1 = self.__getPortPoint(nodeD[catParent], parentItemName, side)
+            # The edge ends at the base of the arrow head pointing into the parent row -
+            xb = x1 + side * self.__arrowLength
+            bend = side * min(120.0, 24.0 + 0.2 * abs(y1 - y0))
+            pointList = [(x0, y0), (x0 + bend, y0), (xb + bend, y1), (xb, y1)]
+            arrowList = [(x1, y1), (xb, y1 - self.__arrowHalfWidth), (xb, y1 + self.__arrowHalfWidth)]
+            edgeList.append({"childItemName": childItemName, "parentItemName": parentItemName, "pointList": pointList, "arrowList": arrowList})
+        #
+        # Shift the diagram to include the edge routes -
+        xL = [0.0, maxWidth] + [pt[0] for edge in edgeList for pt in edge["pointList"] + edge["arrowList"]]
+        yL = [0.0, max(y - self.__rankSep, 0.0)] + [pt[1] for edge in edgeList for pt in edge["pointList"] + edge["arrowList"]]
+        dx = -min(xL)
+        dy = -min(yL)
+        for nD in nodeD.values():
+            nD["x"] += dx
+            nD["y"] += dy
+        for edge in edgeList:
+            edge["pointList"] = [(px + dx, py + dy) for px, py in edge["pointList"]]
+            edge["arrowList"] = [(px + dx, py + dy) for px, py in edge["arrowList"]]
+        return {"width": max(xL) - min(xL), "height": max(yL) - min(yL), "nodeD": nodeD, "edgeList": edgeList}
+
+    def __getPortPoint(self, nD, itemName, side):
+        """Return the west (side=-1) or east (side=1) point of the row depicting the input item (or of the table header)."""
+        row = nD["rowD"].get(itemName, 0)
+        x = nD["x"] if side < 0 else nD["x"] + nD["width"]
+        return x, nD["y"] + (row + 0.5) * self.__rowHeight
+
+    def __getTitleLines(self, graphTitle, graphSubTitle, titleFormat):
+        """Return the title lines [[(text, fontSize, bold), ...], ...] for plain text or the HTML-like <br/> and <b> title markup."""
+        if graphTitle is None:
+            return []
+        if titleFormat == "text":
+            return [[(graphTitle, self.__titleFontSize, False)]]
+        lineList = [[]]
+        markupList = [(graphTitle, self.__titleFontSize)]
+        if graphSubTitle is not None:
+            markupList.append((" <br/> " + graphSubTitle, self.__subTitleFontSize))
+        for markup, fontSize in markupList:
+            bold = False
+            for tok in re.split(r"(<br/>|<b>|</b>)", markup):
+                if tok == "<br/>":
+                    lineList.append([])
+                elif tok in ["<b>", "</b>"]:
+                    bold = tok == "<b>"
+                elif tok:
+                    lineList[-1].append((tok, fontSize, bold))
+        return lineList
+
+    def render(self, view, graphTitle=None, graphSubTitle=None, titleFormat="text", size=None):
+        """Return the SVG depiction (bytes) of the input view (see NeighborFigures.getNeighborhoodView()).
+
+        size    maximum drawing size 'width,height' in inches (the drawing is scaled down to fit, c.f. dot -Gsize)
+        """
+        lD = self.layout(view)
+        titleLineList = self.__getTitleLines(graphTitle, graphSubTitle, titleFormat)
+        titleHeight = sum([max([span[1] for span in line], default=self.__titleFontSize) * 1.2 for line in titleLineList])
+        titleWidth = max([sum([self.__textWidth(text, fontSize, bold) for text, fontSize, bold in line]) for line in titleLineList], default=0.0)
+        graphWidth = max(lD["width"], titleWidth)
+        graphHeight = lD["height"] + (titleHeight + 8.0 if titleLineList else 0.0)
+        xOffset = (graphWidth - lD["width"]) / 2.0
+        #
+        scale = 1.0
+        if size:
+            try:
+                wS, hS = [float(val) for val in str(size).split(",")[:2]]
+                scale = min(1.0, wS * 72.0 / (graphWidth + 2.0 * self.__margin), hS * 72.0 / (graphHeight + 2.0 * self.__margin))
+            except ValueError:
+                logger.warning("Ignoring invalid figure size %r", size)
+        width = (graphWidth + 2.0 * self.__margin) * scale
+        height = (graphHeight + 2.0 * self.__margin) * scale
+        #
+        oL = []
+        oL.append('<?xml version="1.0" encoding="UTF-8" standalone="no"?>')
+        oL.append('<!DOCTYPE svg PUBLIC "-//W3C//DTD SVG 1.1//EN"')
+        oL.append(' "http://www.w3.org/Graphics/SVG/1.1/DTD/svg11.dtd">')
+        oL.append("<!-- Generated by mmcif.sitegen NeighborFigureRenderer -->")
+        oL.append("<!-- Title: %s Pages: 1 -->" % escape(view["categoryName"]))
+        oL.append('<svg width="%spt" height="%spt"' % (self.__fmt(width), self.__fmt(height)))
+        oL.append(' viewBox="0.00 0.00 %.2f %.2f" xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink">' % (width, height))
+        oL.append('<g id="graph0" class="graph" transform="scale(%s) translate(%s %s)">' % (self.__fmt(scale), self.__fmt(self.__margin), self.__fmt(self.__margin)))
+        oL.append("<title>%s</title>" % escape(view["categoryName"]))
+        oL.append(self.__polygon(-self.__margin, -self.__margin, graphWidth + 2.0 * self.__margin, graphHeight + 2.0 * self.__margin, fill="white", stroke="none"))
+        #
+        # Title lines centered below the diagram -
+        y = lD["height"] + 8.0
+        for line in titleLineList:
+            lineHeight = max([span[1] for span in line], default=self.__titleFontSize) * 1.2
+            y += lineHeight
+            x = (graphWidth - sum([self.__textWidth(text, fontSize, bold) for text, fontSize, bold in line])) / 2.0
+            for text, fontSize, bold in line:
+                weight = ' font-weight="bold"' if bold else ""
+                oL.append(
+                    '<text xml:space="preserve" text-anchor="start" x="%s" y="%s" font-family="%s"%s font-size="%.2f">%s</text>'
+                    % (self.__fmt(x), self.__fmt(y - 0.25 * lineHeight), self.__titleFontFamily, weight, fontSize, escape(text))
+                )
+                x += self.__textWidth(text, fontSize, bold)
+        #
+        nodeNumber = 0
+        anchorNumber = 0
+        for node in view["nodeList"]:
+            nodeNumber += 1
+            nD = lD["nodeD"][node["categoryName"]]
+            x = nD["x"] + xOffset
+            oL.append("<!-- _%s -->" % escape(node["categoryName"]))
+            oL.append('<g id="node%d" class="node">' % nodeNumber)
+            oL.append("<title>_%s</title>" % escape(node["categoryName"]))
+            cellList = [(node["categoryName"].upper(), self.__fontSizeCategory, categoryColorD[node["highLight"]], None if node["placeholder"] else node["url"], "middle")]
+            for row in node["rowList"]:
+                cellList.append((row["attributeName"], self.__fontSizeAttribute, categoryColorD["key"] if row["isKey"] else None, row["url"], "start"))
+            if node["truncated"]:
+                cellList.append(("... and others ...", self.__fontSizeAttribute, None, None, "start"))
+            for ii, (text, fontSize, fill, url, anchor) in enumerate(cellList):
+                y = nD["y"] + ii * self.__rowHeight
+                if url:
+                    oL.append('<g id="a_node%d_%d"><a xlink:href=%s xlink:title="&lt;TABLE&gt;" target="_top">' % (nodeNumber, anchorNumber, quoteattr(url)))
+                    anchorNumber += 1
+                if fill:
+                    oL.append(self.__polygon(x, y, nD["width"], self.__rowHeight, fill=fill, stroke="none"))
+                oL.append(self.__polygon(x, y, nD["width"], self.__rowHeight, fill="none", stroke="black"))
+                tx = x + nD["width"] / 2.0 if anchor == "middle" else x + self.__cellPadding + 1.0
+                oL.append(
+                    '<text xml:space="preserve" text-anchor="%s" x="%s" y="%s" font-family="%s" font-size="%.2f">%s</text>'
+                    % (anchor, self.__fmt(tx), self.__fmt(y + self.__rowHeight - 5.0), self.__fontFamily, fontSize, escape(text))
+                )
+                if url:
+                    oL.append("</a>")
+                    oL.append("</g>")
+            oL.append("</g>")
+        #
+        for ii, edge in enumerate(lD["edgeList"], 1):
+            pointList = [(px + xOffset, py) for px, py in edge["pointList"]]
+            arrowList = [(px + xOffset, py) for px, py in edge["arrowList"]]
+            oL.append('<g id="edge%d" class="edge">' % ii)
+            oL.append("<title>%s&#45;&gt;%s</title>" % (escape(edge["childItemName"]), escape(edge["parentItemName"])))
+            oL.append(
+                '<path fill="none" stroke="black" d="M%s,%sC%s"/>'
+                % (self.__fmt(pointList[0][0]), self.__fmt(pointList[0][1]), " ".join(["%s,%s" % (self.__fmt(px), self.__fmt(py)) for px, py in pointList[1:]]))
+            )
+            oL.append(
+                '<polygon fill="black" stroke="black" points="%s"/>' % " ".join(["%s,%s" % (self.__fmt(px), self.__fmt(py)) for px, py in arrowList + arrowList[:1]])
+            )
+            oL.append("</g>")
+        oL.append("</g>")
+        oL.append("</svg>")
+        oL.append("")
+        return "\n".join(oL).encode("utf-8")
+
+    def __polygon(self, x, y, width, height, fill="none", stroke="black"):
+        pointList = [(x, y), (x, y + height), (x + width, y + height), (x + width, y), (x, y)]
+        return '<polygon fill="%s" stroke="%s" points="%s"/>' % (fill, stroke, " ".join(["%s,%s" % (self.__fmt(px), self.__fmt(py)) for px, py in pointList]))
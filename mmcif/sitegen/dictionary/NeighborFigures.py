@@ -10,6 +10,19 @@
 #                      to protect against leading digits in cif names.
 #   8-Oct-2013 jdw -   Adjust cell padding for for attribute name display
 #  28-Dec-2020 jdw -   cleanup and py39
+#  18-Oct-2026     -   take parent/child relationships from the dictionary relationship graph
+#  18-Oct-2026     -   separate the generation of dot instructions from the figure layout
+#  18-Oct-2026     -   run dot as a subprocess with piped input and output (dot files are kept only for debugging)
+#  18-Oct-2026     -   reuse figures from an optional content-addressed figure cache
+#  18-Oct-2026     -   optional in-process layout with the Graphviz library (pygraphviz) falling back to the dot executable
+#  18-Oct-2026     -   add batch layout streaming many figures through each dot process
+#  18-Oct-2026     -   compute a neighborhood model once per category and derive delivery filtered figure variants from it
+#  18-Oct-2026     -   add the built-in 'python' layout engine (NeighborFigureRenderer)
+#  18-Oct-2026     -   optional minification of SVG figures (SvgMinifier)
+#  19-Oct-2026     -   per-figure time and memory limits for dot layouts with degraded retries of figures exceeding them
+#  19-Oct-2026     -   fingerprints of the figure layout inputs for incremental builds
+#  19-Oct-2026     -   'auto' backend prefers the dot executable for concurrent layouts
+#  19-Oct-2026     -   set the dot memory limit in the child process rather than through a shell
 ##
 """
 Utility methods for generating depictions of data category neighbor relationships.
@@ -20,23 +33,104 @@ __author__ = "John Westbrook"
 __email__ = "jwest@rcsb.rutgers.edu"
 __license__ = "Apache 2,0"
 
+import functools
 import logging
 import os
+import queue
+import re
+import subprocess
+import threading
+import time
 
 from mmcif.api.PdbxContainers import CifName
 
+from mmcif.sitegen.dictionary import __version__
+from mmcif.sitegen.dictionary.DictionaryRelationshipGraph import DictionaryRelationshipGraph
+from mmcif.sitegen.dictionary.FigureCache import FigureCache
+from mmcif.sitegen.dictionary.NeighborFigureRenderer import NeighborFigureRenderer, categoryColorD
+
+try:
+    import pygraphviz
+except ImportError:
+    pygraphviz = None
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
 logger = logging.getLogger(__name__)
 
+# The Graphviz library is not thread safe - in-process layouts are serialized
+_graphvizLibraryLock = threading.Lock()
+# SVG anchor ids are numbered by a counter shared by all graphs rendered in a process
+_svgAnchorIdPattern = re.compile(rb'(id="a_[^"]*_)(\d+)(")')
+# Simplifications applied in turn to figures exceeding the layout limits (description, makeNeighborFigureDot() options or
+# None for the built-in renderer)
+_figureDegradationList = [
+    ("maxItems=10", {"maxItems": 10}),
+    ("maxItems=5 maxCategories=12", {"maxItems": 5, "maxCategories": 12}),
+    ("built-in renderer", None),
+]
+
 
 class NeighborFigures(object):
     """Utility methods for generating depictions of data category neighbor relationships"""
 
-    def __init__(self, dictApiObj, pathInfoObj=None, pathDot="/usr/local/bin/dot", verbose=False):
-        """"""
+    def __init__(
+        self,
+        dictApiObj,
+        pathInfoObj=None,
+        pathDot="/usr/local/bin/dot",
+        relationshipGraphObj=None,
+        keepDot=False,
+        figureCacheObj=None,
+        layoutBackend="auto",
+        svgMinifierObj=None,
+        layoutTimeout=None,
+        layoutMemoryLimit=None,
+        numWorkers=1,
+        verbose=False,
+    ):
+        """Category relationship diagrams rendered by GraphViz 'dot'.
+
+        keepDot         True to also write the 'dot' instructions for each figure to a file alongside the figure (for debugging)
+        figureCacheObj  figure cache (FigureCache) consulted before and updated after each layout
+        layoutBackend   'auto' to lay out figures in-process with the Graphviz library (pygraphviz) when it is installed
+                        and otherwise run the 'dot' executable (pathDot), 'library' to require the library (falling back to
+                        the executable with a warning), 'binary' to always run the executable or 'python' to lay out
+                        SVG figures with the built-in renderer (NeighborFigureRenderer)
+        svgMinifierObj  SVG minifier (SvgMinifier) applied to each SVG figure before it is written and cached
+        layoutTimeout   maximum time (seconds) for the layout of each figure by the dot executable (default=None, no limit)
+        layoutMemoryLimit  maximum address space (MB) of each dot process (POSIX only, default=None, no limit)
+        numWorkers      number of figures the caller lays out concurrently (default=1)
+
+        Library layouts cannot be interrupted and are serialized, so with layout limits or more than one worker the
+        'auto' backend runs the dot executable when it is available.
+        Figures exceeding the limits may be laid out again in a simplified form (see layoutDegradedNeighborFigure()).
+        """
         self.__verbose = verbose
+        self.__keepDot = keepDot
+        self.__figureCache = figureCacheObj
+        self.__svgMinifier = svgMinifierObj
         self.__dApi = dictApiObj
+        self.__rG = relationshipGraphObj if relationshipGraphObj is not None else DictionaryRelationshipGraph(dictApiObj, verbose=verbose)
         self.__pI = pathInfoObj
         self.__pathDot = pathDot
+        self.__layoutTimeout = layoutTimeout
+        self.__layoutMemoryLimit = layoutMemoryLimit if resource is not None else None
+        hasLimits = bool(layoutTimeout or layoutMemoryLimit)
+        preferBinary = bool(pathDot) and os.access(pathDot, os.X_OK) and (hasLimits or (numWorkers or 1) > 1)
+        self.__useLibrary = pygraphviz is not None and (layoutBackend == "library" or (layoutBackend == "auto" and not preferBinary))
+        self.__usePython = layoutBackend == "python"
+        if layoutBackend == "library" and pygraphviz is None:
+            logger.warning("Graphviz library bindings (pygraphviz) are not installed - using dot executable %r", pathDot)
+        elif self.__useLibrary and hasLimits:
+            logger.warning("Layout time and memory limits are not applied to Graphviz library layouts")
+        self.__engineId = self.__getEngineId() if figureCacheObj is not None else None
+        if self.__engineId and svgMinifierObj is not None:
+            self.__engineId += " " + svgMinifierObj.getId()
+        self.__fingerprintEngineId = None
         # Default font settings ----
         self.__fontFace = "helvetica"
         # self.__fontSize='10'
@@ -48,6 +142,8 @@ class NeighborFigures(object):
         #
         self.__itemCounts = {"archive": {}, "prd": {}, "cc": {}, "family": {}}
         self.__categoryCounts = {"archive": {}, "prd": {}, "cc": {}, "family": {}}
+        # Neighborhood model of the most recent category (key, model)
+        self.__neighborhoodCache = None
 
     def setFonts(self, fontFace="helvetica", fontSizeCategory="10", fontSizeAttribute="10", titleFontSize="18", subTitleFontSize="14"):
         self.__fontFace = fontFace
@@ -180,157 +276,18 @@ class NeighborFigures(object):
 
         return iconTypeList
 
-    def __getOrderedItemNameList(self, categoryName, fkList=None, filterDelivery=False, deliveryType="archive"):
-        """Return the item name list for the input category with the order: key items, items with FK relationships,
-        and remaining items.    Items which do are not key nor participate in any parent child relationships
-        can be filtered according to their presence in current archive entries.
-        """
-        allItemList = sorted(self.__dApi.getItemNameList(categoryName))
-        rList = []
-        for itemName in allItemList:
-            if fkList and itemName in fkList:
-                rList.append(itemName)
-
-        tList = []
-        keyItemNameList = sorted(self.__dApi.getCategoryKeyList(categoryName))
-        if filterDelivery:
-            for itemName in allItemList:
-                if itemName in keyItemNameList:
-                    tList.append(itemName)
-                    continue
-                if itemName in rList:
-                    tList.append(itemName)
-                    continue
-                if self.__isItemUsed(itemName, deliveryType=deliveryType):
-                    tList.append(itemName)
-        else:
-            tList = allItemList
-
-        #
-        for keyItemName in keyItemNameList:
-            if keyItemName in rList:
-                rList.remove(keyItemName)
-            if keyItemName in tList:
-                tList.remove(keyItemName)
-            else:
-                logger.warning("+NeighborFigures.__getOrderedItemNameList() Category %s is missing key definition for %s", categoryName, keyItemName)
-
-        for rItemName in rList:
-            if rItemName in tList:
-                tList.remove(rItemName)
-        #
-        minItemCount = len(keyItemNameList) + len(rList)
-        #
-        itemNameList = []
-        itemNameList.extend(keyItemNameList)
-        itemNameList.extend(rList)
-        itemNameList.extend(tList)
-        return itemNameList, minItemCount
-
-    def __getParentCategories(self, itemNameList):
-        parentCategories = set()
-        for itemName in itemNameList:
-            categoryName = CifName.categoryPart(itemName)
-            attributeName = CifName.attributePart(itemName)
-            parentItemList = self.__dApi.getFullParentList(categoryName, attributeName)
-            for parentItem in parentItemList:
-                parentCategoryName = CifName.categoryPart(parentItem)
-                parentCategories.add(parentCategoryName)
-        return list(parentCategories)
-
-    def __getChildCategories(self, itemNameList):
-        childCategories = set()
-        for itemName in itemNameList:
-            categoryName = CifName.categoryPart(itemName)
-            attributeName = CifName.attributePart(itemName)
-            childItemList = self.__dApi.getFullChildList(categoryName, attributeName)
-            for childItem in childItemList:
-                childCategoryName = CifName.categoryPart(childItem)
-                childCategories.add(childCategoryName)
-        return list(childCategories)
-
     def __getRelativesAdjacent(self, itemNameList):
         aR = {}
         for itemName in itemNameList:
-            categoryName = CifName.categoryPart(itemName)
-            attributeName = CifName.attributePart(itemName)
             tD = {}
-            tD["parentItems"] = self.__dApi.getFullParentList(categoryName, attributeName)
-            tD["childItems"] = self.__dApi.getFullChildList(categoryName, attributeName)
+            tD["parentItems"] = self.__rG.getParentItems(itemName)
+            tD["childItems"] = self.__rG.getChildItems(itemName)
             aR[itemName] = tD
         # if (self.__verbose):
         #    for k,v in aR.items():
         #        logger.debug("Item %s\n       parents: %s\n       children  %s\n\n" % (k,v['parentItems'],v['childItems']))
         return aR
 
-    def __renderCategory(self, categoryName, fkList=None, highLight="adjacent", maxItems=10, filterDelivery=False, deliveryType="archive"):
-        """Create graphviz object with embedded tabular HTML represenation of the input data category
-
-             * Add _ guard characters before graph name and port names --
-
-        _categoryName_1 [label=<
-        <table border="0" cellborder="1" cellspacing="0" align="left">
-        <tr><td BGCOLOR="Lavender">categoryName_1</td></tr>
-        <tr><td PORT="__attribute_1">attribute_1</td></tr>
-        <tr><td PORT="__attribute_2">attribute_2</td></tr>
-        <tr><td PORT="__attribute_3">attribute_3</td></tr>
-        </table>>];
-
-        """
-        colorD = {
-            "op1": 'BGCOLOR="#7fc97f"',
-            "other": 'BGCOLOR="#beaed4"',
-            "op2": 'BGCOLOR="#fdc086"',
-            "key": 'BGCOLOR="#ffff99"',
-            "op4": 'BGCOLOR="#386cb0"',
-            "current": 'BGCOLOR="#f0027f"',
-            "adjacent": 'BGCOLOR="#99c49b"',
-        }
-        oList = []
-        itemNameList, minItemCount = self.__getOrderedItemNameList(categoryName, fkList=fkList, filterDelivery=filterDelivery, deliveryType=deliveryType)
-        itemsToRender = max(minItemCount, maxItems)
-        #
-        categoryUrl = os.path.join(self.__pI.getContentTypeObjUrl(contentObjName=categoryName, contentType="Categories"))
-        logger.debug("Rendering %s categoryUrl %r itemNameList %r itemsToRender %r fkList %r", categoryName, categoryUrl, itemNameList, itemsToRender, fkList)
-        if len(itemNameList) > 0:
-            iconTypeList = self.__assignItemIconType(itemNameList)
-            oList.append('_%s [label=<<TABLE BORDER="0" CELLBORDER="1" CELLSPACING="0" ALIGN="LEFT">' % (categoryName))
-            tdText = '<FONT POINT-SIZE="%s" FACE="%s">%s</FONT>' % (self.__fontSizeCategory, self.__fontFace, categoryName.upper())
-            oList.append('    <tr><td %s CELLPADDING="4" HREF="%s" TARGET="_top">%s</td></tr>' % (colorD[highLight], categoryUrl, tdText))
-
-            for iconType, itemName in list(zip(iconTypeList, itemNameList))[:itemsToRender]:
-                itemUrl = os.path.join(self.__pI.getContentTypeObjUrl(contentObjName=itemName, contentType="Items"))
-                attributeName = CifName.attributePart(itemName)
-                tdText = '<FONT POINT-SIZE="%s" FACE="%s">%s</FONT>' % (self.__fontSizeAttribute, self.__fontFace, attributeName)
-                if "key" in iconType:
-                    oList.append('<tr><td %s PORT="__%s" CELLPADDING="4" HREF="%s" TARGET="_top" ALIGN="LEFT">%s</td></tr>' % (colorD["key"], attributeName, itemUrl, tdText))
-                else:
-                    oList.append('<tr><td PORT="__%s" CELLPADDING="4" HREF="%s" TARGET="_top" ALIGN="LEFT">%s</td></tr>' % (attributeName, itemUrl, tdText))
-
-            if len(itemNameList) > itemsToRender:
-                tdText = '<FONT POINT-SIZE="%s" FACE="%s">%s</FONT>' % (self.__fontSizeAttribute, self.__fontFace, "... and others ...")
-                oList.append("<tr><td>%s</td></tr>" % tdText)
-            oList.append("</TABLE>>];")
-        else:
-            # Placeholder for missing category
-            oList.append('_%s [label=<<TABLE BORDER="0" CELLBORDER="1" CELLSPACING="0" ALIGN="LEFT">' % (categoryName))
-            tdText = '<FONT POINT-SIZE="%s" FACE="%s">%s</FONT>' % (self.__fontSizeCategory, self.__fontFace, categoryName.upper())
-            oList.append('    <tr><td %s CELLPADDING="4"  TARGET="_top">%s</td></tr>' % (colorD[highLight], tdText))
-
-            for itemName in fkList:
-                iconType = "none"
-                itemUrl = os.path.join(self.__pI.getContentTypeObjUrl(contentObjName=itemName, contentType="Items"))
-                attributeName = CifName.attributePart(itemName)
-                tdText = '<FONT POINT-SIZE="%s" FACE="%s">%s</FONT>' % (self.__fontSizeAttribute, self.__fontFace, attributeName)
-                if "key" in iconType:
-                    oList.append('<tr><td %s PORT="__%s" CELLPADDING="4" TARGET="_top" ALIGN="LEFT">%s</td></tr>' % (colorD["key"], attributeName, tdText))
-                else:
-                    oList.append('<tr><td PORT="__%s" CELLPADDING="4" TARGET="_top" ALIGN="LEFT">%s</td></tr>' % (attributeName, tdText))
-
-            oList.append("</TABLE>>];")
-        #
-        return oList
-
     def __getRelatedList(self, categoryName, adjacentD):
         #
         relatedSet = set()
@@ -356,6 +313,186 @@ class NeighborFigures(object):
         #
         return relatedList
 
+    def __buildCategoryRecord(self, categoryName, highLight, relatedList):
+        """Return the unfiltered depiction details for a category in a neighborhood (see getNeighborhood())."""
+        allItemList = sorted(self.__dApi.getItemNameList(categoryName))
+        keyItemNameList = sorted(self.__dApi.getCategoryKeyList(categoryName))
+        for keyItemName in keyItemNameList:
+            if keyItemName not in allItemList:
+                logger.warning("+NeighborFigures.__buildCategoryRecord() Category %s is missing key definition for %s", categoryName, keyItemName)
+        # Items with parent/child relationships followed by the remaining items -
+        rList = [itemName for itemName in allItemList if itemName in relatedList and itemName not in keyItemNameList]
+        tList = [itemName for itemName in allItemList if itemName not in keyItemNameList and itemName not in rList]
+        return {
+            "categoryName": categoryName,
+            "highLight": highLight,
+            "url": self.__pI.getContentTypeObjUrl(contentObjName=categoryName, contentType="Categories"),
+            "keyItemNameList": keyItemNameList,
+            "relatedItemNameList": rList,
+            "otherItemNameList": tList,
+            "relatedList": relatedList,
+            "rowD": {},
+        }
+
+    def getNeighborhood(self, categoryName, neighborCategoryList=None, maxCategories=None):
+        """Return the neighborhood model of the input category and either all of its adjacent neighbor categories or
+        the selected categories in 'neighborCategoryList'.  The model is independent of delivery type filtering and
+        is reused for the figure variants of the most recently requested category (see getNeighborhoodView()).
+
+        Returns:
+            dict: {"categoryName": ...,
+                   "categoryList": [{"categoryName", "highLight", "url", "keyItemNameList", "relatedItemNameList",
+                                     "otherItemNameList", "relatedList", "rowD"}, ...],
+                   "edgeList": [(childItemName, parentItemName), ...]}
+        """
+        cacheKey = (categoryName, tuple(neighborCategoryList) if neighborCategoryList is not None else None, maxCategories)
+        if self.__neighborhoodCache and self.__neighborhoodCache[0] == cacheKey:
+            return self.__neighborhoodCache[1]
+        #
+        aR = self.__getRelativesAdjacent(self.__dApi.getItemNameList(categoryName))
+        for k, v in aR.items():
+            logger.debug("%s relatives %s", k, v)
+        #
+        adjacentCategories = [categoryName]
+        if neighborCategoryList is None:
+            adjacentCategories.extend(self.__rG.getParentCategories(categoryName))
+            adjacentCategories.extend(self.__rG.getChildCategories(categoryName))
+        else:
+            adjacentCategories.extend(neighborCategoryList)
+        adjacentCategories = sorted(list(set(adjacentCategories)))
+        if maxCategories is not None:
+            adjacentCategories = adjacentCategories[:maxCategories]
+        logger.debug("adjacent categories %s", adjacentCategories)
+        #
+        categoryList = []
+        for catName in adjacentCategories:
+            highLight = "current" if catName == categoryName else "adjacent"
+            categoryList.append(self.__buildCategoryRecord(catName, highLight, self.__getRelatedList(categoryName=catName, adjacentD=aR)))
+        #
+        # Relationship edges between the items in adjacent categories in depiction order (a single edge for each item pair) -
+        adjacentSet = set(adjacentCategories)
+        edgeList = []
+        lD = {}
+        for catName in adjacentCategories:
+            for itemName in self.__dApi.getItemNameList(catName):
+                pairList = [(itemName, parentItemName) for parentItemName in self.__rG.getParentItems(itemName)]
+                pairList.extend([(childItemName, itemName) for childItemName in self.__rG.getChildItems(itemName)])
+                for childItemName, parentItemName in pairList:
+                    if (childItemName, parentItemName) in lD:
+                        continue
+                    if CifName.categoryPart(childItemName) not in adjacentSet or CifName.categoryPart(parentItemName) not in adjacentSet:
+                        continue
+                    edgeList.append((childItemName, parentItemName))
+                    lD[(childItemName, parentItemName)] = 1
+                    lD[(parentItemName, childItemName)] = 1
+        #
+        neighborhood = {"categoryName": categoryName, "categoryList": categoryList, "edgeList": edgeList}
+        self.__neighborhoodCache = (cacheKey, neighborhood)
+        return neighborhood
+
+    def getNeighborhoodView(self, neighborhood, maxItems=20, filterDelivery=False, deliveryType="archive"):
+        """Return the categories, item rows and relationship edges depicted in a figure of the input neighborhood
+        model (see getNeighborhood()), optionally masking categories and items not in current use for the delivery type.
+
+        Category rows are ordered: key items, items with parent/child relationships and remaining items, with at
+        least the key and related items and otherwise at most maxItems rows.  A category without items to depict
+        is depicted as a placeholder listing its related items.
+
+        Returns:
+            dict: {"categoryName": ...,
+                   "nodeList": [{"categoryName", "highLight", "url", "placeholder", "truncated",
+                                 "rowList": [{"itemName", "attributeName", "url", "iconType", "isKey"}, ...]}, ...],
+                   "edgeList": [(childItemName, parentItemName), ...]}
+        """
+        nodeList = []
+        for cD in neighborhood["categoryList"]:
+            if filterDelivery and not self.__isCategoryUsed(cD["categoryName"], deliveryType=deliveryType):
+                continue
+            tList = cD["otherItemNameList"]
+            if filterDelivery:
+                tList = [itemName for itemName in tList if self.__isItemUsed(itemName, deliveryType=deliveryType)]
+            itemNameList = cD["keyItemNameList"] + cD["relatedItemNameList"] + tList
+            itemsToRender = max(len(cD["keyItemNameList"]) + len(cD["relatedItemNameList"]), maxItems)
+            #
+            rowList = []
+            if itemNameList:
+                # Rows are created on first use and shared by the views of the neighborhood -
+                rowD = cD["rowD"]
+                missingList = [itemName for itemName in itemNameList[:itemsToRender] if itemName not in rowD]
+                for itemName, iconType in zip(missingList, self.__assignItemIconType(missingList) if missingList else []):
+                    rowD[itemName] = {
+                        "itemName": itemName,
+                        "attributeName": CifName.attributePart(itemName),
+                        "url": self.__pI.getContentTypeObjUrl(contentObjName=itemName, contentType="Items"),
+                        "iconType": iconType,
+                        "isKey": "key" in iconType,
+                    }
+                rowList = [rowD[itemName] for itemName in itemNameList[:itemsToRender]]
+            else:
+                for itemName in cD["relatedList"]:
+                    rowList.append({"itemName": itemName, "attributeName": CifName.attributePart(itemName), "url": None, "iconType": "none", "isKey": False})
+            nodeList.append(
+                {
+                    "categoryName": cD["categoryName"],
+                    "highLight": cD["highLight"],
+                    "url": cD["url"],
+                    "placeholder": not itemNameList,
+                    "truncated": len(itemNameList) > itemsToRender,
+                    "rowList": rowList,
+                }
+            )
+        #
+        edgeList = neighborhood["edgeList"]
+        if filterDelivery:
+            edgeList = [
+                (childItemName, parentItemName)
+                for childItemName, parentItemName in edgeList
+                if self.__isItemUsed(childItemName, deliveryType=deliveryType) and self.__isItemUsed(parentItemName, deliveryType=deliveryType)
+            ]
+        return {"categoryName": neighborhood["categoryName"], "nodeList": nodeList, "edgeList": edgeList}
+
+    def __renderCategory(self, node):
+        """Create graphviz object with embedded tabular HTML represenation of a data category node (see getNeighborhoodView())
+
+             * Add _ guard characters before graph name and port names --
+
+        _categoryName_1 [label=<
+        <table border="0" cellborder="1" cellspacing="0" align="left">
+        <tr><td BGCOLOR="Lavender">categoryName_1</td></tr>
+        <tr><td PORT="__attribute_1">attribute_1</td></tr>
+        <tr><td PORT="__attribute_2">attribute_2</td></tr>
+        <tr><td PORT="__attribute_3">attribute_3</td></tr>
+        </table>>];
+
+        """
+        colorD = {ky: 'BGCOLOR="%s"' % color for ky, color in categoryColorD.items()}
+        oList = []
+        categoryName = node["categoryName"]
+        logger.debug("Rendering %s categoryUrl %r rows %d", categoryName, node["url"], len(node["rowList"]))
+        oList.append('_%s [label=<<TABLE BORDER="0" CELLBORDER="1" CELLSPACING="0" ALIGN="LEFT">' % (categoryName))
+        tdText = '<FONT POINT-SIZE="%s" FACE="%s">%s</FONT>' % (self.__fontSizeCategory, self.__fontFace, categoryName.upper())
+        if not node["placeholder"]:
+            oList.append('    <tr><td %s CELLPADDING="4" HREF="%s" TARGET="_top">%s</td></tr>' % (colorD[node["highLight"]], node["url"], tdText))
+            for row in node["rowList"]:
+                tdText = '<FONT POINT-SIZE="%s" FACE="%s">%s</FONT>' % (self.__fontSizeAttribute, self.__fontFace, row["attributeName"])
+                if row["isKey"]:
+                    oList.append('<tr><td %s PORT="__%s" CELLPADDING="4" HREF="%s" TARGET="_top" ALIGN="LEFT">%s</td></tr>' % (colorD["key"], row["attributeName"], row["url"], tdText))
+                else:
+                    oList.append('<tr><td PORT="__%s" CELLPADDING="4" HREF="%s" TARGET="_top" ALIGN="LEFT">%s</td></tr>' % (row["attributeName"], row["url"], tdText))
+
+            if node["truncated"]:
+                tdText = '<FONT POINT-SIZE="%s" FACE="%s">%s</FONT>' % (self.__fontSizeAttribute, self.__fontFace, "... and others ...")
+                oList.append("<tr><td>%s</td></tr>" % tdText)
+        else:
+            # Placeholder for missing category
+            oList.append('    <tr><td %s CELLPADDING="4"  TARGET="_top">%s</td></tr>' % (colorD[node["highLight"]], tdText))
+            for row in node["rowList"]:
+                tdText = '<FONT POINT-SIZE="%s" FACE="%s">%s</FONT>' % (self.__fontSizeAttribute, self.__fontFace, row["attributeName"])
+                oList.append('<tr><td PORT="__%s" CELLPADDING="4" TARGET="_top" ALIGN="LEFT">%s</td></tr>' % (row["attributeName"], tdText))
+        oList.append("</TABLE>>];")
+        #
+        return oList
+
     def __generateDotInstructions(
         self,
         categoryName,
@@ -379,30 +516,10 @@ class NeighborFigures(object):
         #
         if filterDelivery and not self.__isCategoryUsed(categoryName=categoryName, deliveryType=deliveryType):
             logger.debug("skipping category %r delivery %r", categoryName, deliveryType)
-            return [], 0
+            return [], None
         #
-        numCategoriesRendered = 0
-        itemNameList = self.__dApi.getItemNameList(categoryName)
-        aR = self.__getRelativesAdjacent(itemNameList)
-
-        #
-        for k, v in aR.items():
-            logger.debug("%s relatives %s", k, v)
-        #
-        adjacentCategories = []
-        adjacentCategories.append(categoryName)
-        if neighborCategoryList is None:
-            adjacentCategories.extend(self.__getParentCategories(itemNameList))
-            adjacentCategories.extend(self.__getChildCategories(itemNameList))
-        else:
-            adjacentCategories.extend(neighborCategoryList)
-            #
-        adjacentCategories = sorted(list(set(adjacentCategories)))
-
-        if maxCategories is not None:
-            adjacentCategories = adjacentCategories[:maxCategories]
-
-        logger.debug("adjacent categories %s", adjacentCategories)
+        neighborhood = self.getNeighborhood(categoryName, neighborCategoryList=neighborCategoryList, maxCategories=maxCategories)
+        view = self.getNeighborhoodView(neighborhood, maxItems=maxItems, filterDelivery=filterDelivery, deliveryType=deliveryType)
         #
         oL = []
         oL.append("digraph %s {" % categoryName)
@@ -427,77 +544,19 @@ class NeighborFigures(object):
 
         oL.append("node [shape=plaintext]")
 
-        for catName in adjacentCategories:
-            if filterDelivery and not self.__isCategoryUsed(categoryName=catName, deliveryType=deliveryType):
-                continue
-            if catName == categoryName:
-                highLight = "current"
-            else:
-                highLight = "adjacent"
-            relatedList = self.__getRelatedList(categoryName=catName, adjacentD=aR)
-            oL.extend(self.__renderCategory(catName, fkList=relatedList, highLight=highLight, maxItems=maxItems, filterDelivery=filterDelivery, deliveryType=deliveryType))
-            numCategoriesRendered += 1
-
-        #  --------
-        # JDW regenerate full item list -
-        #
-        itemNameList = []
-        for catName in adjacentCategories:
-            itemNameList.extend(self.__dApi.getItemNameList(catName))
-        aR = {}
-        aR = self.__getRelativesAdjacent(itemNameList)
+        for node in view["nodeList"]:
+            oL.extend(self.__renderCategory(node))
         #
-        # --------
-        lD = {}
-        #
-        for itemName in itemNameList:
-            if filterDelivery and not self.__isItemUsed(itemName=itemName, deliveryType=deliveryType):
-                continue
-            tD = aR[itemName]
-            for parentItemName in tD["parentItems"]:
-                if filterDelivery and not self.__isItemUsed(itemName=parentItemName, deliveryType=deliveryType):
-                    continue
-                catName = CifName.categoryPart(itemName)
-                attName = CifName.attributePart(itemName)
-                catParent = CifName.categoryPart(parentItemName)
-                attParent = CifName.attributePart(parentItemName)
-                #
-                if (itemName, parentItemName) in lD:
-                    continue
-                if catParent not in adjacentCategories:
-                    continue
-                if catParent != catName:
-                    oL.append(" _%s:__%s:w -> _%s:__%s:w;" % (catName, attName, catParent, attParent))
-                else:
-                    oL.append(" _%s:__%s:e -> _%s:__%s:e;" % (catName, attName, catParent, attParent))
-
-                lD[(itemName, parentItemName)] = 1
-                lD[(parentItemName, itemName)] = 1
-
-            for childItemName in tD["childItems"]:
-                if filterDelivery and not self.__isItemUsed(itemName=childItemName, deliveryType=deliveryType):
-                    continue
-                catName = CifName.categoryPart(itemName)
-                attName = CifName.attributePart(itemName)
-                catChild = CifName.categoryPart(childItemName)
-                attChild = CifName.attributePart(childItemName)
-                #
-                if (itemName, childItemName) in lD:
-                    continue
-                if catChild not in adjacentCategories:
-                    continue
-                if catChild != catName:
-                    oL.append(" _%s:__%s:w -> _%s:__%s:w;" % (catChild, attChild, catName, attName))
-                else:
-                    oL.append(" _%s:__%s:e -> _%s:__%s:e;" % (catChild, attChild, catName, attName))
-
-                lD[(itemName, childItemName)] = 1
-                lD[(childItemName, itemName)] = 1
+        for childItemName, parentItemName in view["edgeList"]:
+            catChild = CifName.categoryPart(childItemName)
+            catParent = CifName.categoryPart(parentItemName)
+            port = "w" if catChild != catParent else "e"
+            oL.append(" _%s:__%s:%s -> _%s:__%s:%s;" % (catChild, CifName.attributePart(childItemName), port, catParent, CifName.attributePart(parentItemName), port))
 
         oL.append("}")
-        return oL, numCategoriesRendered
+        return oL, view
 
-    def makeNeighborFigure(
+    def makeNeighborFigureDot(
         self,
         categoryName,
         graphTitle=None,
@@ -510,23 +569,35 @@ class NeighborFigures(object):
         deliveryType="archive",
         neighborCategoryList=None,
         maxCategories=None,
-        cleanup=False,
         imageFilePath=None,
     ):
-        """Driver method to create diagrams of data category relationships between the input category and either all
-        of its adjacent neighbors or for selected categories in 'neighborCategoryList'.
-
-        Optionally apply filtering to categories in current use within the archive.
-
-        maxItems       controls target maximum number of attributes in any category object depiction.
-        maxCategories  limits the number of related category objects depicted.
-        cleanup        True to remove 'dot' files after processing
-
-        Output files are in SVG format, named and stored in conventional locations for this application.
+        """Write the 'dot' instructions for a diagram of the data category relationships of the input category
+        (see makeNeighborFigure()) and return the layout task for the figure (see layoutNeighborFigure()).
 
+        Returns:
+            dict: {"categoryName": ..., "variant": 'full' or the delivery type filter, "dotText": ..., "dotPath": ...,
+                   "figPath": ..., "figFormat": ..., "size": ..., "view": ..., "graphTitle": ..., "graphSubTitle": ...,
+                   "titleFormat": ..., "options": ..., "layoutError": None} or None if no categories are depicted.  The dot
+                   file (dotPath) is only written when keepDot is set.  The view (see getNeighborhoodView()) and titles
+                   are used by the built-in renderer, and the options (the arguments of this method) to simplify the figure.
+                   The layoutError is set by a failed layout ('timeout', 'memory' or 'error').
         """
         logger.debug("deliveryType %r neighborCategoryList %r ", deliveryType, neighborCategoryList)
-        dotList, numCategoriesRendered = self.__generateDotInstructions(
+        optionD = {
+            "categoryName": categoryName,
+            "graphTitle": graphTitle,
+            "graphSubTitle": graphSubTitle,
+            "titleFormat": titleFormat,
+            "figFormat": figFormat,
+            "size": size,
+            "maxItems": maxItems,
+            "filterDelivery": filterDelivery,
+            "deliveryType": deliveryType,
+            "neighborCategoryList": neighborCategoryList,
+            "maxCategories": maxCategories,
+            "imageFilePath": imageFilePath,
+        }
+        dotList, view = self.__generateDotInstructions(
             categoryName,
             graphTitle=graphTitle,
             graphSubTitle=graphSubTitle,
@@ -537,9 +608,10 @@ class NeighborFigures(object):
             neighborCategoryList=neighborCategoryList,
             maxCategories=maxCategories,
         )
+        numCategoriesRendered = len(view["nodeList"]) if view else 0
         logger.debug("deliveryType %r numCategoriesRendered %d", deliveryType, numCategoriesRendered)
         if numCategoriesRendered == 0:
-            return False
+            return None
         #
         if imageFilePath is None:
             dotfn = os.path.join(self.__pI.getDictCategoryImagePath(), categoryName + "_neighbors.dot")
@@ -554,28 +626,493 @@ class NeighborFigures(object):
                 dotfn = os.path.join(imageFilePath, categoryName + "_neighbors_" + deliveryType + ".dot")
                 svgfn = os.path.join(imageFilePath, categoryName + "_neighbors_" + deliveryType + ".svg")
         #
+        dotText = "%s" % "\n".join(dotList)
+        if self.__keepDot:
+            with open(dotfn, "w", encoding="utf-8") as ofh:
+                ofh.write(dotText)
         #
-        ofh = open(dotfn, "w", encoding="utf-8")
-        ofh.write("%s" % "\n".join(dotList))
-        ofh.close()
-        #
+        return {
+            "categoryName": categoryName,
+            "variant": deliveryType if filterDelivery else "full",
+            "dotText": dotText,
+            "dotPath": dotfn,
+            "figPath": svgfn,
+            "figFormat": figFormat,
+            "size": size,
+            "view": view,
+            "graphTitle": graphTitle,
+            "graphSubTitle": graphSubTitle,
+            "titleFormat": titleFormat,
+            "options": optionD,
+            "layoutError": None,
+        }
+
+    def getLayoutBackend(self):
+        """Return the layout backend in use ('library', 'binary' or 'python')."""
+        if self.__usePython:
+            return "python"
+        return "library" if self.__useLibrary else "binary"
+
+    def getFigureFingerprint(self, figureTask):
+        """Return a fingerprint of the inputs of the input figure task: the dot instructions, size, layout program,
+        layout limits and minification options.  A figure with an unchanged fingerprint need not be laid out again.
+        """
+        if self.__fingerprintEngineId is None:
+            engineId = self.__getEngineId() or ""
+            if self.__svgMinifier is not None:
+                engineId += " " + self.__svgMinifier.getId()
+            self.__fingerprintEngineId = engineId + " timeout=%r memory=%r" % (self.__layoutTimeout, self.__layoutMemoryLimit)
+        engine = self.__fingerprintEngineId
+        if self.__svgMinifier is not None:
+            engine += " %s" % self.__getFigureBaseUrl(figureTask)
+        return FigureCache.getKey(figureTask["dotText"], figFormat=figureTask["figFormat"], size=figureTask["size"], engine=engine)
+
+    def __getEngineId(self):
+        """Return an identifier for the layout program and version used in figure cache keys."""
+        if self.__usePython:
+            return "mmcif.sitegen %s NeighborFigureRenderer" % __version__
+        if self.__useLibrary:
+            gv = pygraphviz.graphviz
+            return "pygraphviz %s graphviz version %d.%d.%d" % (pygraphviz.__version__, gv.GRAPHVIZ_MAJOR_VERSION, gv.GRAPHVIZ_MINOR_VERSION, gv.GRAPHVIZ_PATCH_VERSION)
+        try:
+            proc = subprocess.run([self.__pathDot, "-V"], stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=False)
+            return (proc.stderr or proc.stdout).decode("utf-8", "replace").strip()
+        except Exception as e:
+            logger.debug("Failing for %r with %s", self.__pathDot, str(e))
+        return None
+
+    def __layoutLibrary(self, figureTask):
+        """Return the figure data (bytes) laid out and rendered in-process by the Graphviz library or None on failure."""
+        try:
+            with _graphvizLibraryLock:
+                aG = pygraphviz.AGraph(string=figureTask["dotText"])
+                # Equivalent to 'dot -Gsize=...' which does not override a size set in the dot instructions -
+                if figureTask["size"] is not None and not aG.graph_attr.get("size"):
+                    aG.graph_attr["size"] = figureTask["size"]
+                data = aG.draw(format=figureTask["figFormat"], prog="dot")
+            if data:
+                return data
+            logger.error("Graphviz library returned no output for %s", figureTask["figPath"])
+        except Exception as e:
+            logger.error("Graphviz library layout failed for %s with %s", figureTask["figPath"], str(e))
+        figureTask["layoutError"] = "error"
+        return None
+
+    def __writeFigure(self, figPath, data):
+        tmpfn = figPath + ".tmp"
+        with open(tmpfn, "wb") as ofh:
+            ofh.write(data)
+        os.replace(tmpfn, figPath)
+
+    def __getCacheKey(self, figureTask):
+        if self.__figureCache is not None and self.__engineId:
+            engine = self.__engineId
+            if self.__svgMinifier is not None:
+                # minified links may be relative to the figure location -
+                engine += " %s" % self.__getFigureBaseUrl(figureTask)
+            return self.__figureCache.getKey(figureTask["dotText"], figFormat=figureTask["figFormat"], size=figureTask["size"], engine=engine)
+        return None
+
+    def __readCachedFigure(self, figureTask, cacheKey):
+        data = self.__figureCache.get(cacheKey, figFormat=figureTask["figFormat"]) if cacheKey else None
+        if data:
+            self.__writeFigure(figureTask["figPath"], data)
+            logger.debug("Using cached figure for %s", figureTask["figPath"])
+            return True
+        return False
+
+    def __normalizeFigure(self, data, figFormat):
+        """Renumber SVG anchor ids in document order so figures do not depend on the graphs previously
+        rendered by the same dot process or library instance.
+        """
+        if figFormat != "svg":
+            return data
+        idD = {}
+        return _svgAnchorIdPattern.sub(lambda m: m.group(1) + str(idD.setdefault(m.group(2), len(idD))).encode("ascii") + m.group(3), data)
+
+    def __getFigureBaseUrl(self, figureTask):
+        """Return the URL directory of a figure written to the category image directory or None."""
+        if self.__pI and os.path.dirname(figureTask["figPath"]) == self.__pI.getDictCategoryImagePath():
+            return self.__pI.getDictCategoryImageDirUrl()
+        return None
+
+    def __minifyFigure(self, data, figureTask):
+        if self.__svgMinifier is None or figureTask["figFormat"] != "svg":
+            return data
+        return self.__svgMinifier.minify(data, baseUrl=self.__getFigureBaseUrl(figureTask))
+
+    def __storeFigure(self, figureTask, data, cacheKey):
+        data = self.__minifyFigure(self.__normalizeFigure(data, figureTask["figFormat"]), figureTask)
+        self.__writeFigure(figureTask["figPath"], data)
+        if cacheKey:
+            self.__figureCache.put(cacheKey, data, figFormat=figureTask["figFormat"])
+
+    def __getDotCommand(self, figFormat, size):
+        cmdL = [self.__pathDot, "-T%s" % figFormat]
         if size is not None:
-            cmd = self.__pathDot + ' -T%s  -Gsize="%s" %s > %s' % (figFormat, size, dotfn, svgfn)
-        else:
-            cmd = self.__pathDot + " -T%s %s > %s" % (figFormat, dotfn, svgfn)
-        ok = os.system(cmd)
+            cmdL.append("-Gsize=%s" % size)
+        return cmdL
+
+    def __getDotPreexec(self):
+        """Return the function limiting the address space of a dot process run in the forked child before dot is executed, or None."""
+        if not self.__layoutMemoryLimit:
+            return None
+        lim = int(self.__layoutMemoryLimit) * 1024 * 1024
+        # bound here so that the child only makes the system call -
+        return functools.partial(resource.setrlimit, resource.RLIMIT_AS, (lim, lim))
+
+    def __runDot(self, dotText, figFormat, size):
+        cmdL = self.__getDotCommand(figFormat, size)
+        return subprocess.run(
+            cmdL,
+            input=dotText.encode("utf-8"),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            timeout=self.__layoutTimeout,
+            check=False,
+            preexec_fn=self.__getDotPreexec(),
+        )
+
+    def __getLayoutError(self, returnCode, errS):
+        """Return the classification of a failed dot process ('memory' or 'error')."""
+        if self.__layoutMemoryLimit and (returnCode < 0 or re.search(r"memory|alloc|failed to map", errS, re.IGNORECASE)):
+            return "memory"
+        return "error"
+
+    def __layoutBinary(self, figureTask, cacheKey):
+        svgfn = figureTask["figPath"]
+        if not self.__pathDot:
+            logger.error("Graphviz dot is not available to render %s", svgfn)
+            figureTask["layoutError"] = "error"
+            return False
+        try:
+            proc = self.__runDot(figureTask["dotText"], figureTask["figFormat"], figureTask["size"])
+        except subprocess.TimeoutExpired:
+            logger.warning("dot layout of %s exceeded the time limit of %r seconds", svgfn, self.__layoutTimeout)
+            figureTask["layoutError"] = "timeout"
+            return False
+        errS = proc.stderr.decode("utf-8", "replace").strip()
+        if proc.returncode == 0 and proc.stdout:
+            if errS:
+                logger.debug("dot messages for %s: %s", svgfn, errS)
+            self.__storeFigure(figureTask, proc.stdout, cacheKey)
+            return True
+        figureTask["layoutError"] = self.__getLayoutError(proc.returncode, errS)
+        logger.error("dot failed for %s with return code %r (%s): %s", svgfn, proc.returncode, figureTask["layoutError"], errS[:2000])
+        return False
+
+    def __layoutPython(self, figureTask, cacheKey):
+        """Lay out and render an SVG figure with the built-in renderer."""
+        try:
+            nfr = NeighborFigureRenderer(
+                fontFace=self.__fontFace,
+                fontSizeCategory=self.__fontSizeCategory,
+                fontSizeAttribute=self.__fontSizeAttribute,
+                titleFontFace=self.__titleFontFace,
+                titleFontSize=self.__titleFontSize,
+                subTitleFontSize=self.__subTitleFontSize,
+            )
+            data = nfr.render(
+                figureTask["view"], graphTitle=figureTask["graphTitle"], graphSubTitle=figureTask["graphSubTitle"], titleFormat=figureTask["titleFormat"], size=figureTask["size"]
+            )
+            self.__storeFigure(figureTask, data, cacheKey)
+            return True
+        except Exception as e:
+            logger.exception("Built-in layout failed for %s with %s", figureTask["figPath"], str(e))
+        figureTask["layoutError"] = "error"
+        return False
+
+    def __layoutFigure(self, figureTask, cacheKey):
+        """Lay out a figure with the selected backend and return the status."""
+        if self.__usePython and figureTask["figFormat"] == "svg":
+            return self.__layoutPython(figureTask, cacheKey)
+        if self.__useLibrary:
+            data = self.__layoutLibrary(figureTask)
+            if data:
+                self.__storeFigure(figureTask, data, cacheKey)
+                return True
+            if not self.__pathDot:
+                return False
+            logger.warning("Retrying layout of %s with %s", figureTask["figPath"], self.__pathDot)
+            # the cache key identifies the library layout -
+            cacheKey = None
+        return self.__layoutBinary(figureTask, cacheKey)
+
+    def __finishFigure(self, figureTask, ok, cleanup):
+        # Remove any previous figure for a failed layout --
+        if not ok and os.path.exists(figureTask["figPath"]):
+            os.remove(figureTask["figPath"])
+        #
+        if cleanup and os.path.exists(figureTask["dotPath"]):
+            os.remove(figureTask["dotPath"])
+
+    def layoutNeighborFigure(self, figureTask, cleanup=False):
+        """Run the 'dot' layout for a figure task returned by makeNeighborFigureDot().
+
+        With the Graphviz library backend the figure is laid out and rendered in-process, falling back to the
+        'dot' executable if the library layout fails.  With the 'python' backend SVG figures are rendered from the
+        neighborhood view by NeighborFigureRenderer.  Otherwise the dot instructions are piped to the layout
+        process and the figure is read from its output.  On failure the exit status and error output are logged
+        and any previous figure file is removed.  With a figure cache, the layout is skipped for dot instructions
+        and options rendered previously by the same version of dot.  The dot executable is stopped if the layout
+        exceeds the time or memory limits and figureTask["layoutError"] is set to 'timeout' or 'memory' (or 'error'
+        for other failures).
+
+        This method may be called concurrently for different figures (library layouts are serialized).
+
+        cleanup        True to remove any 'dot' file after processing
+        """
+        ok = False
+        figureTask["layoutError"] = None
+        try:
+            cacheKey = self.__getCacheKey(figureTask)
+            ok = self.__readCachedFigure(figureTask, cacheKey) or self.__layoutFigure(figureTask, cacheKey)
+        except Exception as e:
+            logger.error("dot failed for %s with %s", figureTask["figPath"], str(e))
+            figureTask["layoutError"] = "error"
+        self.__finishFigure(figureTask, ok, cleanup)
+        return ok
+
+    def layoutDegradedNeighborFigure(self, figureTask, cleanup=False):
+        """Lay out a simplified form of a figure task that could not be laid out within the layout limits.
+
+        Fewer items and related categories are depicted in turn until a layout succeeds, and SVG figures are
+        finally rendered in full by the built-in renderer (NeighborFigureRenderer).
+
+        Returns:
+            (bool, str): status and a description of the simplification of the figure (None on failure)
+        """
+        dotText = figureTask["dotText"]
+        for degradation, optionD in _figureDegradationList:
+            if optionD is None:
+                if figureTask["figFormat"] != "svg":
+                    continue
+                ok = self.__layoutPython(figureTask, None)
+                self.__finishFigure(figureTask, ok, cleanup)
+            else:
+                kwD = dict(figureTask["options"])
+                for ky, val in optionD.items():
+                    kwD[ky] = min(val, kwD[ky]) if kwD[ky] else val
+                degradedTask = self.makeNeighborFigureDot(**kwD)
+                # skip simplifications that do not change the figure -
+                if not degradedTask or degradedTask["dotText"] == dotText:
+                    continue
+                dotText = degradedTask["dotText"]
+                ok = self.layoutNeighborFigure(degradedTask, cleanup=cleanup)
+            if ok:
+                logger.warning("Laid out %s with simplification %s", figureTask["figPath"], degradation)
+                return True, degradation
+        return False, None
+
+    def __splitFigureStream(self, data):
+        """Split the concatenated SVG documents output by a dot process into a list of documents."""
+        figL = []
+        marker = b"</svg>"
+        ii = 0
+        while True:
+            jj = data.find(marker, ii)
+            if jj < 0:
+                break
+            jj += len(marker)
+            if data[jj : jj + 1] == b"\n":
+                jj += 1
+            figL.append(data[ii:jj])
+            ii = jj
+        return figL
+
+    def __writeStream(self, ofh, data):
+        try:
+            ofh.write(data)
+            ofh.close()
+        except (IOError, OSError):
+            pass
+
+    def __readStream(self, ifh, streamName, chunkQueue):
+        for chunk in iter(lambda: ifh.read1(65536), b""):
+            chunkQueue.put((streamName, chunk))
+        chunkQueue.put((streamName, None))
+
+    def __streamDot(self, dotText, size):
+        """Run the dot executable on a stream of graphs and return the list of SVG documents output, the exit status
+        (None if the process was stopped) and the error output.  The process is stopped when the next document is not
+        completed within the layout time limit.
+        """
+        proc = subprocess.Popen(self.__getDotCommand("svg", size), stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE, preexec_fn=self.__getDotPreexec())
+        chunkQueue = queue.Queue()
+        threadList = [
+            threading.Thread(target=self.__writeStream, args=(proc.stdin, dotText.encode("utf-8"))),
+            threading.Thread(target=self.__readStream, args=(proc.stdout, "out", chunkQueue)),
+            threading.Thread(target=self.__readStream, args=(proc.stderr, "err", chunkQueue)),
+        ]
+        for thr in threadList:
+            thr.daemon = True
+            thr.start()
         #
-        # Remove any failed image files --
-        if ok != 0:
-            logger.debug("status %s for %s", ok, svgfn)
-            cmd = "rm -f  %s" % svgfn
-            os.system(cmd)
+        figL = []
+        errL = []
+        data = b""
+        numOpen = 2
+        stopped = False
+        deadline = time.monotonic() + self.__layoutTimeout if self.__layoutTimeout else None
+        while numOpen:
+            try:
+                streamName, chunk = chunkQueue.get(timeout=max(0.0, deadline - time.monotonic()) if deadline else None)
+            except queue.Empty:
+                proc.kill()
+                stopped = True
+                break
+            if chunk is None:
+                numOpen -= 1
+            elif streamName == "err":
+                errL.append(chunk)
+            else:
+                data += chunk
+                docL = self.__splitFigureStream(data)
+                # wait for the end of line following the last document -
+                if docL and not docL[-1].endswith(b"\n"):
+                    docL.pop()
+                if docL:
+                    figL.extend(docL)
+                    data = data[sum([len(doc) for doc in docL]) :]
+                    if deadline:
+                        deadline = time.monotonic() + self.__layoutTimeout
+        if not stopped:
+            figL.extend(self.__splitFigureStream(data))
+        proc.wait()
+        for thr in threadList:
+            thr.join()
+        proc.stdout.close()
+        proc.stderr.close()
+        return figL, None if stopped else proc.returncode, b"".join(errL).decode("utf-8", "replace").strip()
+
+    def __layoutBinaryBatch(self, figureTaskList, cacheKeyList):
+        """Lay out SVG figure tasks of common size as a single multi-graph stream to the dot executable.
+
+        Output documents are assigned to figures in order while their graph titles match.  dot stops at the
+        first graph it cannot read, so a figure without output is laid out alone (to report its error) and
+        the remaining figures are streamed to a new dot process.  A figure exceeding the layout time limit
+        is not retried.
+
+        Returns:
+            list: status for each figure task
+        """
+        statusList = []
+        ii = 0
+        while ii < len(figureTaskList):
+            taskL = figureTaskList[ii:]
+            figL, returnCode, errS = self.__streamDot("\n".join([figureTask["dotText"] for figureTask in taskL]), taskL[0]["size"])
+            numDone = 0
+            for figureTask, data in zip(taskL, figL):
+                if ("<!-- Title: %s " % figureTask["categoryName"]).encode("utf-8") not in data:
+                    break
+                self.__storeFigure(figureTask, data, cacheKeyList[ii + numDone])
+                numDone += 1
+            statusList.extend([True] * numDone)
+            ii += numDone
+            logger.debug("dot batch laid out %d of %d figures with return code %r", numDone, len(taskL), returnCode)
+            if ii < len(figureTaskList):
+                if returnCode is None:
+                    logger.warning("dot layout of %s exceeded the time limit of %r seconds", figureTaskList[ii]["figPath"], self.__layoutTimeout)
+                    figureTaskList[ii]["layoutError"] = "timeout"
+                    statusList.append(False)
+                else:
+                    logger.debug("dot batch stopped with %s", errS[:2000])
+                    statusList.append(self.__layoutBinary(figureTaskList[ii], cacheKeyList[ii]))
+                ii += 1
+        return statusList
+
+    def layoutNeighborFigureBatch(self, figureTaskList, cleanup=False, batchSize=100):
+        """Run the 'dot' layout for a list of figure tasks returned by makeNeighborFigureDot(), streaming up to
+        batchSize SVG figures through each 'dot' process and splitting the output into the figure files.
+
+        Cached figures are reused and, with the Graphviz library backend, figures are laid out in-process
+        as in layoutNeighborFigure().  The layout time limit applies to each figure in a stream and the
+        layoutError of each failed figure task is set as in layoutNeighborFigure().  Tasks may be laid out
+        concurrently as separate batches.
+
+        cleanup        True to remove any 'dot' file after processing
+
+        Returns:
+            list: status for each figure task
+        """
+        statusList = [False] * len(figureTaskList)
+        # Figures for the dot executable grouped by size {size: [(task index, cacheKey), ...]}
+        groupD = {}
+        for ii, figureTask in enumerate(figureTaskList):
+            figureTask["layoutError"] = None
+            try:
+                cacheKey = self.__getCacheKey(figureTask)
+                if self.__readCachedFigure(figureTask, cacheKey):
+                    statusList[ii] = True
+                elif self.__useLibrary or self.__usePython or not self.__pathDot or figureTask["figFormat"] != "svg":
+                    statusList[ii] = self.__layoutFigure(figureTask, cacheKey)
+                else:
+                    groupD.setdefault(figureTask["size"], []).append((ii, cacheKey))
+            except Exception as e:
+                logger.error("dot failed for %s with %s", figureTask["figPath"], str(e))
+                figureTask["layoutError"] = "error"
         #
-        if cleanup:
-            cmd = "rm -f  %s" % dotfn
-            os.system()
+        for gL in groupD.values():
+            for jj in range(0, len(gL), max(1, batchSize)):
+                bL = gL[jj : jj + max(1, batchSize)]
+                try:
+                    sL = self.__layoutBinaryBatch([figureTaskList[ii] for ii, _ in bL], [cacheKey for _, cacheKey in bL])
+                    for (ii, _), ok in zip(bL, sL):
+                        statusList[ii] = ok
+                except Exception as e:
+                    logger.error("dot failed for a batch of %d figures with %s", len(bL), str(e))
+                    for ii, _ in bL:
+                        figureTaskList[ii]["layoutError"] = figureTaskList[ii]["layoutError"] or "error"
         #
-        return ok == 0
+        for figureTask, ok in zip(figureTaskList, statusList):
+            self.__finishFigure(figureTask, ok, cleanup)
+        return statusList
+
+    def makeNeighborFigure(
+        self,
+        categoryName,
+        graphTitle=None,
+        graphSubTitle=None,
+        titleFormat="text",
+        figFormat="svg",
+        size=None,
+        maxItems=20,
+        filterDelivery=False,
+        deliveryType="archive",
+        neighborCategoryList=None,
+        maxCategories=None,
+        cleanup=False,
+        imageFilePath=None,
+    ):
+        """Driver method to create diagrams of data category relationships between the input category and either all
+        of its adjacent neighbors or for selected categories in 'neighborCategoryList'.
+
+        Optionally apply filtering to categories in current use within the archive.
+
+        maxItems       controls target maximum number of attributes in any category object depiction.
+        maxCategories  limits the number of related category objects depicted.
+        cleanup        True to remove any 'dot' file after processing (dot files are only written with keepDot)
+
+        Output files are in SVG format, named and stored in conventional locations for this application.
+
+        """
+        figureTask = self.makeNeighborFigureDot(
+            categoryName,
+            graphTitle=graphTitle,
+            graphSubTitle=graphSubTitle,
+            titleFormat=titleFormat,
+            figFormat=figFormat,
+            size=size,
+            maxItems=maxItems,
+            filterDelivery=filterDelivery,
+            deliveryType=deliveryType,
+            neighborCategoryList=neighborCategoryList,
+            maxCategories=maxCategories,
+            imageFilePath=imageFilePath,
+        )
+        if figureTask is None:
+            return False
+        return self.layoutNeighborFigure(figureTask, cleanup=cleanup)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,367 @@
+##
+# File:    OverviewFigures.py
+# Date:    19-Oct-2026
+# Version: 0.001
+#
+# Updates:
+##
+"""
+Overview depictions of the category relationships of a whole dictionary clustered by category group.
+
+"""
+__docformat__ = "restructuredtext en"
+__author__ = "John Westbrook"
+__email__ = "jwest@rcsb.rutgers.edu"
+__license__ = "Apache 2,0"
+
+import logging
+import math
+import os
+import re
+import subprocess
+from xml.sax.saxutils import escape, quoteattr
+
+from mmcif.sitegen.dictionary.DictionaryRelationshipGraph import DictionaryRelationshipGraph
+from mmcif.sitegen.dictionary.NeighborFigureRenderer import categoryColorD
+from mmcif.sitegen.dictionary.NeighborFigures import _graphvizLibraryLock
+
+try:
+    import pygraphviz
+except ImportError:
+    pygraphviz = None
+
+logger = logging.getLogger(__name__)
+
+_svgRootPattern = re.compile(r"<svg\b([^>]*)>(.*)</svg>", re.DOTALL)
+_svgLengthPattern = re.compile(r"\b(width|height)=\"([\d.]+)(?:pt)?\"")
+_svgViewBoxPattern = re.compile(r"\bviewBox=\"([^\"]*)\"")
+_svgIdPattern = re.compile(r"\bid=\"([^\"]*)\"")
+_svgAnchorIdPattern = re.compile(rb'(id="a_[^"]*_)(\d+)(")')
+
+
+class OverviewFigures(object):
+    """Overview figures of the category relationships of a dictionary clustered by category group.
+
+    The categories of each category group (excluding groups containing other groups, such as 'inclusive_group')
+    and the parent/child relationships between them are laid out by a scalable force directed layout engine
+    (default 'sfdp') as a group figure.  The dictionary overview figure places the group figures as clusters
+    with a layout of the graph of the groups, connected according to the number of category relationships
+    between the categories of each pair of groups.  Categories belonging to several groups are depicted in
+    each of their group clusters.  Categories without a group are collected in a cluster of other categories.
+
+    Each group layout is cached (FigureCache) by its dot instructions, so a change to the categories of one
+    group only repeats the layout of that group and the (small) layout of the graph of groups.
+    """
+
+    def __init__(
+        self,
+        dictApiObj,
+        pathInfoObj=None,
+        pathDot="/usr/local/bin/dot",
+        relationshipGraphObj=None,
+        figureCacheObj=None,
+        svgMinifierObj=None,
+        layoutEngine="sfdp",
+        layoutTimeout=None,
+        verbose=False,
+    ):
+        """Overview figures laid out by the Graphviz library (pygraphviz) when it is installed or otherwise
+        by the dot executable (pathDot) with the input layout engine ('dot -K<layoutEngine>').
+
+        figureCacheObj  figure cache (FigureCache) of the group and overview layouts
+        svgMinifierObj  SVG minifier (SvgMinifier) applied to each figure before it is written
+        layoutTimeout   maximum time (seconds) for each layout by the dot executable (default=None, no limit)
+        """
+        self.__verbose = verbose
+        self.__dApi = dictApiObj
+        self.__rG = relationshipGraphObj if relationshipGraphObj is not None else DictionaryRelationshipGraph(dictApiObj, verbose=verbose)
+        self.__pI = pathInfoObj
+        self.__pathDot = pathDot
+        self.__figureCache = figureCacheObj
+        self.__svgMinifier = svgMinifierObj
+        self.__layoutEngine = layoutEngine
+        self.__layoutTimeout = layoutTimeout
+        self.__useLibrary = pygraphviz is not None
+        self.__engineId = self.__getEngineId() if figureCacheObj is not None else None
+        #
+        self.__fontFace = "helvetica"
+        self.__fontSizeCategory = "10"
+        self.__fontSizeGroup = "14"
+        self.__titleFontSize = "18"
+        self.__clusterMargin = 12.0
+        self.__titleHeight = 36.0
+        # Layouts of the current instance {(dotText, figFormat): text, ...}
+        self.__layoutD = {}
+
+    @staticmethod
+    def getFigureFileName(groupName=None, figFormat="svg"):
+        """Return the conventional file name of the overview figure for the input category group (or the dictionary)."""
+        return (groupName if groupName else "dictionary") + "_overview." + figFormat
+
+    def getClusterList(self):
+        """Return the list of category clusters [(groupName, [categoryName, ...]), ...] in dictionary group order.
+
+        Categories without a group are collected in a final cluster with groupName None.
+        """
+        clusterList = []
+        groupedSet = set()
+        groupNameList = list(self.__dApi.getCategoryGroups())
+        parentGroupSet = set([self.__dApi.getCategoryGroupParent(groupName) for groupName in groupNameList])
+        for groupName in groupNameList:
+            if groupName in parentGroupSet:
+                continue
+            categoryNameList = sorted(self.__dApi.getCategoryGroupCategories(groupName))
+            if categoryNameList:
+                clusterList.append((groupName, categoryNameList))
+                groupedSet.update(categoryNameList)
+        otherList = sorted(set(self.__dApi.getCategoryList()) - groupedSet)
+        if otherList:
+            clusterList.append((None, otherList))
+        return clusterList
+
+    def __getCategoryGroupD(self, clusterList):
+        """Return the clusters of each category {categoryName: [groupName, ...], ...}"""
+        groupD = {}
+        for groupName, categoryNameList in clusterList:
+            for categoryName in categoryNameList:
+                groupD.setdefault(categoryName, []).append(groupName)
+        return groupD
+
+    def __quote(self, name):
+        return '"%s"' % str(name).replace("\\", "\\\\").replace('"', '\\"')
+
+    def makeGroupDot(self, groupName, categoryNameList, groupD=None):
+        """Return the dot instructions for the figure of the input category group (groupName None for ungrouped categories).
+
+        groupD   the clusters of each category {categoryName: [groupName, ...], ...} used to mark shared categories
+        """
+        categorySet = set(categoryNameList)
+        label = "<b>%s</b>" % escape(groupName if groupName else "other categories")
+        oL = ["digraph %s {" % self.__quote(groupName if groupName else "other_categories")]
+        oL.append("graph [start=1 overlap=vpsc splines=true outputorder=edgesfirst pad=0.2 labelloc=t fontname=%s fontsize=%s" % (self.__fontFace, self.__fontSizeGroup))
+        oL.append("       label=<%s>" % label)
+        if groupName and self.__pI:
+            oL.append("       URL=%s tooltip=%s" % (self.__quote(self.__pI.getGroupUrl(groupName)), self.__quote(groupName)))
+        oL.append("]")
+        oL.append(
+            'node [shape=box style="rounded,filled" color="#606060" fillcolor="%s" fontname=%s fontsize=%s height=0.3 margin="0.08,0.04"]'
+            % (categoryColorD["adjacent"], self.__fontFace, self.__fontSizeCategory)
+        )
+        oL.append('edge [color="#808080" arrowsize=0.6]')
+        for categoryName in categoryNameList:
+            attrL = []
+            if self.__pI:
+                attrL.append("URL=%s" % self.__quote(self.__pI.getCategoryUrl(categoryName)))
+            otherGroupList = [gN for gN in (groupD or {}).get(categoryName, []) if gN and gN != groupName]
+            if otherGroupList:
+                attrL.append('fillcolor="%s"' % categoryColorD["other"])
+                attrL.append("tooltip=%s" % self.__quote("%s (also in %s)" % (categoryName, ", ".join(otherGroupList))))
+            else:
+                attrL.append("tooltip=%s" % self.__quote(categoryName))
+            oL.append("%s [%s]" % (self.__quote(categoryName), " ".join(attrL)))
+        for categoryName in categoryNameList:
+            for parentCategoryName in self.__rG.getParentCategories(categoryName):
+                if parentCategoryName in categorySet and parentCategoryName != categoryName:
+                    oL.append("%s -> %s" % (self.__quote(categoryName), self.__quote(parentCategoryName)))
+        oL.append("}")
+        return "\n".join(oL) + "\n"
+
+    def getGroupEdgeD(self, clusterList):
+        """Return the number of category relationships between the categories of each pair of clusters
+        not sharing a cluster {(groupIndex1, groupIndex2): count, ...} with groupIndex1 < groupIndex2.
+        """
+        indexD = {}
+        for ii, (_, categoryNameList) in enumerate(clusterList):
+            for categoryName in categoryNameList:
+                indexD.setdefault(categoryName, set()).add(ii)
+        edgeD = {}
+        for categoryName in sorted(indexD):
+            for parentCategoryName in self.__rG.getParentCategories(categoryName):
+                if parentCategoryName not in indexD or indexD[categoryName] & indexD[parentCategoryName]:
+                    continue
+                for i1 in indexD[categoryName]:
+                    for i2 in indexD[parentCategoryName]:
+                        ky = (min(i1, i2), max(i1, i2))
+                        edgeD[ky] = edgeD.get(ky, 0) + 1
+        return edgeD
+
+    def __makeClusterGraphDot(self, sizeList, edgeD):
+        """Return the dot instructions for the layout of the clusters as fixed size nodes (sizes in points)."""
+        oL = ["graph clusters {", "graph [start=1 overlap=vpsc splines=false sep=%s]" % self.__quote("+%g" % (self.__clusterMargin / 2.0)), "node [shape=box fixedsize=true label=\"\"]"]
+        for ii, (width, height) in enumerate(sizeList):
+            oL.append("c%d [width=%.3f height=%.3f]" % (ii, (width + self.__clusterMargin) / 72.0, (height + self.__clusterMargin) / 72.0))
+        for (i1, i2), count in sorted(edgeD.items()):
+            oL.append("c%d -- c%d [weight=%d]" % (i1, i2, count))
+        oL.append("}")
+        return "\n".join(oL) + "\n"
+
+    def __getEngineId(self):
+        """Return an identifier for the layout program, engine and version used in figure cache keys."""
+        if self.__useLibrary:
+            gv = pygraphviz.graphviz
+            return "pygraphviz %s graphviz version %d.%d.%d %s" % (
+                pygraphviz.__version__,
+                gv.GRAPHVIZ_MAJOR_VERSION,
+                gv.GRAPHVIZ_MINOR_VERSION,
+                gv.GRAPHVIZ_PATCH_VERSION,
+                self.__layoutEngine,
+            )
+        try:
+            proc = subprocess.run([self.__pathDot, "-V"], stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=False)
+            return "%s %s" % ((proc.stderr or proc.stdout).decode("utf-8", "replace").strip(), self.__layoutEngine)
+        except Exception as e:
+            logger.debug("Failing for %r with %s", self.__pathDot, str(e))
+        return None
+
+    def __normalizeFigure(self, data):
+        """Renumber SVG anchor ids in document order (see NeighborFigures)."""
+        idD = {}
+        return _svgAnchorIdPattern.sub(lambda m: m.group(1) + str(idD.setdefault(m.group(2), len(idD))).encode("ascii") + m.group(3), data)
+
+    def __runLayout(self, dotText, figFormat):
+        """Return the output (bytes) of the layout of the input dot instructions or None on failure."""
+        if self.__useLibrary:
+            try:
+                with _graphvizLibraryLock:
+                    aG = pygraphviz.AGraph(string=dotText)
+                    return aG.draw(format=figFormat, prog=self.__layoutEngine)
+            except Exception as e:
+                logger.error("Graphviz library %s layout failed with %s", self.__layoutEngine, str(e))
+            return None
+        if not self.__pathDot:
+            logger.error("Graphviz dot is not available for %s layouts", self.__layoutEngine)
+            return None
+        cmdL = [self.__pathDot, "-K%s" % self.__layoutEngine, "-T%s" % figFormat]
+        try:
+            proc = subprocess.run(cmdL, input=dotText.encode("utf-8"), stdout=subprocess.PIPE, stderr=subprocess.PIPE, timeout=self.__layoutTimeout, check=False)
+        except subprocess.TimeoutExpired:
+            logger.error("%s layout exceeded the time limit of %r seconds", self.__layoutEngine, self.__layoutTimeout)
+            return None
+        if proc.returncode == 0 and proc.stdout:
+            return proc.stdout
+        logger.error("dot -K%s failed with return code %r: %s", self.__layoutEngine, proc.returncode, proc.stderr.decode("utf-8", "replace").strip()[:2000])
+        return None
+
+    def __layout(self, dotText, figFormat):
+        """Return the text of the layout of the input dot instructions using and updating the figure cache, or None on failure."""
+        if (dotText, figFormat) in self.__layoutD:
+            return self.__layoutD[(dotText, figFormat)]
+        cacheKey = self.__figureCache.getKey(dotText, figFormat=figFormat, size=None, engine=self.__engineId) if self.__figureCache is not None and self.__engineId else None
+        data = self.__figureCache.get(cacheKey, figFormat=figFormat) if cacheKey else None
+        if not data:
+            data = self.__runLayout(dotText, figFormat)
+            if not data:
+                return None
+            if figFormat == "svg":
+                data = self.__normalizeFigure(data)
+            if cacheKey:
+                self.__figureCache.put(cacheKey, data, figFormat=figFormat)
+        self.__layoutD[(dotText, figFormat)] = data.decode("utf-8")
+        return self.__layoutD[(dotText, figFormat)]
+
+    def __writeFigure(self, figPath, svgText):
+        data = svgText.encode("utf-8")
+        if self.__svgMinifier is not None:
+            baseUrl = self.__pI.getDictOverviewImageDirUrl() if self.__pI else None
+            data = self.__svgMinifier.minify(data, baseUrl=baseUrl)
+        tmpfn = figPath + ".tmp"
+        with open(tmpfn, "wb") as ofh:
+            ofh.write(data)
+        os.replace(tmpfn, figPath)
+
+    def __parseSvg(self, svgText):
+        """Return the width, height (points), viewBox and content of an SVG document."""
+        mObj = _svgRootPattern.search(svgText)
+        attributeText, content = mObj.group(1), mObj.group(2)
+        sizeD = {name: float(value) for name, value in _svgLengthPattern.findall(attributeText)}
+        vObj = _svgViewBoxPattern.search(attributeText)
+        viewBox = vObj.group(1) if vObj else "0 0 %g %g" % (sizeD["width"], sizeD["height"])
+        return sizeD["width"], sizeD["height"], viewBox, content
+
+    def __composeOverview(self, clusterList, svgList, edgeD, plainText, graphTitle):
+        """Return the SVG document placing the input cluster figures according to the layout (plain format) of the clusters."""
+        svgRecordList = [self.__parseSvg(svgText) for svgText in svgList]
+        positionD = {}
+        graphWidth = graphHeight = 0.0
+        for line in plainText.splitlines():
+            fL = line.split()
+            if fL and fL[0] == "graph":
+                graphWidth, graphHeight = float(fL[2]) * 72.0, float(fL[3]) * 72.0
+            elif fL and fL[0] == "node":
+                positionD[int(fL[1][1:])] = (float(fL[2]) * 72.0, graphHeight - float(fL[3]) * 72.0)
+        margin = self.__clusterMargin
+        top = self.__titleHeight if graphTitle else 0.0
+        width, height = graphWidth + 2 * margin, graphHeight + top + 2 * margin
+        #
+        oL = ['<?xml version="1.0" encoding="UTF-8" standalone="no"?>']
+        oL.append("<!-- Title: overview Pages: 1 -->")
+        oL.append(
+            '<svg width="%.0fpt" height="%.0fpt" viewBox="0.00 0.00 %.2f %.2f" xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink">'
+            % (width, height, width, height)
+        )
+        oL.append('<polygon fill="white" stroke="none" points="0,0 %.2f,0 %.2f,%.2f 0,%.2f"/>' % (width, width, height, height))
+        if graphTitle:
+            oL.append(
+                '<text text-anchor="middle" x="%.2f" y="%.2f" font-family="%s" font-size="%s">%s</text>'
+                % (width / 2.0, margin + 18.0, self.__fontFace, self.__titleFontSize, escape(graphTitle))
+            )
+        # Relationships between groups are drawn below the clusters -
+        for (i1, i2), count in sorted(edgeD.items()):
+            (x1, y1), (x2, y2) = positionD[i1], positionD[i2]
+            titleText = "%s - %s (%d relationships)" % (clusterList[i1][0] or "other categories", clusterList[i2][0] or "other categories", count)
+            oL.append(
+                '<g class="edge"><title>%s</title><line x1="%.2f" y1="%.2f" x2="%.2f" y2="%.2f" stroke="#a0a0a0" stroke-width="%.1f"/></g>'
+                % (escape(titleText), x1 + margin, y1 + margin + top, x2 + margin, y2 + margin + top, 1.0 + math.log(count, 2))
+            )
+        for ii, (clusterWidth, clusterHeight, viewBox, content) in enumerate(svgRecordList):
+            x, y = positionD[ii]
+            x, y = x + margin - clusterWidth / 2.0, y + margin + top - clusterHeight / 2.0
+            groupName = clusterList[ii][0] or "other categories"
+            content = _svgIdPattern.sub(lambda m, ii=ii: 'id="c%d_%s"' % (ii, m.group(1)), content)
+            oL.append('<g class="cluster" id=%s>' % quoteattr("cluster_%d" % ii))
+            oL.append("<title>%s</title>" % escape(groupName))
+            oL.append('<rect x="%.2f" y="%.2f" width="%.2f" height="%.2f" rx="6" ry="6" fill="white" stroke="#c0c0c0"/>' % (x, y, clusterWidth, clusterHeight))
+            oL.append('<svg x="%.2f" y="%.2f" width="%.2f" height="%.2f" viewBox="%s">%s</svg>' % (x, y, clusterWidth, clusterHeight, viewBox, content))
+            oL.append("</g>")
+        oL.append("</svg>")
+        return "\n".join(oL) + "\n"
+
+    def makeOverviewFigures(self, imageFilePath=None, graphTitle=None, groupFigures=True):
+        """Lay out and write the figure of each category group and the dictionary overview figure.
+
+        imageFilePath   output directory (default: the dictionary overview image directory of the path information object)
+        graphTitle      title of the dictionary overview figure
+        groupFigures    True to also write the figure of each category group
+
+        Returns:
+            dict: status of each figure {groupName: bool, ..., None: bool} with None for the dictionary overview figure
+        """
+        statusD = {}
+        try:
+            imageFilePath = imageFilePath if imageFilePath else self.__pI.getDictOverviewImagePath()
+            if not os.access(imageFilePath, os.W_OK):
+                os.makedirs(imageFilePath, 0o755)
+            clusterList = self.getClusterList()
+            groupD = self.__getCategoryGroupD(clusterList)
+            svgList = []
+            for groupName, categoryNameList in clusterList:
+                svgText = self.__layout(self.makeGroupDot(groupName, categoryNameList, groupD=groupD), "svg")
+                svgList.append(svgText)
+                if groupName and groupFigures:
+                    statusD[groupName] = svgText is not None
+                    if svgText:
+                        self.__writeFigure(os.path.join(imageFilePath, self.getFigureFileName(groupName)), svgText)
+            #
+            statusD[None] = False
+            if clusterList and all(svgList):
+                edgeD = self.getGroupEdgeD(clusterList)
+                sizeList = [self.__parseSvg(svgText)[:2] for svgText in svgList]
+                plainText = self.__layout(self.__makeClusterGraphDot(sizeList, edgeD), "plain")
+                if plainText:
+                    self.__writeFigure(os.path.join(imageFilePath, self.getFigureFileName()), self.__composeOverview(clusterList, svgList, edgeD, plainText, graphTitle))
+                    statusD[None] = True
+            else:
+                logger.error("Skipping the overview figure with %d of %d group layouts failing", len([svgText for svgText in svgList if not svgText]), len(clusterList))
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+        return statusD
@@ -0,0 +1,99 @@
+##
+# File:    PageManifest.py
+# Date:    19-Oct-2026
+# Version: 0.001
+#
+# Updates:
+##
+"""
+Manifest of the input fingerprints of the pages rendered for a dictionary.
+
+"""
+__docformat__ = "restructuredtext en"
+__author__ = "John Westbrook"
+__email__ = "jwest@rcsb.rutgers.edu"
+__license__ = "Apache 2,0"
+
+import logging
+import os
+
+from rcsb.utils.io.MarshalUtil import MarshalUtil
+
+logger = logging.getLogger(__name__)
+
+
+class PageManifest(object):
+    """Record a fingerprint of the inputs of each page rendered for a dictionary for incremental builds.
+
+    Page fingerprints are computed by HtmlContentUtils.getPageFingerprint().  The renderer identifier covers
+    the inputs shared by all pages (e.g. the version of the page templates) and a change of renderer invalidates
+    every page.  The manifest is stored as JSON:
+
+        {"version": 1, "renderer": ..., "pages": {contentType: {contentObjName: fingerprint, ...}, ...}}
+    """
+
+    def __init__(self, manifestPath, verbose=False):
+        self.__verbose = verbose
+        self.__manifestPath = manifestPath
+        self.__rendererId = None
+        self.__pageD = {}
+
+    def read(self):
+        """Read the manifest file.  Returns False if the manifest is missing or cannot be read."""
+        self.clear()
+        if not os.access(self.__manifestPath, os.R_OK):
+            logger.debug("No page manifest at %s", self.__manifestPath)
+            return False
+        try:
+            mU = MarshalUtil()
+            obj = mU.doImport(self.__manifestPath, fmt="json")
+            self.__rendererId = obj["renderer"]
+            self.__pageD = obj["pages"]
+            return True
+        except Exception as e:
+            logger.exception("Failing for %r with %s", self.__manifestPath, str(e))
+        return False
+
+    def write(self):
+        try:
+            mU = MarshalUtil()
+            return mU.doExport(self.__manifestPath, {"version": 1, "renderer": self.__rendererId, "pages": self.__pageD}, fmt="json", indent=1)
+        except Exception as e:
+            logger.exception("Failing for %r with %s", self.__manifestPath, str(e))
+        return False
+
+    def remove(self):
+        """Remove the manifest file so that the next incremental build renders every page."""
+        try:
+            if os.path.exists(self.__manifestPath):
+                os.remove(self.__manifestPath)
+            return True
+        except Exception as e:
+            logger.error("Failing for %r with %s", self.__manifestPath, str(e))
+        return False
+
+    def clear(self):
+        self.__rendererId = None
+        self.__pageD = {}
+
+    def getRendererId(self):
+        return self.__rendererId
+
+    def setRendererId(self, rendererId):
+        self.__rendererId = rendererId
+
+    def getFingerprint(self, contentObjName, contentType):
+        """Return the recorded fingerprint of the input page or None."""
+        return self.__pageD.get(contentType, {}).get(contentObjName)
+
+    def setFingerprint(self, contentObjName, contentType, fingerprint):
+        self.__pageD.setdefault(contentType, {})[contentObjName] = fingerprint
+
+    def removePage(self, contentObjName, contentType):
+        self.__pageD.get(contentType, {}).pop(contentObjName, None)
+
+    def getPageNameList(self, contentType):
+        return list(self.__pageD.get(contentType, {}).keys())
+
+    def getPageCount(self):
+        return sum([len(pD) for pD in self.__pageD.values()])
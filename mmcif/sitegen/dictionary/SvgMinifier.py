@@ -0,0 +1,185 @@
+##
+# File:    SvgMinifier.py
+# Date:    18-Oct-2026
+# Version: 0.001
+#
+# Updates:
+#  19-Oct-2026  keep the rounded number memo local to each figure for concurrent minification
+##
+"""
+Post-processing and minification of SVG figures.
+
+"""
+__docformat__ = "restructuredtext en"
+__author__ = "John Westbrook"
+__email__ = "jwest@rcsb.rutgers.edu"
+__license__ = "Apache 2,0"
+
+import hashlib
+import logging
+import posixpath
+import re
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+class SvgMinifier(object):
+    """Reduce the size of SVG figures without changing their depiction or links.
+
+    Comments, the DOCTYPE declaration, the whitespace between elements, unreferenced element ids, identity
+    transforms and the default '<TABLE>' link tooltips of GraphViz HTML labels are removed, coordinates are
+    rounded to the input number of decimal places and combinations of presentation attributes (fill, stroke,
+    font ...) used by more than one element are replaced by classes defined in a single style element.
+
+    Class names are derived from the style declarations so that identical styles have the same class in
+    every figure, and figures may be embedded together in a page.  Site absolute links are optionally
+    rewritten relative to the figure location (only for figures that are not embedded in other pages).
+    Minification may be called concurrently from multiple threads.
+    """
+
+    _commentPattern = re.compile(r"<!--.*?-->", re.DOTALL)
+    _doctypePattern = re.compile(r"<!DOCTYPE[^>]*>\s*", re.DOTALL)
+    _namedEntityPattern = re.compile(r"&(?!(?:lt|gt|amp|quot|apos|#\d+|#x[0-9a-fA-F]+);)")
+    _interTagSpacePattern = re.compile(r">\s*\n\s*<")
+    _tagPattern = re.compile(r"<([A-Za-z][\w:.-]*)((?:\s+[\w:.-]+=\"[^\"]*\")*)\s*(/?)>")
+    _attributePattern = re.compile(r"([\w:.-]+)=\"([^\"]*)\"")
+    _styleValuePattern = re.compile(r"^[\w#.,%\- ]+$")
+    _idReferencePattern = re.compile(r"(?:url\(#|href=\"#)([^)\"]+)")
+    _identityTransformPattern = re.compile(r"\s*(?:scale\(1(?: 1)?\)|rotate\(0\))")
+    #
+    _numericAttributeList = ["points", "d", "x", "y", "cx", "cy", "rx", "ry", "x1", "x2", "y1", "y2", "width", "height", "viewBox", "transform", "font-size", "stroke-width"]
+    _styleAttributeList = ["fill", "stroke", "stroke-width", "font-family", "font-size", "font-weight", "font-style", "text-anchor"]
+    _lengthAttributeList = ["font-size", "stroke-width"]
+
+    def __init__(self, precision=1, minCount=2, relativeLinks=False, verbose=False):
+        """SVG figure minifier.
+
+        precision       number of decimal places retained for coordinates and sizes
+        minCount        minimum number of elements sharing a combination of presentation attributes to define a class
+        relativeLinks   rewrite site absolute links relative to the figure URL directory (see minify())
+        """
+        self.__verbose = verbose
+        self.__precision = precision
+        self.__minCount = minCount
+        self.__relativeLinks = relativeLinks
+        # numbers with more than the retained decimal places -
+        self.__numberPattern = re.compile(r"-?\d*\.\d{%d,}" % (precision + 1))
+        self.__lock = threading.Lock()
+        self.__statsD = {"figures": 0, "bytesIn": 0, "bytesOut": 0}
+
+    def getId(self):
+        """Return an identifier for the minifier options (e.g. for figure cache keys)."""
+        return "SvgMinifier precision=%d minCount=%d relativeLinks=%r" % (self.__precision, self.__minCount, self.__relativeLinks)
+
+    def __roundNumber(self, numS, numberD):
+        """Return the input number text rounded to the retained decimal places using the input memo {numS: rounded, ...}"""
+        if numS not in numberD:
+            val = "%.*f" % (self.__precision, round(float(numS), self.__precision))
+            if "." in val:
+                val = val.rstrip("0").rstrip(".")
+            numberD[numS] = "0" if val in ["-0", ""] else val
+        return numberD[numS]
+
+    def __parseTag(self, mObj, idSet, baseUrl, numberD):
+        """Return the element name, attribute list [(name, value), ...], empty element flag and presentation style of a start tag."""
+        attributeList = []
+        for name, value in self._attributePattern.findall(mObj.group(2)):
+            if (name == "id" and value not in idSet) or (name == "xlink:title" and value == "&lt;TABLE&gt;"):
+                continue
+            if name == "transform":
+                value = self._identityTransformPattern.sub("", value).strip()
+                if not value:
+                    continue
+            if name in self._numericAttributeList:
+                value = self.__numberPattern.sub(lambda nObj: self.__roundNumber(nObj.group(0), numberD), value)
+            elif baseUrl and name in ["href", "xlink:href"] and value.startswith("/") and not value.startswith("//"):
+                value = posixpath.relpath(value, baseUrl)
+            attributeList.append((name, value))
+        elementName = mObj.group(1)
+        style = None if elementName == "svg" or any([name == "class" for name, _ in attributeList]) else self.__getStyle(attributeList)
+        return elementName, attributeList, mObj.group(3) == "/", style
+
+    def __getStyle(self, attributeList):
+        """Return the CSS declarations for the presentation attributes in the input attribute list or None."""
+        declL = []
+        for name, value in attributeList:
+            if name in self._styleAttributeList:
+                if not self._styleValuePattern.match(value):
+                    return None
+                if name in self._lengthAttributeList and not value.endswith(("px", "pt", "%", "em")):
+                    value += "px"
+                declL.append("%s:%s" % (name, value))
+        return ";".join(declL) if declL else None
+
+    def __getClassName(self, style):
+        return "s" + hashlib.sha1(style.encode("utf-8")).hexdigest()[:6]
+
+    def __formatTag(self, elementName, attributeList, isEmpty, className=None):
+        """Return a start tag replacing any presentation attributes with the input class."""
+        oL = [elementName]
+        for name, value in attributeList:
+            if className and name in self._styleAttributeList:
+                # the class takes the place of the first presentation attribute -
+                if 'class="%s"' % className not in oL:
+                    oL.append('class="%s"' % className)
+                continue
+            oL.append('%s="%s"' % (name, value))
+        return "<%s%s>" % (" ".join(oL), "/" if isEmpty else "")
+
+    def minifyText(self, svgText, baseUrl=None):
+        """Return the minified text of the input SVG document."""
+        svgText = self._commentPattern.sub("", svgText)
+        if not self._namedEntityPattern.search(svgText):
+            svgText = self._doctypePattern.sub("", svgText)
+        svgText = self._interTagSpacePattern.sub("><", svgText)
+        #
+        idSet = set(self._idReferencePattern.findall(svgText))
+        baseUrl = baseUrl if self.__relativeLinks else None
+        # rounded numbers for this figure (not shared by concurrent calls) -
+        numberD = {}
+        tagList = [(mObj, self.__parseTag(mObj, idSet, baseUrl, numberD)) for mObj in self._tagPattern.finditer(svgText)]
+        styleCountD = {}
+        for _, (_, _, _, style) in tagList:
+            if style:
+                styleCountD[style] = styleCountD.get(style, 0) + 1
+        classD = {}
+        for style, count in styleCountD.items():
+            if count >= self.__minCount:
+                classD[style] = self.__getClassName(style)
+        #
+        oL = []
+        ii = 0
+        for mObj, (elementName, attributeList, isEmpty, style) in tagList:
+            oL.append(svgText[ii : mObj.start()])
+            ii = mObj.end()
+            if elementName == "svg":
+                oL.append(self.__formatTag(elementName, attributeList, isEmpty))
+                if classD and not isEmpty:
+                    oL.append("<style>%s</style>" % "".join([".%s{%s}" % (className, style) for style, className in classD.items()]))
+                continue
+            oL.append(self.__formatTag(elementName, attributeList, isEmpty, className=classD.get(style)))
+        oL.append(svgText[ii:])
+        return "".join(oL)
+
+    def minify(self, data, baseUrl=None):
+        """Return the minified SVG document (bytes) for the input SVG document (bytes) and update statistics.
+
+        baseUrl     URL directory of the figure (e.g. /dictionaries/<dictionary>/Images/Categories) used to
+                    rewrite links with the relativeLinks option
+        """
+        try:
+            minData = self.minifyText(data.decode("utf-8"), baseUrl=baseUrl).encode("utf-8")
+        except Exception as e:
+            logger.error("Failing to minify SVG figure with %s", str(e))
+            minData = data
+        with self.__lock:
+            self.__statsD["figures"] += 1
+            self.__statsD["bytesIn"] += len(data)
+            self.__statsD["bytesOut"] += len(minData)
+        return minData
+
+    def getStats(self):
+        """Return minification statistics {"figures", "bytesIn", "bytesOut"} for this instance."""
+        with self.__lock:
+            return dict(self.__statsD)
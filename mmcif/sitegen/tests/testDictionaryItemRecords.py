@@ -0,0 +1,148 @@
+##
+# File: testDictionaryItemRecords.py
+# Date:    18-Oct-2026
+# Version: 0.001
+#
+# Update:
+##
+"""
+Tests for single-walk dictionary item record extraction.
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "John Westbrook"
+__email__ = "jwest@rcsb.rutgers.edu"
+__license__ = "Apache 2.0"
+
+import logging
+import os
+import time
+import unittest
+
+from mmcif.api.PdbxContainers import CifName
+
+from mmcif.sitegen.dictionary.DictionaryFileUtils import DictionaryFileUtils
+from mmcif.sitegen.dictionary.DictionaryItemRecords import DictionaryItemRecords
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s]-%(module)s.%(funcName)s: %(message)s")
+logger = logging.getLogger()
+logger.setLevel(logging.INFO)
+
+HERE = os.path.abspath(os.path.dirname(__file__))
+TOPDIR = os.path.dirname(os.path.dirname(os.path.dirname(HERE)))
+
+
+class DictionaryItemRecordsTests(unittest.TestCase):
+    def setUp(self):
+        #
+        self.__testData = os.path.join(HERE, "test-data")
+        self.__pdbxDictPath = os.path.join(self.__testData, "dictionaries", "mmcif_pdbx_v40.dic")
+        self.__startTime = time.time()
+        logger.info("Starting %s at %s", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+
+    def tearDown(self):
+        endTime = time.time()
+        logger.info("Completed %s at %s (%.4f seconds)", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()), endTime - self.__startTime)
+
+    def __getReferenceValues(self, dApi, itemName):
+        """Item attributes fetched with the individual API calls used previously for item pages."""
+        cN = CifName.categoryPart(itemName)
+        aN = CifName.attributePart(itemName)
+        parentList = dApi.getFullParentList(cN, aN, stripSelfParent=True)
+        return {
+            "mandatoryCode": dApi.getMandatoryCode(cN, aN),
+            "mandatoryCodeAlt": dApi.getMandatoryCodeAlt(cN, aN, fallBack=False),
+            "description": dApi.getDescription(cN, aN),
+            "descriptionAlt": dApi.getDescriptionAlt(cN, aN, fallBack=False),
+            "exampleList": dApi.getExampleList(cN, aN),
+            "exampleListAlt": dApi.getExampleListAlt(cN, aN, fallBack=False),
+            "context": dApi.getContextList(cN, aN),
+            "typeCode": dApi.getTypeCode(cN, aN),
+            "typePrimitive": dApi.getTypePrimitive(cN, aN),
+            "typeRegex": dApi.getTypeRegex(cN, aN),
+            "typeDetail": dApi.getTypeDetail(cN, aN),
+            "typeCodeAlt": dApi.getTypeCodeAlt(cN, aN, fallBack=False),
+            "typeRegexAlt": dApi.getTypeRegexAlt(cN, aN, fallBack=False),
+            "defaultValue": dApi.getDefaultValue(cN, aN),
+            "units": dApi.getUnits(cN, aN),
+            "enumClosedFlag": dApi.getEnumerationClosedFlag(cN, aN),
+            "enumListWithDetail": dApi.getEnumListWithDetail(cN, aN),
+            "enumListAltWithDetail": dApi.getEnumListAltWithDetail(cN, aN),
+            "boundaryList": dApi.getBoundaryList(cN, aN),
+            "boundaryListAlt": dApi.getBoundaryListAlt(cN, aN, fallBack=False),
+            "parentList": parentList,
+            "ultimateParent": dApi.getUltimateParent(cN, aN) if parentList else None,
+            "childList": dApi.getFullChildList(cN, aN),
+            "relatedList": dApi.getItemRelatedList(cN, aN),
+            "dependentList": dApi.getItemDependentNameList(cN, aN),
+            "subCategoryList": [(sC, dApi.getSubCategoryDescription(sC)) for sC in dApi.getItemSubCategoryIdList(cN, aN)],
+            "aliasList": dApi.getItemAliasList(cN, aN),
+        }
+
+    def testItemRecords(self):
+        """Compare item records with values from individual API calls"""
+        try:
+            dApi = DictionaryFileUtils(self.__pdbxDictPath).getApi()
+            t0 = time.time()
+            recordD = DictionaryItemRecords(dApi).getRecords()
+            t1 = time.time()
+            self.assertGreater(len(recordD), 2000)
+            for itemName, rD in recordD.items():
+                self.assertEqual(set(rD.keys()), set(DictionaryItemRecords.recordKeys))
+                self.assertEqual(CifName.itemName(rD["categoryName"], rD["attributeName"]), itemName)
+                refD = self.__getReferenceValues(dApi, itemName)
+                for ky, vRef in refD.items():
+                    self.assertEqual(rD[ky], vRef, "%s %s" % (itemName, ky))
+            t2 = time.time()
+            logger.info("Extracted %d item records in %.4f seconds (individual calls %.4f seconds)", len(recordD), t1 - t0, t2 - t1)
+            #
+            rD = recordD["_atom_site.label_asym_id"]
+            self.assertEqual(rD["mandatoryCode"], "yes")
+            self.assertEqual(rD["ultimateParent"], "_struct_asym.id")
+            self.assertIsNone(DictionaryItemRecords(dApi).get("_no_such_category.no_such_item"))
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+    def testItemRecordFailure(self):
+        """Test that an item failing extraction is logged by name without losing the records of other items"""
+        try:
+            dApi = DictionaryFileUtils(self.__pdbxDictPath).getApi()
+            recordD = DictionaryItemRecords(dApi).getRecords()
+            with self.assertLogs(level="ERROR") as cm:
+                failRecordD = DictionaryItemRecords(_BrokenDefinitionApi(dApi, "_entity.id")).getRecords()
+            self.assertEqual(len(cm.records), 1)
+            self.assertIn("_entity.id", cm.records[0].getMessage())
+            self.assertNotIn("_entity.id", failRecordD)
+            self.assertEqual(len(failRecordD), len(recordD) - 1)
+            self.assertEqual(failRecordD["_entity.type"], recordD["_entity.type"])
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+
+class _BrokenDefinitionApi(object):
+    """Dictionary api with an unreadable definition for the input item."""
+
+    def __init__(self, dApi, itemName):
+        self.__dApi = dApi
+        self.__definitionD = dict(dApi.getDefinitionIndex())
+        self.__definitionD[itemName] = [None]
+
+    def __getattr__(self, name):
+        return getattr(self.__dApi, name)
+
+    def getDefinitionIndex(self):
+        return self.__definitionD
+
+
+def dictItemRecordsSuite():
+    suiteSelect = unittest.TestSuite()
+    suiteSelect.addTest(DictionaryItemRecordsTests("testItemRecords"))
+    suiteSelect.addTest(DictionaryItemRecordsTests("testItemRecordFailure"))
+    return suiteSelect
+
+
+if __name__ == "__main__":
+    mySuite = dictItemRecordsSuite()
+    unittest.TextTestRunner(verbosity=2).run(mySuite)
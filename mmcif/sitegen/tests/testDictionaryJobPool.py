@@ -0,0 +1,102 @@
+##
+# File: testDictionaryJobPool.py
+# Date:    19-Oct-2026
+# Version: 0.001
+#
+# Update:
+##
+"""
+Tests for running per-dictionary workflow jobs in a pool of processes.
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "John Westbrook"
+__email__ = "jwest@rcsb.rutgers.edu"
+__license__ = "Apache 2.0"
+
+import logging
+import multiprocessing
+import os
+import time
+import unittest
+
+from mmcif.sitegen.wf.DictionaryJobPool import DictionaryJobPool
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s]-%(module)s.%(funcName)s: %(message)s")
+logger = logging.getLogger()
+logger.setLevel(logging.INFO)
+
+HERE = os.path.abspath(os.path.dirname(__file__))
+TOPDIR = os.path.dirname(os.path.dirname(os.path.dirname(HERE)))
+
+jobLogger = logging.getLogger("testDictionaryJobPool.job")
+
+
+def countJob(dictName):
+    if dictName == "mmcif_bad":
+        raise ValueError("bad dictionary")
+    jobLogger.info("Running job %s", dictName)
+    return {"dictName": dictName, "count": len(dictName), "pid": os.getpid()}
+
+
+class DictionaryJobPoolTests(unittest.TestCase):
+    def setUp(self):
+        #
+        self.__dictNameList = ["mmcif_ma", "mmcif_pdbx_v40", "mmcif_bad", "mmcif_ddl"]
+        self.__sizeD = {"mmcif_ma": 2, "mmcif_pdbx_v40": 38, "mmcif_ddl": 1}
+        self.__startTime = time.time()
+        logger.info("Starting %s at %s", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+
+    def tearDown(self):
+        endTime = time.time()
+        logger.info("Completed %s at %s (%.4f seconds)", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()), endTime - self.__startTime)
+
+    def testSerialJobs(self):
+        """Test serial jobs run largest dictionary first"""
+        try:
+            with self.assertLogs(level="INFO") as cm:
+                resultD = DictionaryJobPool(numJobs=1).run(countJob, self.__dictNameList, sizeD=self.__sizeD)
+            self.assertEqual(list(resultD.keys()), self.__dictNameList)
+            self.assertIsNone(resultD["mmcif_bad"][0])
+            self.assertEqual(resultD["mmcif_ma"][0]["pid"], os.getpid())
+            jobOrderL = [rec.getMessage().split()[-1] for rec in cm.records if rec.name == jobLogger.name]
+            self.assertEqual(jobOrderL, ["mmcif_pdbx_v40", "mmcif_ma", "mmcif_ddl"])
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+    def testPoolJobs(self):
+        """Test jobs in a process pool return their results and log records to the parent process"""
+        if "fork" not in multiprocessing.get_all_start_methods():
+            self.skipTest("Process fork is not supported")
+        try:
+            with self.assertLogs(level="INFO") as cm:
+                resultD = DictionaryJobPool(numJobs=2).run(countJob, self.__dictNameList, sizeD=self.__sizeD)
+            self.assertEqual(list(resultD.keys()), self.__dictNameList)
+            for dictName, (result, elapsed) in resultD.items():
+                self.assertGreaterEqual(elapsed, 0.0)
+                if dictName == "mmcif_bad":
+                    self.assertIsNone(result)
+                    continue
+                self.assertEqual(result["count"], len(dictName))
+                self.assertNotEqual(result["pid"], os.getpid())
+            jobNameSet = set([rec.getMessage().split()[-1] for rec in cm.records if rec.name == jobLogger.name])
+            self.assertEqual(jobNameSet, set(["mmcif_pdbx_v40", "mmcif_ma", "mmcif_ddl"]))
+            errorL = [rec for rec in cm.records if rec.levelno == logging.ERROR]
+            self.assertEqual(len(errorL), 1)
+            self.assertIn("bad dictionary", errorL[0].exc_text)
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+
+def dictionaryJobPoolSuite():
+    suiteSelect = unittest.TestSuite()
+    suiteSelect.addTest(DictionaryJobPoolTests("testSerialJobs"))
+    suiteSelect.addTest(DictionaryJobPoolTests("testPoolJobs"))
+    return suiteSelect
+
+
+if __name__ == "__main__":
+    mySuite = dictionaryJobPoolSuite()
+    unittest.TextTestRunner(verbosity=2).run(mySuite)
@@ -0,0 +1,170 @@
+##
+# File: testDictionaryRelationshipGraph.py
+# Date:    18-Oct-2026
+# Version: 0.001
+#
+# Update:
+##
+"""
+Tests for the dictionary parent/child relationship graph.
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "John Westbrook"
+__email__ = "jwest@rcsb.rutgers.edu"
+__license__ = "Apache 2.0"
+
+import logging
+import os
+import time
+import unittest
+
+from mmcif.api.PdbxContainers import CifName
+
+from mmcif.sitegen.dictionary.DictionaryFileUtils import DictionaryFileUtils
+from mmcif.sitegen.dictionary.DictionaryRelationshipGraph import DictionaryRelationshipGraph
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s]-%(module)s.%(funcName)s: %(message)s")
+logger = logging.getLogger()
+logger.setLevel(logging.INFO)
+
+HERE = os.path.abspath(os.path.dirname(__file__))
+TOPDIR = os.path.dirname(os.path.dirname(os.path.dirname(HERE)))
+
+
+class DictionaryRelationshipGraphTests(unittest.TestCase):
+    def setUp(self):
+        #
+        self.__testData = os.path.join(HERE, "test-data")
+        self.__pdbxDictPath = os.path.join(self.__testData, "dictionaries", "mmcif_pdbx_v40.dic")
+        self.__pathOutput = os.path.join(HERE, "test-output")
+        self.__startTime = time.time()
+        logger.info("Starting %s at %s", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+
+    def tearDown(self):
+        endTime = time.time()
+        logger.info("Completed %s at %s (%.4f seconds)", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()), endTime - self.__startTime)
+
+    def testRelationshipGraph(self):
+        """Test the relationship graph against the dictionary api relationship methods"""
+        try:
+            dApi = DictionaryFileUtils(dictFilePath=self.__pdbxDictPath).getApi()
+            rG = DictionaryRelationshipGraph(dApi)
+            edgeCount = 0
+            for categoryName in dApi.getCategoryList():
+                parentCategorySet = set()
+                childCategorySet = set()
+                for itemName in dApi.getItemNameList(categoryName):
+                    attributeName = CifName.attributePart(itemName)
+                    parentList = [pName for pName in dApi.getFullParentList(categoryName, attributeName) if pName != itemName]
+                    childList = dApi.getFullChildList(categoryName, attributeName)
+                    self.assertEqual(rG.getParentItems(itemName), parentList)
+                    self.assertEqual(rG.getChildItems(itemName), childList)
+                    self.assertEqual(rG.getUltimateParent(itemName), dApi.getUltimateParent(categoryName, attributeName))
+                    parentCategorySet.update([CifName.categoryPart(pName) for pName in parentList])
+                    childCategorySet.update([CifName.categoryPart(cName) for cName in childList])
+                    edgeCount += len(parentList)
+                self.assertEqual(rG.getParentCategories(categoryName), sorted(parentCategorySet))
+                self.assertEqual(rG.getChildCategories(categoryName), sorted(childCategorySet))
+                self.assertEqual(rG.getAdjacentCategories(categoryName), sorted(parentCategorySet | childCategorySet | set([categoryName])))
+            #
+            self.assertIn("entity", rG.getParentCategories("atom_site"))
+            self.assertIn("atom_site", rG.getChildCategories("entity"))
+            self.assertEqual(rG.getUltimateParent("_atom_site.label_entity_id"), "_entity.id")
+            self.assertIn(("_atom_site.label_entity_id", "_entity.id"), rG.getEdgeList())
+            self.assertGreaterEqual(len(rG.getEdgeList()), edgeCount)
+            self.assertEqual(rG.getParentItems("_not_a_category.item"), [])
+            logger.info("Relationship graph items %d edges %d", rG.getItemCount(), len(rG.getEdgeList()))
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+    def testSelfParentItems(self):
+        """Test that self parents are excluded from the relationship graph without modifying the dictionary api lists"""
+        try:
+            dictPath = os.path.join(self.__pathOutput, "self_parent.dic")
+            if not os.path.exists(self.__pathOutput):
+                os.makedirs(self.__pathOutput)
+            with open(dictPath, "w", encoding="utf-8") as ofh:
+                ofh.write(SELF_PARENT_DICTIONARY)
+            dApi = _SelfParentDictionaryApi(DictionaryFileUtils(dictFilePath=dictPath).getApi())
+            rG = DictionaryRelationshipGraph(dApi)
+            self.assertEqual(rG.getParentItems("_cat_a.id"), [])
+            self.assertEqual(rG.getParentItems("_cat_a.ref_id"), ["_cat_a.id"])
+            self.assertEqual(rG.getChildItems("_cat_a.id"), ["_cat_a.ref_id"])
+            with self.assertNoLogs(level="WARNING"):
+                self.assertEqual(rG.getUltimateParent("_cat_a.id"), "_cat_a.id")
+                self.assertEqual(rG.getUltimateParent("_cat_a.ref_id"), "_cat_a.id")
+            self.assertNotIn(("_cat_a.id", "_cat_a.id"), rG.getEdgeList())
+            self.assertEqual(rG.getParentCategories("cat_a"), ["cat_a"])
+            self.assertEqual(dApi.getFullParentList("cat_a", "id"), ["_cat_a.id"])
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+
+SELF_PARENT_DICTIONARY = """data_self_parent.dic
+    _datablock.id        self_parent.dic
+    _dictionary.title    self_parent.dic
+    _dictionary.version  1.0
+
+save_cat_a
+    _category.description     'Category A.'
+    _category.id              cat_a
+    _category.mandatory_code  no
+    _category_key.name        '_cat_a.id'
+    loop_
+    _category_group.id        'inclusive_group'
+    save_
+
+save__cat_a.id
+    _item_description.description  'Identifier.'
+    _item.name                     '_cat_a.id'
+    _item.category_id              cat_a
+    _item.mandatory_code           yes
+    _item_type.code                code
+    loop_
+    _item_linked.child_name
+    _item_linked.parent_name
+    '_cat_a.id'      '_cat_a.id'
+    '_cat_a.ref_id'  '_cat_a.id'
+    save_
+
+save__cat_a.ref_id
+    _item_description.description  'Reference.'
+    _item.name                     '_cat_a.ref_id'
+    _item.category_id              cat_a
+    _item.mandatory_code           no
+    _item_type.code                code
+    save_
+"""
+
+
+class _SelfParentDictionaryApi(object):
+    """Dictionary api reporting self parents in full parent lists (as the self links in the source dictionary)."""
+
+    def __init__(self, dApi):
+        self.__dApi = dApi
+        self.__fullParentD = {}
+
+    def __getattr__(self, name):
+        return getattr(self.__dApi, name)
+
+    def getFullParentList(self, category, attribute):
+        itemName = CifName.itemName(category, attribute)
+        if itemName not in self.__fullParentD:
+            pL = self.__dApi.getFullParentList(category, attribute)
+            self.__fullParentD[itemName] = [itemName] + pL if itemName == "_cat_a.id" else pL
+        return self.__fullParentD[itemName]
+
+
+def relationshipGraphSuite():
+    suiteSelect = unittest.TestSuite()
+    suiteSelect.addTest(DictionaryRelationshipGraphTests("testRelationshipGraph"))
+    suiteSelect.addTest(DictionaryRelationshipGraphTests("testSelfParentItems"))
+    return suiteSelect
+
+
+if __name__ == "__main__":
+    mySuite = relationshipGraphSuite()
+    unittest.TextTestRunner(verbosity=2).run(mySuite)
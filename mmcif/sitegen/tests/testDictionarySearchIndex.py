@@ -0,0 +1,103 @@
+##
+# File: testDictionarySearchIndex.py
+# Date:    18-Oct-2026
+# Version: 0.001
+#
+# Update:
+##
+"""
+Tests for the static dictionary search index.
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "John Westbrook"
+__email__ = "jwest@rcsb.rutgers.edu"
+__license__ = "Apache 2.0"
+
+import json
+import logging
+import os
+import time
+import unittest
+
+from mmcif.sitegen.dictionary.DictionaryFileUtils import DictionaryFileUtils
+from mmcif.sitegen.dictionary.DictionarySearchIndex import DictionarySearchIndex
+from mmcif.sitegen.dictionary.HtmlPathInfo import HtmlPathInfo
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s]-%(module)s.%(funcName)s: %(message)s")
+logger = logging.getLogger()
+logger.setLevel(logging.INFO)
+
+HERE = os.path.abspath(os.path.dirname(__file__))
+TOPDIR = os.path.dirname(os.path.dirname(os.path.dirname(HERE)))
+
+
+class DictionarySearchIndexTests(unittest.TestCase):
+    def setUp(self):
+        #
+        self.__workPath = os.path.join(HERE, "test-output", "search-index")
+        self.__testData = os.path.join(HERE, "test-data")
+        self.__pdbxDictPath = os.path.join(self.__testData, "dictionaries", "mmcif_pdbx_v40.dic")
+        self.__startTime = time.time()
+        logger.info("Starting %s at %s", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+
+    def tearDown(self):
+        endTime = time.time()
+        logger.info("Completed %s at %s (%.4f seconds)", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()), endTime - self.__startTime)
+
+    def testSearchIndex(self):
+        """Test building and writing the search index"""
+        try:
+            pI = HtmlPathInfo(dictFilePath=self.__pdbxDictPath, htmlDocsPath=self.__workPath, htmlTopDirectoryName="dictionaries")
+            dApi = DictionaryFileUtils(dictFilePath=self.__pdbxDictPath).getApi()
+            dsi = DictionarySearchIndex(dApi, pI)
+            self.assertTrue(dsi.build())
+            docList = dsi.getDocumentList()
+            postingD = dsi.getPostings()
+            self.assertGreater(len(docList), 4000)
+            docIdD = {doc[0]: ii for ii, doc in enumerate(docList)}
+            #
+            docId = docIdD["_atom_site.label_asym_id"]
+            bD = DictionarySearchIndex.fieldBitD
+            self.assertTrue(postingD["atom_site.label_asym_id"][docId] & bD["name"])
+            self.assertTrue(postingD["asym"][docId] & bD["name"])
+            self.assertTrue(postingD["helx_p"][docIdD["_struct_conf_type.id"]] & bD["enumeration"])
+            self.assertNotIn("the", postingD)
+            #
+            self.assertTrue(dsi.write())
+            pth = pI.getDictSearchPath()
+            with open(os.path.join(pth, "meta.json"), "r", encoding="utf-8") as ifh:
+                metaD = json.load(ifh)
+            self.assertEqual(metaD["docCount"], len(docList))
+            self.assertTrue(os.access(os.path.join(pth, "search.js"), os.R_OK))
+            #
+            # Check postings and documents read back from the shard and document chunk files -
+            shardCount = 0
+            for prefix in metaD["shards"]:
+                with open(os.path.join(pth, "shard-%s.json" % prefix), "r", encoding="utf-8") as ifh:
+                    tokenD = json.load(ifh)
+                for tok, pL in tokenD.items():
+                    self.assertEqual(dict(zip(pL[::2], pL[1::2])), postingD[tok])
+                shardCount += len(tokenD)
+            self.assertEqual(shardCount, len(postingD))
+            #
+            docId = docIdD["_atom_site.label_asym_id"]
+            with open(os.path.join(pth, "docs-%d.json" % (docId // metaD["docChunkSize"])), "r", encoding="utf-8") as ifh:
+                doc = json.load(ifh)[docId % metaD["docChunkSize"]]
+            self.assertEqual(doc[0], "_atom_site.label_asym_id")
+            self.assertEqual(metaD["pageUrls"][doc[1]] + doc[0] + ".html", pI.getContentTypeObjUrl("_atom_site.label_asym_id", "Items"))
+            logger.info("Search index documents %d tokens %d shards %d", len(docList), len(postingD), len(metaD["shards"]))
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+
+def searchIndexSuite():
+    suiteSelect = unittest.TestSuite()
+    suiteSelect.addTest(DictionarySearchIndexTests("testSearchIndex"))
+    return suiteSelect
+
+
+if __name__ == "__main__":
+    mySuite = searchIndexSuite()
+    unittest.TextTestRunner(verbosity=2).run(mySuite)
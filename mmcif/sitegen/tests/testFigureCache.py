@@ -0,0 +1,88 @@
+##
+# File: testFigureCache.py
+# Date:    18-Oct-2026
+# Version: 0.001
+#
+# Update:
+##
+"""
+Tests for the content-addressed figure cache.
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "John Westbrook"
+__email__ = "jwest@rcsb.rutgers.edu"
+__license__ = "Apache 2.0"
+
+import concurrent.futures
+import logging
+import os
+import shutil
+import time
+import unittest
+
+from mmcif.sitegen.dictionary.FigureCache import FigureCache
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s]-%(module)s.%(funcName)s: %(message)s")
+logger = logging.getLogger()
+logger.setLevel(logging.INFO)
+
+HERE = os.path.abspath(os.path.dirname(__file__))
+TOPDIR = os.path.dirname(os.path.dirname(os.path.dirname(HERE)))
+
+
+class FigureCacheTests(unittest.TestCase):
+    def setUp(self):
+        #
+        self.__cachePath = os.path.join(HERE, "test-output", "figure-cache")
+        if os.path.exists(self.__cachePath):
+            shutil.rmtree(self.__cachePath)
+        self.__startTime = time.time()
+        logger.info("Starting %s at %s", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+
+    def tearDown(self):
+        endTime = time.time()
+        logger.info("Completed %s at %s (%.4f seconds)", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()), endTime - self.__startTime)
+
+    def testCache(self):
+        """Test figure cache keys, lookups and statistics"""
+        try:
+            dotText = "digraph entity {\nnode [shape=plaintext]\n}"
+            key = FigureCache.getKey(dotText, figFormat="svg", size=None, engine="dot - graphviz version 2.43.0")
+            self.assertEqual(key, FigureCache.getKey(dotText, figFormat="svg", size=None, engine="dot - graphviz version 2.43.0"))
+            otherKeyList = [
+                FigureCache.getKey(dotText + " ", figFormat="svg", size=None, engine="dot - graphviz version 2.43.0"),
+                FigureCache.getKey(dotText, figFormat="png", size=None, engine="dot - graphviz version 2.43.0"),
+                FigureCache.getKey(dotText, figFormat="svg", size=".7,.7", engine="dot - graphviz version 2.43.0"),
+                FigureCache.getKey(dotText, figFormat="svg", size=None, engine="dot - graphviz version 9.0.0"),
+            ]
+            self.assertEqual(len(set(otherKeyList + [key])), 5)
+            #
+            fc = FigureCache(self.__cachePath)
+            self.assertIsNone(fc.get(key))
+            self.assertTrue(fc.put(key, b"<svg/>"))
+            self.assertEqual(fc.get(key), b"<svg/>")
+            self.assertIsNone(fc.get(key, figFormat="png"))
+            #
+            # A new instance reads the persistent cache -
+            fc = FigureCache(self.__cachePath)
+            with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+                resultList = list(executor.map(fc.get, [key] * 20 + otherKeyList))
+            self.assertEqual(resultList[:20], [b"<svg/>"] * 20)
+            self.assertEqual(resultList[20:], [None] * 4)
+            self.assertEqual(fc.getStats(), {"hits": 20, "misses": 4, "stores": 0, "bytesRead": 120, "bytesStored": 0})
+            self.assertEqual(os.listdir(os.path.join(self.__cachePath, key[:2])), [key + ".svg"])
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+
+def figureCacheSuite():
+    suiteSelect = unittest.TestSuite()
+    suiteSelect.addTest(FigureCacheTests("testCache"))
+    return suiteSelect
+
+
+if __name__ == "__main__":
+    mySuite = figureCacheSuite()
+    unittest.TextTestRunner(verbosity=2).run(mySuite)
@@ -0,0 +1,107 @@
+##
+# File: testFigureManifest.py
+# Date:    18-Oct-2026
+# Version: 0.001
+#
+# Update:
+##
+"""
+Tests for the category figure manifest.
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "John Westbrook"
+__email__ = "jwest@rcsb.rutgers.edu"
+__license__ = "Apache 2.0"
+
+import logging
+import os
+import time
+import unittest
+
+from mmcif.sitegen.dictionary.DictionaryFileUtils import DictionaryFileUtils
+from mmcif.sitegen.dictionary.FigureManifest import FigureManifest
+from mmcif.sitegen.dictionary.HtmlContentUtils import HtmlContentUtils
+from mmcif.sitegen.dictionary.HtmlGenerator import HtmlGenerator
+from mmcif.sitegen.dictionary.HtmlPathInfo import HtmlPathInfo
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s]-%(module)s.%(funcName)s: %(message)s")
+logger = logging.getLogger()
+logger.setLevel(logging.INFO)
+
+HERE = os.path.abspath(os.path.dirname(__file__))
+TOPDIR = os.path.dirname(os.path.dirname(os.path.dirname(HERE)))
+
+
+class FigureManifestTests(unittest.TestCase):
+    def setUp(self):
+        #
+        self.__workPath = os.path.join(HERE, "test-output", "figure-manifest")
+        self.__testData = os.path.join(HERE, "test-data")
+        self.__pdbxDictPath = os.path.join(self.__testData, "dictionaries", "mmcif_pdbx_v40.dic")
+        self.__startTime = time.time()
+        logger.info("Starting %s at %s", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+
+    def tearDown(self):
+        endTime = time.time()
+        logger.info("Completed %s at %s (%.4f seconds)", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()), endTime - self.__startTime)
+
+    def __writeFigure(self, pI, categoryName, variant, width, height):
+        filePath = os.path.join(pI.getDictCategoryImagePath(), FigureManifest.getFigureFileName(categoryName, variant))
+        with open(filePath, "w", encoding="utf-8") as ofh:
+            ofh.write('<?xml version="1.0" encoding="UTF-8" standalone="no"?>\n')
+            ofh.write('<svg width="%s" height="%s"\n viewBox="0.00 0.00 10.00 10.00" xmlns="http://www.w3.org/2000/svg">\n' % (width, height))
+            ofh.write("<title>%s %s</title>\n</svg>\n" % (categoryName, variant))
+        return filePath
+
+    def testManifest(self):
+        """Test writing and reading the figure manifest and its use in category pages"""
+        try:
+            pI = HtmlPathInfo(dictFilePath=self.__pdbxDictPath, htmlDocsPath=self.__workPath, htmlTopDirectoryName="dictionaries")
+            self.assertTrue(HtmlGenerator(pathInfoObj=pI).makeDirectories(purge=True))
+            fm = FigureManifest(pI.getDictCategoryImageManifestPath())
+            self.assertFalse(fm.read())
+            for variant in ["full", "archive", "cc"]:
+                fp = self.__writeFigure(pI, "atom_site", variant, "512pt", "226pt")
+                self.assertTrue(fm.addFigure("atom_site", variant, fp))
+            self.assertFalse(fm.addFigure("entity", "full", os.path.join(pI.getDictCategoryImagePath(), "entity_neighbors.svg")))
+            self.assertTrue(fm.write())
+            #
+            fm = FigureManifest(pI.getDictCategoryImageManifestPath())
+            self.assertTrue(fm.read())
+            self.assertEqual(fm.getFigureCount(), 3)
+            fD = fm.getFigure("atom_site", "archive")
+            self.assertEqual(fD["fileName"], "atom_site_neighbors_archive.svg")
+            self.assertEqual((fD["width"], fD["height"]), ("512pt", "226pt"))
+            self.assertEqual(len(fD["hash"]), 40)
+            self.assertIsNone(fm.getFigure("atom_site", "prd"))
+            self.assertIsNone(fm.getFigure("entity", "full"))
+            #
+            # Category pages rendered with the manifest match those from probing the image directory except for the cache-busting URL
+            dApi = DictionaryFileUtils(dictFilePath=self.__pdbxDictPath).getApi()
+            hcU = HtmlContentUtils(dictApiObj=dApi, pathInfoObj=pI)
+            probeS = "\n".join(hcU.makeCategoryPage("atom_site"))
+            hcU.setFigureManifest(fm)
+            manifestS = "\n".join(hcU.makeCategoryPage("atom_site"))
+            imgUrl = os.path.join(pI.getDictCategoryImageDirUrl(), "atom_site_neighbors_cc.svg")
+            self.assertIn(imgUrl, probeS)
+            self.assertIn(imgUrl + "?v=" + fm.getFigure("atom_site", "cc")["hash"][:12], manifestS)
+            for variant in ["full", "archive", "cc"]:
+                fD = fm.getFigure("atom_site", variant)
+                manifestS = manifestS.replace(fD["fileName"] + "?v=" + fD["hash"][:12], fD["fileName"])
+            self.assertEqual(manifestS, probeS)
+            self.assertNotIn("image-modal-bird-1", probeS)
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+
+def figureManifestSuite():
+    suiteSelect = unittest.TestSuite()
+    suiteSelect.addTest(FigureManifestTests("testManifest"))
+    return suiteSelect
+
+
+if __name__ == "__main__":
+    mySuite = figureManifestSuite()
+    unittest.TextTestRunner(verbosity=2).run(mySuite)
@@ -0,0 +1,249 @@
+##
+# File: testHtmlContentUtils.py
+# Date:    18-Oct-2026
+# Version: 0.001
+#
+# Update:
+##
+"""
+Tests for HTML content rendering utilities.
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "John Westbrook"
+__email__ = "jwest@rcsb.rutgers.edu"
+__license__ = "Apache 2.0"
+
+import base64
+import gzip
+import json
+import logging
+import os
+import re
+import time
+import types
+import unittest
+
+from mmcif.sitegen.dictionary.DictionaryFileUtils import DictionaryFileUtils
+from mmcif.sitegen.dictionary.DictionaryItemCoverage import DictionaryItemCoverage
+from mmcif.sitegen.dictionary.FigureManifest import FigureManifest
+from mmcif.sitegen.dictionary.HtmlContentUtils import HtmlContentUtils
+from mmcif.sitegen.dictionary.HtmlGenerator import HtmlGenerator
+from mmcif.sitegen.dictionary.HtmlPathInfo import HtmlPathInfo
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s]-%(module)s.%(funcName)s: %(message)s")
+logger = logging.getLogger()
+logger.setLevel(logging.INFO)
+
+HERE = os.path.abspath(os.path.dirname(__file__))
+TOPDIR = os.path.dirname(os.path.dirname(os.path.dirname(HERE)))
+
+
+class HtmlContentUtilsTests(unittest.TestCase):
+    def setUp(self):
+        #
+        self.__workPath = os.path.join(HERE, "test-output")
+        self.__testData = os.path.join(HERE, "test-data")
+        self.__pdbxDictPath = os.path.join(self.__testData, "dictionaries", "mmcif_pdbx_v40.dic")
+        self.__coveragePath = os.path.join(self.__testData, "coverage")
+        self.__startTime = time.time()
+        logger.info("Starting %s at %s", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+
+    def tearDown(self):
+        endTime = time.time()
+        logger.info("Completed %s at %s (%.4f seconds)", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()), endTime - self.__startTime)
+
+    def __getContentUtils(self):
+        pI = HtmlPathInfo(dictFilePath=self.__pdbxDictPath, htmlDocsPath=self.__workPath, htmlTopDirectoryName="dictionaries")
+        dApi = DictionaryFileUtils(dictFilePath=self.__pdbxDictPath).getApi()
+        return HtmlContentUtils(dictApiObj=dApi, pathInfoObj=pI)
+
+    def testFragmentCache(self):
+        """Test reuse and invalidation of cached link list fragments"""
+        try:
+            hcU = self.__getContentUtils()
+            t0 = time.time()
+            oL1 = hcU.makeItemCategoryAlphaIndex(openFirst=True)
+            t1 = time.time()
+            oL2 = hcU.makeItemCategoryAlphaIndex(openFirst=True)
+            t2 = time.time()
+            self.assertEqual(oL1, oL2)
+            logger.info("Item index rendered in %.4f seconds (cached fragments %.4f seconds)", t1 - t0, t2 - t1)
+            #
+            pL1 = hcU.makeCategoryPage("atom_site")
+            gL1 = hcU.makeCategoryGroupIndex()
+            # Coverage counts change the item and category icons and must invalidate cached fragments -
+            archiveItemNameD = DictionaryItemCoverage(self.__coveragePath).getItemCoverage(deliveryType="archive")
+            hcU.setItemCounts(archiveItemNameD, deliveryType="archive")
+            pL2 = hcU.makeCategoryPage("atom_site")
+            gL2 = hcU.makeCategoryGroupIndex()
+            self.assertNotEqual(pL1, pL2)
+            self.assertNotEqual(gL1, gL2)
+            hcUFresh = self.__getContentUtils()
+            hcUFresh.setItemCounts(archiveItemNameD, deliveryType="archive")
+            self.assertEqual(hcUFresh.makeCategoryPage("atom_site"), pL2)
+            #
+            hcU.clearFragmentCache()
+            self.assertEqual(hcU.makeCategoryPage("atom_site"), pL2)
+            self.assertEqual(hcU.makeCategoryGroupIndex(), gL2)
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+    def __expandLazyIndex(self, pI, shellList, fragmentD, contentType):
+        """Substitute fragments for their placeholders and remove the loader script from a lazy index page."""
+        urlD = {pI.getContentTypeFragmentUrl(fragmentName, contentType): fragmentName for fragmentName in fragmentD}
+        oL = []
+        for line in shellList[: shellList.index("<script>")]:
+            mObj = re.match(r'<div class="lazy-fragment" data-fragment-url="([^"]+)">', line)
+            if mObj:
+                oL.extend(fragmentD[urlD[mObj.group(1)]])
+            else:
+                oL.append(line)
+        return oL
+
+    def testLazyAlphaIndex(self):
+        """Test alphabetical index shells and fragments reproduce the complete index pages"""
+        try:
+            hcU = self.__getContentUtils()
+            pI = HtmlPathInfo(dictFilePath=self.__pdbxDictPath, htmlDocsPath=self.__workPath, htmlTopDirectoryName="dictionaries")
+            for contentType, fullMethod, lazyMethod in [
+                ("Items", hcU.makeItemCategoryAlphaIndex, hcU.makeItemCategoryAlphaIndexLazy),
+                ("Categories", hcU.makeCategoryAlphaIndex, hcU.makeCategoryAlphaIndexLazy),
+            ]:
+                fullList = fullMethod(openFirst=True)
+                shellList, fragments = lazyMethod(openFirst=True)
+                self.assertIsInstance(fragments, types.GeneratorType)
+                fragmentD = dict(fragments)
+                self.assertGreater(len(fragmentD), 5)
+                self.assertEqual(self.__expandLazyIndex(pI, shellList, fragmentD, contentType), fullList)
+                fullSize = len("\n".join(fullList))
+                shellSize = len("\n".join(shellList))
+                logger.info("%s index size %d shell size %d fragments %d", contentType, fullSize, shellSize, len(fragmentD))
+                self.assertLess(shellSize, fullSize)
+                if contentType == "Items":
+                    self.assertLess(shellSize * 50, fullSize)
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+    def testStreamedPage(self):
+        """Test streamed pages match written pages and failed or incomplete streamed pages are removed"""
+        try:
+            hcU = self.__getContentUtils()
+            pI = HtmlPathInfo(dictFilePath=self.__pdbxDictPath, htmlDocsPath=os.path.join(self.__workPath, "streamed-page"), htmlTopDirectoryName="dictionaries")
+            hg = HtmlGenerator(pathInfoObj=pI)
+            hg.makeDirectories(purge=True)
+            filePath = pI.getContentTypeObjPath("index", "Categories")
+            self.assertTrue(hg.writeHtmlFile("index", title="Category Index", subTitle="Test", contentType="Categories", htmlContentList=hcU.makeCategoryAlphaIndex()))
+            with open(filePath, "r", encoding="utf-8") as ifh:
+                writtenS = ifh.read()
+            os.remove(filePath)
+            with hg.htmlFile("index", title="Category Index", subTitle="Test", contentType="Categories") as ofh:
+                self.assertIsNotNone(ofh)
+                hcU.makeCategoryAlphaIndex(outputStream=ofh)
+            with open(filePath, "r", encoding="utf-8") as ifh:
+                self.assertEqual(ifh.read(), writtenS)
+            #
+            with self.assertRaises(ValueError):
+                with hg.htmlFile("index", title="Category Index", subTitle="Test", contentType="Categories") as ofh:
+                    ofh.write("<div>")
+                    raise ValueError("render failure")
+            self.assertTrue(ofh.closed)
+            self.assertFalse(os.path.exists(filePath))
+            #
+            # A page that cannot be completed is not left in place -
+            with self.assertRaises(OSError):
+                with hg.htmlFile("index", title="Category Index", subTitle="Test", contentType="Categories") as ofh:
+                    hcU.makeCategoryAlphaIndex(outputStream=ofh)
+                    ofh.close()
+            self.assertFalse(os.path.exists(filePath))
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+    def testDeferredEnumTable(self):
+        """Test limiting enumeration table rows with the complete table deferred to a data file"""
+        try:
+            itemName = "_diffrn_source.target"
+            fullList = self.__getContentUtils().makeItemPage(itemName)
+            hcU = self.__getContentUtils()
+            self.assertEqual(hcU.popDeferredTables(), {})
+            hcU.setEnumTableRowLimit(200)
+            self.assertEqual(hcU.makeItemPage(itemName), fullList)
+            self.assertEqual(hcU.popDeferredTables(), {})
+            #
+            hcU.setEnumTableRowLimit(20)
+            pageList = hcU.makeItemPage(itemName)
+            tableD = hcU.popDeferredTables()
+            self.assertEqual(sorted(tableD.keys()), [itemName + "_enum", itemName + "_enumalt"])
+            self.assertEqual(hcU.popDeferredTables(), {})
+            self.assertLess(len("\n".join(pageList)), len("\n".join(fullList)))
+            self.assertEqual(len([line for line in pageList if line.startswith('<div class="deferred-table"')]), 2)
+            #
+            # The deferred rows are those of the complete table -
+            pI = HtmlPathInfo(dictFilePath=self.__pdbxDictPath, htmlDocsPath=os.path.join(self.__workPath, "deferred-table"), htmlTopDirectoryName="dictionaries")
+            hg = HtmlGenerator(pathInfoObj=pI)
+            fullS = "\n".join(fullList)
+            for dataName, tableObj in tableD.items():
+                self.assertEqual(tableObj["rowCount"], 103)
+                self.assertIn('<div class="deferred-table" data-table-url="%s">' % pI.getContentTypeDataUrl(dataName, "Items"), pageList)
+                rowS = "\n".join(["\n".join(["<tr>"] + row + ["</tr>"]) for row in tableObj["rows"]])
+                self.assertIn("<tbody>\n" + rowS + "\n</tbody>", fullS)
+                self.assertTrue(hg.writeDataFile(dataName, "Items", tableObj))
+                with gzip.open(pI.getContentTypeDataPath(dataName, "Items"), "rt", encoding="utf-8") as ifh:
+                    self.assertEqual(json.load(ifh), tableObj)
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+    def testInlineFigures(self):
+        """Test embedding the primary category figure in category pages"""
+        try:
+            categoryName = "entity"
+            pI = HtmlPathInfo(dictFilePath=self.__pdbxDictPath, htmlDocsPath=os.path.join(self.__workPath, "inline-figures"), htmlTopDirectoryName="dictionaries")
+            HtmlGenerator(pathInfoObj=pI).makeDirectories(purge=True)
+            svgText = '<svg width="8pt" height="8pt"><a xlink:href="%s"><text>entity</text></a></svg>\n' % pI.getCategoryUrl(categoryName)
+            for variant in ["full", "archive"]:
+                with open(os.path.join(pI.getDictCategoryImagePath(), FigureManifest.getFigureFileName(categoryName, variant)), "w", encoding="utf-8") as ofh:
+                    ofh.write('<?xml version="1.0" encoding="UTF-8" standalone="no"?>\n<!-- Title: entity -->\n' + svgText)
+            dApi = DictionaryFileUtils(dictFilePath=self.__pdbxDictPath).getApi()
+            hcU = HtmlContentUtils(dictApiObj=dApi, pathInfoObj=pI)
+            pageS = "\n".join(hcU.makeCategoryPage(categoryName))
+            self.assertNotIn("inline-figure", pageS)
+            self.assertEqual(pageS.count('<img class="my-iframe-handle"'), 2)
+            #
+            hcU.setInlineFigures(True)
+            pageS = "\n".join(hcU.makeCategoryPage(categoryName))
+            dataList = re.findall(r'<div class="inline-figure" data-figure-gz="([^"]*)" data-figure-url="([^"]*)">', pageS)
+            self.assertEqual(len(dataList), 1)
+            self.assertEqual(gzip.decompress(base64.b64decode(dataList[0][0])).decode("utf-8"), svgText)
+            self.assertEqual(dataList[0][1], os.path.join(pI.getDictCategoryImageDirUrl(), FigureManifest.getFigureFileName(categoryName, "full")))
+            self.assertEqual(pageS.count('<img class="my-iframe-handle"'), 1)
+            self.assertIn("DecompressionStream", pageS)
+            #
+            # Figures that are too large or have links relative to the figure location are linked -
+            hcU.setInlineFigures(True, maxBytes=10)
+            self.assertNotIn("inline-figure", "\n".join(hcU.makeCategoryPage(categoryName)))
+            with open(os.path.join(pI.getDictCategoryImagePath(), FigureManifest.getFigureFileName(categoryName, "full")), "w", encoding="utf-8") as ofh:
+                ofh.write(svgText.replace(pI.getCategoryUrl(categoryName), "../../Categories/entity.html"))
+            hcU.setInlineFigures(True)
+            self.assertNotIn("inline-figure", "\n".join(hcU.makeCategoryPage(categoryName)))
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+
+def contentUtilsSuite():
+    suiteSelect = unittest.TestSuite()
+    suiteSelect.addTest(HtmlContentUtilsTests("testFragmentCache"))
+    suiteSelect.addTest(HtmlContentUtilsTests("testLazyAlphaIndex"))
+    suiteSelect.addTest(HtmlContentUtilsTests("testStreamedPage"))
+    suiteSelect.addTest(HtmlContentUtilsTests("testDeferredEnumTable"))
+    suiteSelect.addTest(HtmlContentUtilsTests("testInlineFigures"))
+    return suiteSelect
+
+
+if __name__ == "__main__":
+    mySuite = contentUtilsSuite()
+    unittest.TextTestRunner(verbosity=2).run(mySuite)
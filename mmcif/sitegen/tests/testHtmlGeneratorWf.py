@@ -16,8 +16,10 @@ __email__ = "jwest@rcsb.rutgers.edu"
 __license__ = "Apache 2,0"
 
 
+import filecmp
 import logging
 import os
+import shutil
 import time
 import unittest
 
@@ -57,10 +59,95 @@ class HtmlGeneratorWfTests(unittest.TestCase):
             logger.exception("Failing with %s", str(e))
             self.fail()
 
+    def testWorkflowMultiProc(self):
+        """Test multi-process page rendering reproduces the serial rendering --"""
+        try:
+            serialGenPath = os.path.join(self.__workPath, "site-serial", "mmcif_website_generated")
+            mpGenPath = os.path.join(self.__workPath, "site-mp", "mmcif_website_generated")
+            for numProc, genPath in [(1, serialGenPath), (2, mpGenPath)]:
+                shutil.rmtree(genPath, ignore_errors=True)
+                hgWf = HtmlGeneratorWf(websiteGenPath=genPath, websiteFileAssetsPath=self.__websiteFileAssetsPath, testMode=self.__testModeFlag, numProc=numProc)
+                ok = hgWf.renderDictionary("mmcif_ma")
+                self.assertTrue(ok)
+            #
+            fileCount = self.__compareTrees(serialGenPath, mpGenPath)
+            logger.info("Compared %d rendered files", fileCount)
+            self.assertGreater(fileCount, 100)
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+    def __compareTrees(self, path1, path2, excludeList=None):
+        """Return the number of identical files in two directory trees (failing for any difference)."""
+        fileCount = 0
+        dirL = [(path1, path2)]
+        while dirL:
+            pth1, pth2 = dirL.pop()
+            dc = filecmp.dircmp(pth1, pth2, ignore=excludeList)
+            self.assertEqual(dc.left_only + dc.right_only, [])
+            _, mismatchL, errorL = filecmp.cmpfiles(pth1, pth2, dc.common_files, shallow=False)
+            self.assertEqual(mismatchL + errorL, [])
+            fileCount += len(dc.common_files)
+            dirL.extend([(os.path.join(pth1, sd), os.path.join(pth2, sd)) for sd in dc.common_dirs])
+        return fileCount
+
+    def testWorkflowIncremental(self):
+        """Test incremental rendering of the pages with changed definitions reproduces a full rendering --"""
+        try:
+            topPath = os.path.join(self.__workPath, "incremental")
+            shutil.rmtree(topPath, ignore_errors=True)
+            assetsPath = os.path.join(topPath, "assets")
+            for dirName in ["config", "coverage"]:
+                shutil.copytree(os.path.join(self.__testData, dirName), os.path.join(assetsPath, dirName))
+            os.makedirs(os.path.join(assetsPath, "dictionaries"))
+            dictPath = os.path.join(assetsPath, "dictionaries", "mmcif_ma.dic")
+            shutil.copyfile(os.path.join(self.__testData, "dictionaries", "mmcif_ma.dic"), dictPath)
+            incGenPath = os.path.join(topPath, "site-incremental")
+            fullGenPath = os.path.join(topPath, "site-full")
+            dictContentPath = os.path.join(incGenPath, "dictionaries", "mmcif_ma.dic")
+            #
+            hgWf = HtmlGeneratorWf(websiteGenPath=incGenPath, websiteFileAssetsPath=assetsPath, testMode=self.__testModeFlag, incremental=True)
+            self.assertTrue(hgWf.renderDictionary("mmcif_ma"))
+            self.assertTrue(os.access(os.path.join(dictContentPath, "page-manifest.json"), os.R_OK))
+            unchangedPath = os.path.join(dictContentPath, "Items", "_ma_data.id.html")
+            changedPath = os.path.join(dictContentPath, "Items", "_ma_data.name.html")
+            deletedPath = os.path.join(dictContentPath, "Items", "_ma_data.content_type_other_details.html")
+            self.assertTrue(os.access(deletedPath, os.R_OK))
+            mtimeNs = os.stat(unchangedPath).st_mtime_ns
+            #
+            # Change the description of one item and delete the definition of another -
+            with open(dictPath, "r", encoding="utf-8") as ifh:
+                dictText = ifh.read()
+            iS = dictText.index("save__ma_data.content_type_other_details")
+            iE = dictText.index("save__ma_data.name")
+            dictText = dictText[:iS] + dictText[iE:]
+            dictText = dictText.replace("An author-given name for the content held in the dataset.", "A revised name for the content held in the dataset.")
+            with open(dictPath, "w", encoding="utf-8") as ofh:
+                ofh.write(dictText)
+            time.sleep(0.01)
+            #
+            hgWf = HtmlGeneratorWf(websiteGenPath=incGenPath, websiteFileAssetsPath=assetsPath, testMode=self.__testModeFlag, incremental=True)
+            self.assertTrue(hgWf.renderDictionary("mmcif_ma"))
+            self.assertEqual(os.stat(unchangedPath).st_mtime_ns, mtimeNs)
+            self.assertFalse(os.access(deletedPath, os.F_OK))
+            with open(changedPath, "r", encoding="utf-8") as ifh:
+                self.assertIn("A revised name", ifh.read())
+            #
+            hgWf = HtmlGeneratorWf(websiteGenPath=fullGenPath, websiteFileAssetsPath=assetsPath, testMode=self.__testModeFlag)
+            self.assertTrue(hgWf.renderDictionary("mmcif_ma"))
+            fileCount = self.__compareTrees(incGenPath, fullGenPath, excludeList=["page-manifest.json"])
+            logger.info("Compared %d rendered files", fileCount)
+            self.assertGreater(fileCount, 100)
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
 
 def suiteWorkflowTests():
     suiteSelect = unittest.TestSuite()
     suiteSelect.addTest(HtmlGeneratorWfTests("testWorkflow"))
+    suiteSelect.addTest(HtmlGeneratorWfTests("testWorkflowMultiProc"))
+    suiteSelect.addTest(HtmlGeneratorWfTests("testWorkflowIncremental"))
     return suiteSelect
 
 
@@ -0,0 +1,173 @@
+##
+# File: testHtmlMarkupUtils.py
+# Date:    18-Oct-2026
+# Version: 0.001
+#
+# Update:
+##
+"""
+Tests for HTML markup utilities.
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "John Westbrook"
+__email__ = "jwest@rcsb.rutgers.edu"
+__license__ = "Apache 2.0"
+
+import io
+import logging
+import os
+import time
+import timeit
+import unittest
+
+from mmcif.api.PdbxContainers import CifName
+
+from mmcif.sitegen.dictionary.DictionaryFileUtils import DictionaryFileUtils
+from mmcif.sitegen.dictionary.HtmlMarkupUtils import HtmlComponentMarkupUtils
+from mmcif.sitegen.dictionary.HtmlMarkupUtils import HtmlMarkupUtils
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s]-%(module)s.%(funcName)s: %(message)s")
+logger = logging.getLogger()
+logger.setLevel(logging.INFO)
+
+HERE = os.path.abspath(os.path.dirname(__file__))
+TOPDIR = os.path.dirname(os.path.dirname(os.path.dirname(HERE)))
+
+
+class HtmlMarkupUtilsTests(unittest.TestCase):
+    def setUp(self):
+        #
+        self.__testData = os.path.join(HERE, "test-data")
+        self.__pdbxDictPath = os.path.join(self.__testData, "dictionaries", "mmcif_pdbx_v40.dic")
+        self.__startTime = time.time()
+        logger.info("Starting %s at %s", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+
+    def tearDown(self):
+        endTime = time.time()
+        logger.info("Completed %s at %s (%.4f seconds)", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()), endTime - self.__startTime)
+
+    def __referenceEscape(self, text):
+        """Original character-by-character escaping used as the reference result."""
+        return "".join(HtmlMarkupUtils._htmlEscapeTable.get(c, c) for c in text)
+
+    def __getDictionaryText(self):
+        dApi = DictionaryFileUtils(self.__pdbxDictPath).getApi()
+        textList = []
+        for categoryName in dApi.getCategoryList():
+            textList.append(categoryName)
+            for itemName in dApi.getItemNameList(categoryName):
+                textList.append(itemName)
+                description = dApi.getDescription(categoryName, CifName.attributePart(itemName))
+                if description:
+                    textList.append(description)
+        return textList
+
+    def testEscape(self):
+        """Test escaping special characters"""
+        try:
+            for cacheSize in [0, 16]:
+                mU = HtmlMarkupUtils(escapeCacheSize=cacheSize)
+                self.assertEqual(mU.htmlEscape("""<a href="x">Tom & Jerry's</a>"""), "&lt;a href=&quot;x&quot;&gt;Tom &amp; Jerry&apos;s&lt;/a&gt;")
+                self.assertEqual(mU.htmlEscape("&amp;"), "&amp;amp;")
+                self.assertEqual(mU.htmlEscape("_entity.pdbx_description"), "_entity.pdbx_description")
+                self.assertEqual(mU.htmlEscape(""), "")
+                self.assertEqual(mU.escapeText(None), "")
+                self.assertEqual(mU.escapeText("a < b", fmt="html"), "a < b")
+                self.assertEqual(mU.escapeText("x~2~ & y^3^", markupMath=True), "x<sub>2</sub> &amp; y<sup>3</sup>")
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+    def testEscapeDictionaryText(self):
+        """Compare escaping of PDBx dictionary names and descriptions with the reference method"""
+        try:
+            textList = self.__getDictionaryText()
+            self.assertGreater(len(textList), 1000)
+            mU = HtmlMarkupUtils()
+            mUC = HtmlMarkupUtils(escapeCacheSize=4096)
+            for text in textList:
+                tS = self.__referenceEscape(text)
+                self.assertEqual(mU.htmlEscape(text), tS)
+                self.assertEqual(mUC.htmlEscape(text), tS)
+            #
+            tRef = min(timeit.repeat(lambda: [self.__referenceEscape(text) for text in textList], number=1, repeat=3))
+            tNew = min(timeit.repeat(lambda: [mU.htmlEscape(text) for text in textList], number=1, repeat=3))
+            tCache = min(timeit.repeat(lambda: [mUC.htmlEscape(text) for text in textList], number=1, repeat=3))
+            logger.info("Escaped %d strings reference %.4f fast path %.4f (%.1fx) cached %.4f (%.1fx)", len(textList), tRef, tNew, tRef / tNew, tCache, tRef / tCache)
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+    def testComponentFragments(self):
+        """Test composing nested components from fragments"""
+        try:
+            inner = HtmlComponentMarkupUtils()
+            inner.beginLinkListGroup()
+            inner.addLinkListItem("/a.html", "a < b")
+            inner.endLinkListGroup()
+            fragment = inner.getHtmlFragment()
+            innerList = inner.getHtmlList()
+            self.assertIsInstance(fragment, tuple)
+            self.assertEqual(list(fragment), innerList)
+            #
+            outer = HtmlComponentMarkupUtils()
+            outer.beginContainer()
+            outer.addAccordionPanel(title="t", panelTextList=fragment, panelId="p1", panelGroupId="pg1")
+            outer.addContent(fragment)
+            outer.endContainer()
+            #
+            ref = HtmlComponentMarkupUtils()
+            ref.beginContainer()
+            ref.addAccordionPanel(title="t", panelTextList=innerList, panelId="p1", panelGroupId="pg1")
+            ref.addContent(innerList)
+            ref.endContainer()
+            #
+            oL = outer.getHtmlList()
+            self.assertEqual(oL, ref.getHtmlList())
+            self.assertTrue(all(isinstance(v, str) for v in oL))
+            self.assertEqual(oL.count('<a href="/a.html" class="list-group-item ">a &lt; b</a>'), 2)
+            # Later changes to the inner builder do not alter the embedded fragment -
+            inner.clear()
+            self.assertEqual(outer.getHtmlList(), oL)
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+    def testComponentStreaming(self):
+        """Test streaming component markup to an output stream"""
+        try:
+            ofh = io.StringIO()
+            htmlS = HtmlComponentMarkupUtils(outputStream=ofh)
+            html = HtmlComponentMarkupUtils()
+            for hU in [htmlS, html]:
+                hU.beginContainer()
+                hU.beginListGroup()
+                hU.flush()
+                for ii in range(5):
+                    hU.addListItem("item %d" % ii)
+                    self.assertEqual(hU.flush(), 1 if hU is htmlS else 0)
+                hU.endListGroup()
+                hU.flush()
+                hU.flush()
+                hU.endContainer()
+                hU.flush()
+            self.assertEqual(htmlS.getHtmlList(), [])
+            self.assertEqual(ofh.getvalue(), "\n".join(html.getHtmlList()))
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+
+def markupUtilsSuite():
+    suiteSelect = unittest.TestSuite()
+    suiteSelect.addTest(HtmlMarkupUtilsTests("testEscape"))
+    suiteSelect.addTest(HtmlMarkupUtilsTests("testEscapeDictionaryText"))
+    suiteSelect.addTest(HtmlMarkupUtilsTests("testComponentFragments"))
+    suiteSelect.addTest(HtmlMarkupUtilsTests("testComponentStreaming"))
+    return suiteSelect
+
+
+if __name__ == "__main__":
+    mySuite = markupUtilsSuite()
+    unittest.TextTestRunner(verbosity=2).run(mySuite)
@@ -0,0 +1,151 @@
+##
+# File: testNeighborFigureRenderer.py
+# Date:    18-Oct-2026
+# Version: 0.001
+#
+# Update:
+##
+"""
+Tests for the built-in layered SVG renderer of category neighbor diagrams.
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "John Westbrook"
+__email__ = "jwest@rcsb.rutgers.edu"
+__license__ = "Apache 2.0"
+
+import logging
+import os
+import time
+import unittest
+import xml.etree.ElementTree as ET
+
+from mmcif.sitegen.dictionary.DictionaryFileUtils import DictionaryFileUtils
+from mmcif.sitegen.dictionary.HtmlPathInfo import HtmlPathInfo
+from mmcif.sitegen.dictionary.NeighborFigureRenderer import NeighborFigureRenderer, categoryColorD
+from mmcif.sitegen.dictionary.NeighborFigures import NeighborFigures
+
+try:
+    import pygraphviz  # noqa: F401 pylint: disable=unused-import
+
+    HAS_GRAPHVIZ_LIBRARY = True
+except ImportError:
+    HAS_GRAPHVIZ_LIBRARY = False
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s]-%(module)s.%(funcName)s: %(message)s")
+logger = logging.getLogger()
+logger.setLevel(logging.INFO)
+
+HERE = os.path.abspath(os.path.dirname(__file__))
+TOPDIR = os.path.dirname(os.path.dirname(os.path.dirname(HERE)))
+
+SVG_NS = "{http://www.w3.org/2000/svg}"
+XLINK_NS = "{http://www.w3.org/1999/xlink}"
+
+
+class NeighborFigureRendererTests(unittest.TestCase):
+    def setUp(self):
+        #
+        self.__testData = os.path.join(HERE, "test-data")
+        self.__pdbxDictPath = os.path.join(self.__testData, "dictionaries", "mmcif_pdbx_v40.dic")
+        self.__imageFilePath = os.path.join(HERE, "test-output", "renderer")
+        if not os.access(self.__imageFilePath, os.W_OK):
+            os.makedirs(self.__imageFilePath)
+        self.__categoryNameList = ["entity", "atom_site", "struct_conf", "pdbx_struct_assembly_gen"]
+        self.__dApi = DictionaryFileUtils(dictFilePath=self.__pdbxDictPath).getApi()
+        self.__pI = HtmlPathInfo(dictFilePath=self.__pdbxDictPath, htmlDocsPath=os.path.join(HERE, "test-output", "site", "mmcif"), htmlTopDirectoryName="dictionaries")
+        self.__startTime = time.time()
+        logger.info("Starting %s at %s", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+
+    def tearDown(self):
+        endTime = time.time()
+        logger.info("Completed %s at %s (%.4f seconds)", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()), endTime - self.__startTime)
+
+    def __findGraphvizDot(self):
+        pathDot = os.getenv("GRAPHVIZ_DOT_BINARY", default=None)
+        pthList = [pathDot] if pathDot else []
+        pthList.extend(["/usr/bin/dot", "/usr/local/bin/dot", "/opt/bin/dot"])
+        for pth in pthList:
+            if os.path.isfile(pth) and os.access(pth, os.X_OK):
+                return pth
+        return None
+
+    def __getSummary(self, svgData):
+        """Return the links, text, fill colors and node and edge counts of an SVG figure."""
+        root = ET.fromstring(svgData)
+        hrefSet = set([el.get(XLINK_NS + "href") for el in root.iter(SVG_NS + "a") if el.get(XLINK_NS + "href")])
+        textList = sorted([el.text.strip() for el in root.iter(SVG_NS + "text") if el.text and el.text.strip()])
+        fillSet = set([el.get("fill") for el in root.iter(SVG_NS + "polygon") if el.get("fill", "").startswith("#")])
+        numNodes = len([el for el in root.iter(SVG_NS + "g") if el.get("class") == "node"])
+        numEdges = len([el for el in root.iter(SVG_NS + "g") if el.get("class") == "edge"])
+        return {"hrefSet": hrefSet, "textList": textList, "fillSet": fillSet, "numNodes": numNodes, "numEdges": numEdges}
+
+    def testRender(self):
+        """Test the layout and SVG output of the built-in renderer"""
+        try:
+            nf = NeighborFigures(dictApiObj=self.__dApi, pathInfoObj=self.__pI, pathDot=None, layoutBackend="python")
+            self.assertEqual(nf.getLayoutBackend(), "python")
+            nfr = NeighborFigureRenderer()
+            for categoryName in self.__categoryNameList:
+                view = nf.getNeighborhoodView(nf.getNeighborhood(categoryName), maxItems=20)
+                lD = nfr.layout(view)
+                self.assertEqual(set(lD["nodeD"].keys()), set([node["categoryName"] for node in view["nodeList"]]))
+                self.assertEqual(len(lD["edgeList"]), len(view["edgeList"]))
+                boxList = [(nD["x"], nD["y"], nD["x"] + nD["width"], nD["y"] + nD["height"]) for nD in lD["nodeD"].values()]
+                for ii, b1 in enumerate(boxList):
+                    for b2 in boxList[ii + 1 :]:
+                        self.assertTrue(b1[2] <= b2[0] or b2[2] <= b1[0] or b1[3] <= b2[1] or b2[3] <= b1[1], "%s nodes overlap" % categoryName)
+                #
+                svgData = nfr.render(view, graphTitle="Category <b>%s</b>" % categoryName, graphSubTitle="Neighbors", titleFormat="html", size=".7,.7")
+                self.assertIn(("<!-- Title: %s Pages: 1 -->" % categoryName).encode("utf-8"), svgData)
+                sD = self.__getSummary(svgData)
+                self.assertEqual(sD["numNodes"], len(view["nodeList"]))
+                self.assertEqual(sD["numEdges"], len(view["edgeList"]))
+                urlSet = set([node["url"] for node in view["nodeList"] if node["url"]])
+                urlSet.update([row["url"] for node in view["nodeList"] for row in node["rowList"] if row["url"]])
+                self.assertEqual(sD["hrefSet"], urlSet)
+                self.assertIn(categoryColorD["current"], sD["fillSet"])
+                self.assertLessEqual(sD["fillSet"], set(categoryColorD.values()))
+                self.assertIn(categoryName, sD["textList"])
+            #
+            # Figure tasks carry the view for the python backend -
+            figureTask = nf.makeNeighborFigureDot("entity", graphTitle="entity", imageFilePath=self.__imageFilePath)
+            self.assertTrue(nf.layoutNeighborFigure(figureTask))
+            with open(figureTask["figPath"], "rb") as ifh:
+                self.assertEqual(self.__getSummary(ifh.read())["numNodes"], len(figureTask["view"]["nodeList"]))
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+    def testCompareGraphviz(self):
+        """Test that the built-in renderer depicts the same content as the Graphviz layout"""
+        pathDot = self.__findGraphvizDot()
+        if not HAS_GRAPHVIZ_LIBRARY and not pathDot:
+            self.skipTest("Graphviz is not available")
+        try:
+            nfG = NeighborFigures(dictApiObj=self.__dApi, pathInfoObj=self.__pI, pathDot=pathDot, layoutBackend="auto")
+            nfP = NeighborFigures(dictApiObj=self.__dApi, pathInfoObj=self.__pI, pathDot=None, layoutBackend="python")
+            for categoryName in self.__categoryNameList:
+                sL = []
+                for nf in [nfG, nfP]:
+                    figureTask = nf.makeNeighborFigureDot(categoryName, graphTitle=categoryName, size=".7,.7", imageFilePath=self.__imageFilePath)
+                    self.assertTrue(nf.layoutNeighborFigure(figureTask))
+                    with open(figureTask["figPath"], "rb") as ifh:
+                        sL.append(self.__getSummary(ifh.read()))
+                logger.info("%s Graphviz %r renderer %r", categoryName, sL[0]["numNodes"], sL[1]["numNodes"])
+                self.assertEqual(sL[0], sL[1])
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+
+def neighborFigureRendererSuite():
+    suiteSelect = unittest.TestSuite()
+    suiteSelect.addTest(NeighborFigureRendererTests("testRender"))
+    suiteSelect.addTest(NeighborFigureRendererTests("testCompareGraphviz"))
+    return suiteSelect
+
+
+if __name__ == "__main__":
+    mySuite = neighborFigureRendererSuite()
+    unittest.TextTestRunner(verbosity=2).run(mySuite)
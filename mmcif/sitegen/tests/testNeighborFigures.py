@@ -5,7 +5,10 @@
 # Version: 0.001
 #
 # Updates:
-#
+#  18-Oct-2026  add test for the in-process Graphviz library layout backend
+#  18-Oct-2026  add test for batch figure layout
+#  18-Oct-2026  add test for the category neighborhood model and filtered views
+#  19-Oct-2026  add test for layout time limits and degraded figures
 ##
 """
 Tests cases for selected category neighbor diagram figure generator.
@@ -18,6 +21,7 @@ __license__ = "Apache 2,0"
 
 import logging
 import os
+import stat
 import time
 import unittest
 
@@ -28,6 +32,13 @@ from mmcif.sitegen.dictionary.DictionaryRegistry import DictionaryRegistry
 from mmcif.sitegen.dictionary.HtmlPathInfo import HtmlPathInfo
 from mmcif.sitegen.dictionary.NeighborFigures import NeighborFigures
 
+try:
+    import pygraphviz  # noqa: F401 pylint: disable=unused-import
+
+    HAS_GRAPHVIZ_LIBRARY = True
+except ImportError:
+    HAS_GRAPHVIZ_LIBRARY = False
+
 logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s]-%(module)s.%(funcName)s: %(message)s")
 logger = logging.getLogger()
 
@@ -211,10 +222,235 @@ class NeighborFiguresTests(unittest.TestCase):
             logger.exception("Failing with %s", str(e))
             self.fail()
 
+    def testMakeNeighborFigureDot(self):
+        """Test dot instructions and layout tasks for category figures without running the layout"""
+        try:
+            dictPath = os.path.join(self.__pdbxResourcePath, "mmcif_pdbx_v40.dic")
+            pI = HtmlPathInfo(dictFilePath=dictPath, htmlDocsPath=self.__pdbxDocsPath, htmlTopDirectoryName=self.__htmlTopDir, verbose=self.__verbose)
+            dApi = DictionaryFileUtils(dictFilePath=dictPath, verbose=self.__verbose).getApi()
+            nf = NeighborFigures(dictApiObj=dApi, pathInfoObj=pI, pathDot=self.__pathDot, keepDot=True, verbose=self.__verbose)
+            for dT in self.__deliveryTypeL:
+                nf.setItemCounts(self.__itemCountD[dT], deliveryType=dT)
+            imageFilePath = os.path.join(HERE, "test-output")
+            if not os.access(imageFilePath, os.W_OK):
+                os.makedirs(imageFilePath)
+            #
+            taskList = []
+            for filterDelivery, deliveryType in [(False, "archive"), (True, "archive"), (True, "cc")]:
+                figureTask = nf.makeNeighborFigureDot("entity", graphTitle="entity", filterDelivery=filterDelivery, deliveryType=deliveryType, imageFilePath=imageFilePath)
+                if figureTask:
+                    taskList.append(figureTask)
+            self.assertEqual([fT["variant"] for fT in taskList], ["full", "archive"])
+            self.assertEqual(os.path.basename(taskList[1]["figPath"]), "entity_neighbors_archive.svg")
+            for figureTask in taskList:
+                self.assertEqual(figureTask["categoryName"], "entity")
+                dotS = figureTask["dotText"]
+                self.assertTrue(dotS.startswith("digraph entity {"))
+                self.assertIn("_atom_site:__label_entity_id:w -> _entity:__id:w;", dotS)
+                with open(figureTask["dotPath"], "r", encoding="utf-8") as ifh:
+                    self.assertEqual(ifh.read(), dotS)
+            #
+            # Dot files are only written on request -
+            os.remove(taskList[0]["dotPath"])
+            nf = NeighborFigures(dictApiObj=dApi, pathInfoObj=pI, pathDot=self.__pathDot, verbose=self.__verbose)
+            figureTask = nf.makeNeighborFigureDot("entity", graphTitle="entity", imageFilePath=imageFilePath)
+            self.assertEqual(figureTask["dotText"], taskList[0]["dotText"])
+            self.assertFalse(os.path.exists(figureTask["dotPath"]))
+            #
+            # Figure fingerprints follow the layout inputs -
+            fingerprint = nf.getFigureFingerprint(figureTask)
+            self.assertEqual(fingerprint, nf.getFigureFingerprint(taskList[0]))
+            self.assertNotEqual(fingerprint, nf.getFigureFingerprint(taskList[1]))
+            nf = NeighborFigures(dictApiObj=dApi, pathInfoObj=pI, pathDot=self.__pathDot, layoutTimeout=10, verbose=self.__verbose)
+            self.assertNotEqual(fingerprint, nf.getFigureFingerprint(figureTask))
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+    def testNeighborhoodModel(self):
+        """Test the neighborhood model shared by the figure variants of a category"""
+        try:
+            dictPath = os.path.join(self.__pdbxResourcePath, "mmcif_pdbx_v40.dic")
+            pI = HtmlPathInfo(dictFilePath=dictPath, htmlDocsPath=self.__pdbxDocsPath, htmlTopDirectoryName=self.__htmlTopDir, verbose=self.__verbose)
+            dApi = DictionaryFileUtils(dictFilePath=dictPath, verbose=self.__verbose).getApi()
+            nf = NeighborFigures(dictApiObj=dApi, pathInfoObj=pI, pathDot=self.__pathDot, verbose=self.__verbose)
+            for dT in self.__deliveryTypeL:
+                nf.setItemCounts(self.__itemCountD[dT], deliveryType=dT)
+            #
+            neighborhood = nf.getNeighborhood("entity")
+            self.assertIs(nf.getNeighborhood("entity"), neighborhood)
+            self.assertIn("atom_site", [cD["categoryName"] for cD in neighborhood["categoryList"]])
+            self.assertIn(("_atom_site.label_entity_id", "_entity.id"), neighborhood["edgeList"])
+            self.assertEqual(len(set([frozenset(edge) for edge in neighborhood["edgeList"]])), len(neighborhood["edgeList"]))
+            #
+            fullView = nf.getNeighborhoodView(neighborhood, maxItems=20)
+            self.assertEqual(len(fullView["nodeList"]), len(neighborhood["categoryList"]))
+            self.assertEqual(fullView["edgeList"], neighborhood["edgeList"])
+            entityNode = [node for node in fullView["nodeList"] if node["categoryName"] == "entity"][0]
+            self.assertEqual(entityNode["highLight"], "current")
+            self.assertEqual(entityNode["rowList"][0]["itemName"], "_entity.id")
+            self.assertTrue(entityNode["rowList"][0]["isKey"])
+            #
+            for deliveryType in ["archive", "cc"]:
+                view = nf.getNeighborhoodView(neighborhood, maxItems=20, filterDelivery=True, deliveryType=deliveryType)
+                self.assertLessEqual(set([node["categoryName"] for node in view["nodeList"]]), set([node["categoryName"] for node in fullView["nodeList"]]))
+                self.assertLessEqual(set(view["edgeList"]), set(fullView["edgeList"]))
+                for node in view["nodeList"]:
+                    self.assertGreater(nf.getCategoryUseCount(node["categoryName"], deliveryType=deliveryType), 0)
+            #
+            figureTask = nf.makeNeighborFigureDot("entity", graphTitle="entity", imageFilePath=os.path.join(HERE, "test-output"))
+            self.assertIn("_atom_site:__label_entity_id:w -> _entity:__id:w;", figureTask["dotText"])
+            self.assertIsNot(nf.getNeighborhood("atom_site"), neighborhood)
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+    @unittest.skipUnless(HAS_GRAPHVIZ_LIBRARY, "Graphviz library bindings (pygraphviz) are not installed")
+    def testLibraryLayout(self):
+        """Test in-process figure layout with the Graphviz library and without the dot executable"""
+        try:
+            dictPath = os.path.join(self.__pdbxResourcePath, "mmcif_pdbx_v40.dic")
+            pI = HtmlPathInfo(dictFilePath=dictPath, htmlDocsPath=self.__pdbxDocsPath, htmlTopDirectoryName=self.__htmlTopDir, verbose=self.__verbose)
+            dApi = DictionaryFileUtils(dictFilePath=dictPath, verbose=self.__verbose).getApi()
+            imageFilePath = os.path.join(HERE, "test-output")
+            if not os.access(imageFilePath, os.W_OK):
+                os.makedirs(imageFilePath)
+            #
+            nf = NeighborFigures(dictApiObj=dApi, pathInfoObj=pI, pathDot=None, layoutBackend="library", verbose=self.__verbose)
+            self.assertEqual(nf.getLayoutBackend(), "library")
+            figureTask = nf.makeNeighborFigureDot("entity", graphTitle="entity", size=".7,.7", imageFilePath=imageFilePath)
+            self.assertTrue(nf.layoutNeighborFigure(figureTask))
+            with open(figureTask["figPath"], "r", encoding="utf-8") as ifh:
+                svgS = ifh.read()
+            self.assertIn("<svg", svgS)
+            self.assertIn("_atom_site.label_entity_id", svgS)
+            #
+            # A failed layout removes the previous figure -
+            figureTask["dotText"] = "digraph entity { -> }"
+            self.assertFalse(nf.layoutNeighborFigure(figureTask))
+            self.assertFalse(os.path.exists(figureTask["figPath"]))
+            #
+            nf = NeighborFigures(dictApiObj=dApi, pathInfoObj=pI, pathDot=self.__pathDot, layoutBackend="binary", verbose=self.__verbose)
+            self.assertEqual(nf.getLayoutBackend(), "binary")
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+    def testLayoutBatch(self):
+        """Test streaming a batch of figures through the dot executable including a figure that fails"""
+        if not self.__pathDot:
+            self.skipTest("Graphviz dot is not available")
+        try:
+            dictPath = os.path.join(self.__pdbxResourcePath, "mmcif_pdbx_v40.dic")
+            pI = HtmlPathInfo(dictFilePath=dictPath, htmlDocsPath=self.__pdbxDocsPath, htmlTopDirectoryName=self.__htmlTopDir, verbose=self.__verbose)
+            dApi = DictionaryFileUtils(dictFilePath=dictPath, verbose=self.__verbose).getApi()
+            nf = NeighborFigures(dictApiObj=dApi, pathInfoObj=pI, pathDot=self.__pathDot, layoutBackend="binary", verbose=self.__verbose)
+            imageFilePath = os.path.join(HERE, "test-output", "batch")
+            if not os.access(imageFilePath, os.W_OK):
+                os.makedirs(imageFilePath)
+            #
+            taskList = [nf.makeNeighborFigureDot(categoryName, graphTitle=categoryName, imageFilePath=imageFilePath) for categoryName in ["entity", "atom_site", "struct_conf"]]
+            badTask = dict(taskList[0], categoryName="broken", dotText="digraph broken { -> }", figPath=os.path.join(imageFilePath, "broken.svg"))
+            taskList.insert(1, badTask)
+            self.assertEqual(nf.layoutNeighborFigureBatch(taskList, batchSize=10), [True, False, True, True])
+            self.assertFalse(os.path.exists(badTask["figPath"]))
+            #
+            # Batch figures match figures laid out by separate dot processes -
+            for figureTask in [taskList[0], taskList[2], taskList[3]]:
+                with open(figureTask["figPath"], "rb") as ifh:
+                    batchData = ifh.read()
+                self.assertTrue(nf.layoutNeighborFigure(figureTask))
+                with open(figureTask["figPath"], "rb") as ifh:
+                    self.assertEqual(ifh.read(), batchData)
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+    def testLayoutBackendSelection(self):
+        """Test that the 'auto' backend keeps concurrent dot executable layouts when the Graphviz library is installed"""
+        try:
+            dictPath = os.path.join(self.__pdbxResourcePath, "mmcif_pdbx_v40.dic")
+            pI = HtmlPathInfo(dictFilePath=dictPath, htmlDocsPath=self.__pdbxDocsPath, htmlTopDirectoryName=self.__htmlTopDir, verbose=self.__verbose)
+            dApi = DictionaryFileUtils(dictFilePath=dictPath, verbose=self.__verbose).getApi()
+            imageFilePath = os.path.join(HERE, "test-output", "backend")
+            if not os.access(imageFilePath, os.W_OK):
+                os.makedirs(imageFilePath)
+            pathDot = os.path.join(imageFilePath, "dot")
+            with open(pathDot, "w", encoding="utf-8") as ofh:
+                ofh.write("#!/bin/sh\nexit 1\n")
+            os.chmod(pathDot, os.stat(pathDot).st_mode | stat.S_IXUSR)
+            libraryBackend = "library" if HAS_GRAPHVIZ_LIBRARY else "binary"
+            for pthDot, numWorkers, backend in [
+                (pathDot, 4, "binary"),
+                (pathDot, 1, libraryBackend),
+                (None, 4, libraryBackend),
+                (os.path.join(imageFilePath, "missing-dot"), 4, libraryBackend),
+            ]:
+                nf = NeighborFigures(dictApiObj=dApi, pathInfoObj=pI, pathDot=pthDot, layoutBackend="auto", numWorkers=numWorkers, verbose=self.__verbose)
+                self.assertEqual(nf.getLayoutBackend(), backend, "%r %r" % (pthDot, numWorkers))
+            nf = NeighborFigures(dictApiObj=dApi, pathInfoObj=pI, pathDot=pathDot, layoutBackend="library", numWorkers=4, verbose=self.__verbose)
+            self.assertEqual(nf.getLayoutBackend(), libraryBackend)
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+    @unittest.skipUnless(os.name == "posix", "Requires a POSIX shell")
+    def testLayoutLimits(self):
+        """Test stopping layouts exceeding the time limit and laying out simplified figures"""
+        try:
+            dictPath = os.path.join(self.__pdbxResourcePath, "mmcif_pdbx_v40.dic")
+            pI = HtmlPathInfo(dictFilePath=dictPath, htmlDocsPath=self.__pdbxDocsPath, htmlTopDirectoryName=self.__htmlTopDir, verbose=self.__verbose)
+            dApi = DictionaryFileUtils(dictFilePath=dictPath, verbose=self.__verbose).getApi()
+            imageFilePath = os.path.join(HERE, "test-output", "limits")
+            if not os.access(imageFilePath, os.W_OK):
+                os.makedirs(imageFilePath)
+            # A layout program that never completes -
+            pathDot = os.path.join(imageFilePath, "slow-dot")
+            with open(pathDot, "w", encoding="utf-8") as ofh:
+                ofh.write("#!/bin/sh\nexec sleep 30\n")
+            os.chmod(pathDot, os.stat(pathDot).st_mode | stat.S_IXUSR)
+            #
+            nf = NeighborFigures(dictApiObj=dApi, pathInfoObj=pI, pathDot=pathDot, layoutBackend="auto", layoutTimeout=0.5, layoutMemoryLimit=500, verbose=self.__verbose)
+            self.assertEqual(nf.getLayoutBackend(), "binary")
+            taskList = [nf.makeNeighborFigureDot(categoryName, graphTitle=categoryName, imageFilePath=imageFilePath) for categoryName in ["entity", "struct_conf"]]
+            startTime = time.time()
+            self.assertEqual(nf.layoutNeighborFigureBatch(taskList), [False, False])
+            self.assertEqual([figureTask["layoutError"] for figureTask in taskList], ["timeout", "timeout"])
+            self.assertFalse(nf.layoutNeighborFigure(taskList[0]))
+            self.assertEqual(taskList[0]["layoutError"], "timeout")
+            self.assertLess(time.time() - startTime, 10.0)
+            #
+            # Simplified dot layouts also time out and the figure is rendered by the built-in renderer -
+            ok, degradation = nf.layoutDegradedNeighborFigure(taskList[0])
+            self.assertTrue(ok)
+            self.assertEqual(degradation, "built-in renderer")
+            with open(taskList[0]["figPath"], "r", encoding="utf-8") as ifh:
+                self.assertIn("_atom_site.label_entity_id", ifh.read())
+            #
+            # The memory limit is applied to the layout program itself (in KiB as reported by ulimit) -
+            pathDot = os.path.join(imageFilePath, "limit-dot")
+            with open(pathDot, "w", encoding="utf-8") as ofh:
+                ofh.write('#!/bin/sh\ncat > /dev/null\nprintf \'<svg xmlns="http://www.w3.org/2000/svg"><text>%s</text></svg>\' "$(ulimit -v)"\n')
+            os.chmod(pathDot, os.stat(pathDot).st_mode | stat.S_IXUSR)
+            nf = NeighborFigures(dictApiObj=dApi, pathInfoObj=pI, pathDot=pathDot, layoutBackend="binary", layoutMemoryLimit=500, verbose=self.__verbose)
+            figureTask = nf.makeNeighborFigureDot("entity", graphTitle="entity", imageFilePath=imageFilePath)
+            self.assertTrue(nf.layoutNeighborFigure(figureTask))
+            with open(figureTask["figPath"], "r", encoding="utf-8") as ifh:
+                self.assertIn("512000", ifh.read())
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
 
 def suiteNeighborFiguresSelectedTests():
     suiteSelect = unittest.TestSuite()
     suiteSelect.addTest(NeighborFiguresTests("testMakeSelectedCategoryFigures"))
+    suiteSelect.addTest(NeighborFiguresTests("testMakeNeighborFigureDot"))
+    suiteSelect.addTest(NeighborFiguresTests("testNeighborhoodModel"))
+    suiteSelect.addTest(NeighborFiguresTests("testLibraryLayout"))
+    suiteSelect.addTest(NeighborFiguresTests("testLayoutBatch"))
+    suiteSelect.addTest(NeighborFiguresTests("testLayoutBackendSelection"))
+    suiteSelect.addTest(NeighborFiguresTests("testLayoutLimits"))
     return suiteSelect
 
 
@@ -0,0 +1,147 @@
+##
+# File: testOverviewFigures.py
+# Date:    19-Oct-2026
+# Version: 0.001
+#
+# Update:
+##
+"""
+Tests for the whole-dictionary category relationship overview figures.
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "John Westbrook"
+__email__ = "jwest@rcsb.rutgers.edu"
+__license__ = "Apache 2.0"
+
+import logging
+import os
+import shutil
+import time
+import unittest
+import xml.etree.ElementTree as ET
+
+from mmcif.sitegen.dictionary.DictionaryFileUtils import DictionaryFileUtils
+from mmcif.sitegen.dictionary.FigureCache import FigureCache
+from mmcif.sitegen.dictionary.HtmlPathInfo import HtmlPathInfo
+from mmcif.sitegen.dictionary.OverviewFigures import OverviewFigures
+
+try:
+    import pygraphviz  # noqa: F401 pylint: disable=unused-import
+
+    HAS_GRAPHVIZ_LIBRARY = True
+except ImportError:
+    HAS_GRAPHVIZ_LIBRARY = False
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s]-%(module)s.%(funcName)s: %(message)s")
+logger = logging.getLogger()
+logger.setLevel(logging.INFO)
+
+HERE = os.path.abspath(os.path.dirname(__file__))
+TOPDIR = os.path.dirname(os.path.dirname(os.path.dirname(HERE)))
+
+SVG_NS = "{http://www.w3.org/2000/svg}"
+
+
+class OverviewFiguresTests(unittest.TestCase):
+    def setUp(self):
+        #
+        self.__testData = os.path.join(HERE, "test-data")
+        self.__pdbxDictPath = os.path.join(self.__testData, "dictionaries", "mmcif_pdbx_v40.dic")
+        self.__imageFilePath = os.path.join(HERE, "test-output", "overview")
+        self.__cachePath = os.path.join(HERE, "test-output", "overview-cache")
+        for pth in [self.__imageFilePath, self.__cachePath]:
+            if os.path.exists(pth):
+                shutil.rmtree(pth)
+        self.__dApi = DictionaryFileUtils(dictFilePath=self.__pdbxDictPath).getApi()
+        self.__pI = HtmlPathInfo(dictFilePath=self.__pdbxDictPath, htmlDocsPath=os.path.join(HERE, "test-output", "site", "mmcif"), htmlTopDirectoryName="dictionaries")
+        self.__startTime = time.time()
+        logger.info("Starting %s at %s", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+
+    def tearDown(self):
+        endTime = time.time()
+        logger.info("Completed %s at %s (%.4f seconds)", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()), endTime - self.__startTime)
+
+    def __findGraphvizDot(self):
+        pathDot = os.getenv("GRAPHVIZ_DOT_BINARY", default=None)
+        pthList = [pathDot] if pathDot else []
+        pthList.extend(["/usr/bin/dot", "/usr/local/bin/dot", "/opt/bin/dot"])
+        for pth in pthList:
+            if os.path.isfile(pth) and os.access(pth, os.X_OK):
+                return pth
+        return None
+
+    def testGroupDot(self):
+        """Test the category clusters and the dot instructions of the group figures"""
+        try:
+            of = OverviewFigures(dictApiObj=self.__dApi, pathInfoObj=self.__pI, pathDot=None)
+            clusterList = of.getClusterList()
+            groupNameList = [groupName for groupName, _ in clusterList]
+            self.assertIn("atom_group", groupNameList)
+            self.assertNotIn("inclusive_group", groupNameList)
+            categorySet = set([categoryName for _, categoryNameList in clusterList for categoryName in categoryNameList])
+            self.assertEqual(categorySet, set(self.__dApi.getCategoryList()))
+            #
+            dotText = of.makeGroupDot("atom_group", dict(clusterList)["atom_group"])
+            self.assertIn('URL="%s"' % self.__pI.getGroupUrl("atom_group"), dotText)
+            self.assertIn('"atom_site" [URL="%s"' % self.__pI.getCategoryUrl("atom_site"), dotText)
+            self.assertIn('"atom_site" -> "atom_type"', dotText)
+            self.assertNotIn('"chem_comp"', dotText)
+            #
+            edgeD = of.getGroupEdgeD(clusterList)
+            self.assertGreater(len(edgeD), 0)
+            self.assertTrue(all([i1 < i2 and count > 0 for (i1, i2), count in edgeD.items()]))
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+    def testOverviewFigures(self):
+        """Test the layout of the group and dictionary overview figures and the reuse of cached group layouts"""
+        pathDot = self.__findGraphvizDot()
+        if not HAS_GRAPHVIZ_LIBRARY and not pathDot:
+            self.skipTest("Graphviz is not available")
+        try:
+            of = OverviewFigures(dictApiObj=self.__dApi, pathInfoObj=self.__pI, pathDot=pathDot, figureCacheObj=FigureCache(self.__cachePath))
+            clusterList = of.getClusterList()
+            statusD = of.makeOverviewFigures(imageFilePath=self.__imageFilePath, graphTitle="Category Relationship Overview")
+            self.assertTrue(statusD[None])
+            self.assertEqual(set(statusD.keys()), set([groupName for groupName, _ in clusterList]) | set([None]))
+            self.assertTrue(all(statusD.values()))
+            #
+            figPath = os.path.join(self.__imageFilePath, OverviewFigures.getFigureFileName())
+            with open(figPath, "rb") as ifh:
+                svgData = ifh.read()
+            root = ET.fromstring(svgData)
+            boxList = []
+            for el in root.iter(SVG_NS + "rect"):
+                x, y = float(el.get("x")), float(el.get("y"))
+                boxList.append((x, y, x + float(el.get("width")), y + float(el.get("height"))))
+            self.assertEqual(len(boxList), len(clusterList))
+            for ii, b1 in enumerate(boxList):
+                for b2 in boxList[ii + 1 :]:
+                    self.assertTrue(b1[2] <= b2[0] or b2[2] <= b1[0] or b1[3] <= b2[1] or b2[3] <= b1[1], "clusters overlap")
+            self.assertEqual(len(list(root.iter(SVG_NS + "line"))), len(of.getGroupEdgeD(clusterList)))
+            #
+            # A new instance reuses the cached group layouts -
+            fc = FigureCache(self.__cachePath)
+            of = OverviewFigures(dictApiObj=self.__dApi, pathInfoObj=self.__pI, pathDot=pathDot, figureCacheObj=fc)
+            statusD = of.makeOverviewFigures(imageFilePath=self.__imageFilePath, graphTitle="Category Relationship Overview", groupFigures=False)
+            self.assertEqual(statusD, {None: True})
+            self.assertEqual(fc.getStats()["misses"], 0)
+            with open(figPath, "rb") as ifh:
+                self.assertEqual(ifh.read(), svgData)
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+
+def overviewFiguresSuite():
+    suiteSelect = unittest.TestSuite()
+    suiteSelect.addTest(OverviewFiguresTests("testGroupDot"))
+    suiteSelect.addTest(OverviewFiguresTests("testOverviewFigures"))
+    return suiteSelect
+
+
+if __name__ == "__main__":
+    mySuite = overviewFiguresSuite()
+    unittest.TextTestRunner(verbosity=2).run(mySuite)
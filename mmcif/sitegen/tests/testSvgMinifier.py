@@ -0,0 +1,119 @@
+##
+# File: testSvgMinifier.py
+# Date:    18-Oct-2026
+# Version: 0.001
+#
+# Update:
+##
+"""
+Tests for SVG figure minification.
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "John Westbrook"
+__email__ = "jwest@rcsb.rutgers.edu"
+__license__ = "Apache 2.0"
+
+import concurrent.futures
+import logging
+import os
+import time
+import unittest
+import xml.etree.ElementTree as ET
+
+from mmcif.sitegen.dictionary.DictionaryFileUtils import DictionaryFileUtils
+from mmcif.sitegen.dictionary.HtmlPathInfo import HtmlPathInfo
+from mmcif.sitegen.dictionary.NeighborFigureRenderer import NeighborFigureRenderer
+from mmcif.sitegen.dictionary.NeighborFigures import NeighborFigures
+from mmcif.sitegen.dictionary.SvgMinifier import SvgMinifier
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s]-%(module)s.%(funcName)s: %(message)s")
+logger = logging.getLogger()
+logger.setLevel(logging.INFO)
+
+HERE = os.path.abspath(os.path.dirname(__file__))
+TOPDIR = os.path.dirname(os.path.dirname(os.path.dirname(HERE)))
+
+SVG_NS = "{http://www.w3.org/2000/svg}"
+XLINK_NS = "{http://www.w3.org/1999/xlink}"
+
+
+class SvgMinifierTests(unittest.TestCase):
+    def setUp(self):
+        #
+        self.__testData = os.path.join(HERE, "test-data")
+        self.__pdbxDictPath = os.path.join(self.__testData, "dictionaries", "mmcif_pdbx_v40.dic")
+        self.__startTime = time.time()
+        logger.info("Starting %s at %s", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+
+    def tearDown(self):
+        endTime = time.time()
+        logger.info("Completed %s at %s (%.4f seconds)", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()), endTime - self.__startTime)
+
+    def __getElementStyles(self, svgData):
+        """Return the presentation style, link and text of each element with any style classes resolved."""
+        root = ET.fromstring(svgData)
+        classD = {}
+        for el in root.iter(SVG_NS + "style"):
+            for rule in el.text.split("}")[:-1]:
+                className, decl = rule.split("{")
+                classD[className[1:]] = dict([tuple(ss.split(":")) for ss in decl.split(";")])
+        rL = []
+        for el in root.iter():
+            if el.tag == SVG_NS + "style":
+                continue
+            sD = {ky: val for ky, val in el.attrib.items() if ky in ["fill", "stroke", "font-family", "font-size", "font-weight", "text-anchor"]}
+            sD.update(classD.get(el.get("class"), {}))
+            if "font-size" in sD:
+                sD["font-size"] = "%g" % float(sD["font-size"].replace("px", ""))
+            rL.append((el.tag, sorted(sD.items()), el.get(XLINK_NS + "href"), el.text if el.tag == SVG_NS + "text" else None))
+        return rL
+
+    def testMinify(self):
+        """Test minification of category neighbor figures"""
+        try:
+            dApi = DictionaryFileUtils(dictFilePath=self.__pdbxDictPath).getApi()
+            pI = HtmlPathInfo(dictFilePath=self.__pdbxDictPath, htmlDocsPath=os.path.join(HERE, "test-output", "site", "mmcif"), htmlTopDirectoryName="dictionaries")
+            nf = NeighborFigures(dictApiObj=dApi, pathInfoObj=pI, pathDot=None, layoutBackend="python")
+            view = nf.getNeighborhoodView(nf.getNeighborhood("entity"), maxItems=20)
+            svgData = NeighborFigureRenderer().render(view, graphTitle="Category <b>entity</b>", titleFormat="html")
+            #
+            smin = SvgMinifier()
+            minData = smin.minify(svgData)
+            logger.info("Minified figure from %d to %d bytes", len(svgData), len(minData))
+            self.assertLess(len(minData), 0.85 * len(svgData))
+            self.assertNotIn(b"<!--", minData)
+            self.assertNotIn(b"\n<", minData)
+            self.assertIn(b"<style>", minData)
+            self.assertEqual(self.__getElementStyles(minData), self.__getElementStyles(svgData))
+            self.assertEqual(smin.minify(minData), minData)
+            self.assertEqual(smin.getStats(), {"figures": 2, "bytesIn": len(svgData) + len(minData), "bytesOut": 2 * len(minData)})
+            #
+            # Concurrent minification is consistent with serial minification -
+            with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+                for threadData in executor.map(smin.minify, [svgData] * 16):
+                    self.assertEqual(threadData, minData)
+            self.assertEqual(smin.getStats()["figures"], 18)
+            #
+            svgText = '<svg width="10.25pt" height="8pt">\n<g id="graph0" transform="scale(1 1) rotate(0) translate(4 8.04)">\n'
+            svgText += '<a xlink:href="/dictionaries/d.dic/Items/_a.b.html" xlink:title="&lt;TABLE&gt;"><text x="-0.04" y="1.96" font-size="9.00">b</text></a>\n</g>\n</svg>\n'
+            minText = '<svg width="10.2pt" height="8pt"><g transform="translate(4 8)">'
+            minText += '<a xlink:href="/dictionaries/d.dic/Items/_a.b.html"><text x="0" y="2" font-size="9">b</text></a></g></svg>\n'
+            self.assertEqual(smin.minifyText(svgText, baseUrl="/dictionaries/d.dic/Images/Categories"), minText)
+            smin = SvgMinifier(precision=2, relativeLinks=True)
+            self.assertIn('xlink:href="../../Items/_a.b.html"', smin.minifyText(svgText, baseUrl="/dictionaries/d.dic/Images/Categories"))
+            self.assertIn('width="10.25pt"', smin.minifyText(svgText))
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+
+def svgMinifierSuite():
+    suiteSelect = unittest.TestSuite()
+    suiteSelect.addTest(SvgMinifierTests("testMinify"))
+    return suiteSelect
+
+
+if __name__ == "__main__":
+    mySuite = svgMinifierSuite()
+    unittest.TextTestRunner(verbosity=2).run(mySuite)
@@ -0,0 +1,125 @@
+##
+# File:    DictionaryJobPool.py
+# Date:    19-Oct-2026
+# Version: 0.001
+#
+# Updates:
+##
+"""
+Run independent per-dictionary workflow tasks in a pool of forked processes.
+"""
+__docformat__ = "restructuredtext en"
+__author__ = "John Westbrook"
+__email__ = "jwest@rcsb.rutgers.edu"
+__license__ = "Apache 2,0"
+
+
+import logging
+import multiprocessing
+import time
+
+logger = logging.getLogger(__name__)
+
+# Job function inherited by forked dictionary job workers -
+_dictionaryJobContextD = {}
+
+
+class _LogRecordCollector(logging.Handler):
+    """Collect the log records of a job in a form that can be returned to the parent process."""
+
+    def __init__(self):
+        super(_LogRecordCollector, self).__init__(level=logging.NOTSET)
+        self.recordList = []
+
+    def emit(self, record):
+        try:
+            if record.exc_info and not record.exc_text:
+                record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.msg = record.getMessage()
+            record.args = None
+            record.exc_info = None
+            self.recordList.append(record)
+        except Exception:
+            self.handleError(record)
+
+
+def _runDictionaryJobWorker(dictName):
+    """Run the context job function for the input dictionary collecting its log records.
+
+    Returns:
+        (str, object, float, list): dictionary name, job result, elapsed seconds and log records
+    """
+    rootLogger = logging.getLogger()
+    handlerList = rootLogger.handlers[:]
+    collector = _LogRecordCollector()
+    rootLogger.handlers = [collector]
+    startTime = time.time()
+    result = None
+    try:
+        result = _dictionaryJobContextD["jobFunction"](dictName)
+    except Exception as e:
+        logger.exception("Failing for %s with %s", dictName, str(e))
+    finally:
+        rootLogger.handlers = handlerList
+    return dictName, result, time.time() - startTime, collector.recordList
+
+
+class DictionaryJobPool(object):
+    """Run a job for each dictionary in a pool of forked worker processes.
+
+    Jobs are started in order of decreasing dictionary size so that the largest dictionaries do not
+    trail the build.  Workers inherit the state of the calling process, the results of each job must
+    be picklable.  The log records of each job are collected in its worker and emitted in the calling
+    process as a block when the job completes.  Jobs are run serially in the calling process for a
+    single job process, a single dictionary, or where the fork start method is unavailable.
+    """
+
+    def __init__(self, numJobs=1, verbose=False):
+        self.__verbose = verbose
+        self.__numJobs = numJobs if numJobs and numJobs > 1 else 1
+
+    def getJobCount(self):
+        return self.__numJobs
+
+    def run(self, jobFunction, dictNameList, sizeD=None):
+        """Run jobFunction(dictName) for each input dictionary.
+
+        Args:
+            jobFunction (callable): job function taking a dictionary name
+            dictNameList (list): dictionary names
+            sizeD (dict, optional): relative size of each dictionary {dictName: size, ...} setting the job order
+
+        Returns:
+            dict: {dictName: (result, elapsed seconds), ...} in the input dictionary order with a None result for failed jobs
+        """
+        sizeD = sizeD if sizeD else {}
+        jobNameList = sorted(dictNameList, key=lambda x: sizeD.get(x, 0), reverse=True)
+        numJobs = min(self.__numJobs, len(jobNameList))
+        resultD = {}
+        if numJobs > 1 and "fork" not in multiprocessing.get_all_start_methods():
+            logger.warning("Process fork is not supported on this platform - running dictionary jobs serially")
+            numJobs = 1
+        if numJobs < 2:
+            for dictName in jobNameList:
+                startTime = time.time()
+                result = None
+                try:
+                    result = jobFunction(dictName)
+                except Exception as e:
+                    logger.exception("Failing for %s with %s", dictName, str(e))
+                resultD[dictName] = (result, time.time() - startTime)
+        else:
+            _dictionaryJobContextD["jobFunction"] = jobFunction
+            try:
+                with multiprocessing.get_context("fork").Pool(processes=numJobs) as pool:
+                    for dictName, result, elapsed, recordList in pool.imap_unordered(_runDictionaryJobWorker, jobNameList):
+                        for record in recordList:
+                            logging.getLogger(record.name).handle(record)
+                        resultD[dictName] = (result, elapsed)
+                        logger.info("Completed dictionary job %s (%.4f seconds, %d of %d)", dictName, elapsed, len(resultD), len(jobNameList))
+            finally:
+                _dictionaryJobContextD.clear()
+        #
+        for dictName in jobNameList:
+            logger.info("Dictionary job %-24s %10.4f seconds", dictName, resultD[dictName][1])
+        return {dictName: resultD[dictName] for dictName in dictNameList}
@@ -5,6 +5,17 @@
 # Version: 0.001
 #
 # Updates:
+#  18-Oct-2026  stream the large index pages directly to their output files
+#  18-Oct-2026  optional multi-process rendering of category and item pages
+#  18-Oct-2026  locate category figures from the figure manifest
+#  18-Oct-2026  optional alphabetical index pages with lazily loaded fragments
+#  18-Oct-2026  optional client-side search index build stage
+#  18-Oct-2026  optional per-dictionary row limit for enumeration tables
+#  19-Oct-2026  optional inline primary figures on category pages
+#  19-Oct-2026  optional rendering of dictionaries in a pool of job processes
+#  19-Oct-2026  optional incremental builds rendering only pages with changed inputs
+#  19-Oct-2026  complete or discard streamed index pages within htmlFile() contexts
+#  19-Oct-2026  write each lazily loaded index fragment as it is rendered
 ##
 """
 Workflow methods for rendering mmCIF dictionaries in HTML
@@ -15,7 +26,10 @@ __email__ = "jwest@rcsb.rutgers.edu"
 __license__ = "Apache 2,0"
 
 
+import hashlib
+import inspect
 import logging
+import multiprocessing
 import os
 import stat
 import time
@@ -24,20 +38,102 @@ from mmcif.sitegen.dictionary import __version__
 from mmcif.sitegen.dictionary.DictionaryFileUtils import DictionaryFileUtils
 from mmcif.sitegen.dictionary.DictionaryItemCoverage import DictionaryItemCoverage
 from mmcif.sitegen.dictionary.DictionaryRegistry import DictionaryRegistry
+from mmcif.sitegen.dictionary.DictionarySearchIndex import DictionarySearchIndex
+from mmcif.sitegen.dictionary.FigureManifest import FigureManifest
 from mmcif.sitegen.dictionary.HtmlContentUtils import HtmlContentUtils
 from mmcif.sitegen.dictionary.HtmlGenerator import HtmlGenerator
 from mmcif.sitegen.dictionary.HtmlGenerator import HtmlTemplates
 from mmcif.sitegen.dictionary.HtmlMarkupUtils import HtmlComponentMarkupUtils
 from mmcif.sitegen.dictionary.HtmlMarkupUtils import HtmlMarkupUtils
 from mmcif.sitegen.dictionary.HtmlPathInfo import HtmlPathInfo
+from mmcif.sitegen.dictionary.PageManifest import PageManifest
+from mmcif.sitegen.wf.DictionaryJobPool import DictionaryJobPool
 
 logger = logging.getLogger(__name__)
 
+# Rendering context inherited by forked page rendering workers -
+_pageRenderContextD = {}
+
+
+def renderCategoryPages(hcU, hg, dApi, categoryNameList, pageSet=None):
+    """Render the pages for each input category and its data items.
+
+    Args:
+        pageSet (set, optional): render only these pages {(contentObjName, contentType), ...} (default=None, all pages)
+
+    Returns:
+        (int, bool): page count and success flag
+    """
+    ok = True
+    pageCount = 0
+    for categoryName in categoryNameList:
+        if pageSet is None or (categoryName, "Categories") in pageSet:
+            pageHtmlList = hcU.makeCategoryPage(categoryName)
+            ok = hg.writeHtmlFile(categoryName, title="Data Category", subTitle=categoryName, contentType="Categories", htmlContentList=pageHtmlList, navBarContentType="none") and ok
+            pageCount += 1
+        itemNameList = dApi.getItemNameList(categoryName)
+        for itemName in itemNameList:
+            if pageSet is not None and (itemName, "Items") not in pageSet:
+                continue
+            pageHtmlList = hcU.makeItemPage(itemName)
+            ok = hg.writeHtmlFile(itemName, title="Data Item", subTitle=itemName, contentType="Items", htmlContentList=pageHtmlList, navBarContentType="none") and ok
+            pageCount += 1
+            for dataName, tableObj in hcU.popDeferredTables().items():
+                ok = hg.writeDataFile(dataName, "Items", tableObj) and ok
+    return pageCount, ok
+
+
+def _renderCategoryPagesWorker(categoryNameList):
+    try:
+        cD = _pageRenderContextD
+        return renderCategoryPages(cD["hcU"], cD["hg"], cD["dApi"], categoryNameList, pageSet=cD["pageSet"])
+    except Exception as e:
+        logger.exception("Failing with %s", str(e))
+    return 0, False
+
 
 class HtmlGeneratorWf(object):
-    def __init__(self, websiteGenPath="/var/www/mmcif_website_generated", websiteFileAssetsPath="/var/www/mmcif_website_file_assets", testMode=False):
+    def __init__(
+        self,
+        websiteGenPath="/var/www/mmcif_website_generated",
+        websiteFileAssetsPath="/var/www/mmcif_website_file_assets",
+        testMode=False,
+        numProc=1,
+        lazyIndex=False,
+        searchIndex=False,
+        enumRowLimit=None,
+        inlineFigures=False,
+        numJobs=1,
+        incremental=False,
+    ):
+        """Workflow to render dictionaries in HTML.
+
+        Args:
+            numProc (int, optional): number of processes used to render category and item pages (default=1, serial)
+            lazyIndex (bool, optional): render the alphabetical category and item index pages as light page shells
+                                        with the content for each leading character loaded on demand (default=False)
+            searchIndex (bool, optional): build the static client-side search index for each dictionary (default=False)
+            enumRowLimit (int, optional): maximum number of enumeration rows rendered in item pages with the complete
+                                          tables loaded on demand (default=None, no limit).  A dictionary registry
+                                          'enumRowLimit' setting takes precedence for that dictionary.
+            inlineFigures (bool, optional): embed the primary relationship figure in each category page and link the other
+                                            figure variants (default=False, see HtmlContentUtils.setInlineFigures())
+            numJobs (int, optional): number of processes rendering dictionaries concurrently, largest dictionaries first
+                                     (default=1, serial).  The pages of each dictionary are then rendered serially
+                                     within its job process.
+            incremental (bool, optional): render only the category and item pages with inputs changed since the
+                                          previous build and remove the pages of deleted categories, items and
+                                          groups (default=False, see PageManifest)
+        """
         self.__verbose = True
         self.__testMode = testMode
+        self.__numProc = numProc if numProc and numProc > 1 else 1
+        self.__lazyIndex = lazyIndex
+        self.__searchIndex = searchIndex
+        self.__enumRowLimit = enumRowLimit
+        self.__inlineFigures = inlineFigures
+        self.__numJobs = numJobs if numJobs and numJobs > 1 else 1
+        self.__incremental = incremental
         # Top path for generated content
         self.__webGenPath = websiteGenPath
         #
@@ -61,6 +157,12 @@ class HtmlGeneratorWf(object):
         if self.__testMode:
             self.__fullDictionaryNameList = self.__fullDictionaryNameList[:1]
         self.__startTimeD = {}
+        # Rendering status and time for each dictionary {dictName: (bool, seconds), ...}
+        self.__dictionaryResultD = {}
+
+    def getDictionaryResults(self):
+        """Return the rendering status and time of each dictionary in the last run {dictName: (bool, seconds), ...}"""
+        return self.__dictionaryResultD
 
     def __logBegin(self, taskName="task"):
         self.__startTimeD[taskName] = time.time()
@@ -75,25 +177,50 @@ class HtmlGeneratorWf(object):
         ok = False
         try:
             ok = self.__renderDownloadList()
-            for dictName in self.__fullDictionaryNameList:
-                self.__logBegin(taskName=dictName)
-                dictPath = os.path.join(self.__pdbxResourcePath, dictName + ".dic")
-                ok = self.__makeDirectories(pathDictionary=dictPath)
-                leadingGroupList = None
-                if dictName == "mmcif_mdb":
-                    leadingGroupList = ["mdb_group"]
-                elif dictName == "mmcif_sas":
-                    leadingGroupList = ["sas_group"]
-                elif dictName == "mmcif_ma":
-                    leadingGroupList = ["ma_group"]
-                elif dictName == "mmcif_nef":
-                    leadingGroupList = ["nef_group"]
-                elif dictName == "mmcif_ihm":
-                    leadingGroupList = ["ihm_group"]
-
-                ok1 = self.__renderHtmlDictionary(dictionaryName=dictName, pathDictionary=dictPath, leadingGroupList=leadingGroupList)
-                ok = ok1 and ok
-                self.__logEnd(taskName=dictName)
+            jobPool = DictionaryJobPool(numJobs=self.__numJobs, verbose=self.__verbose)
+            numProc = self.__numProc
+            if jobPool.getJobCount() > 1:
+                # job processes cannot fork page rendering workers of their own -
+                self.__numProc = 1
+            try:
+                self.__dictionaryResultD = jobPool.run(self.renderDictionary, self.__fullDictionaryNameList, sizeD=self.__getDictionarySizes())
+            finally:
+                self.__numProc = numProc
+            ok = all([dictOk for dictOk, _ in self.__dictionaryResultD.values()]) and ok
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+        return ok
+
+    def __getDictionarySizes(self):
+        """Return the file size of each dictionary as a measure of its rendering cost."""
+        sizeD = {}
+        for dictName in self.__fullDictionaryNameList:
+            dictPath = os.path.join(self.__pdbxResourcePath, dictName + ".dic")
+            sizeD[dictName] = os.path.getsize(dictPath) if os.path.isfile(dictPath) else 0
+        return sizeD
+
+    def renderDictionary(self, dictName):
+        """Render the HTML pages for the input dictionary --"""
+        ok = False
+        try:
+            self.__logBegin(taskName=dictName)
+            dictPath = os.path.join(self.__pdbxResourcePath, dictName + ".dic")
+            ok = self.__makeDirectories(pathDictionary=dictPath)
+            leadingGroupList = None
+            if dictName == "mmcif_mdb":
+                leadingGroupList = ["mdb_group"]
+            elif dictName == "mmcif_sas":
+                leadingGroupList = ["sas_group"]
+            elif dictName == "mmcif_ma":
+                leadingGroupList = ["ma_group"]
+            elif dictName == "mmcif_nef":
+                leadingGroupList = ["nef_group"]
+            elif dictName == "mmcif_ihm":
+                leadingGroupList = ["ihm_group"]
+
+            ok1 = self.__renderHtmlDictionary(dictionaryName=dictName, pathDictionary=dictPath, leadingGroupList=leadingGroupList)
+            ok = ok1 and ok
+            self.__logEnd(taskName=dictName)
         except Exception as e:
             logger.exception("Failing with %s", str(e))
         return ok
@@ -255,6 +382,17 @@ class HtmlGeneratorWf(object):
             hcU.setItemCounts(archiveItemNameD, deliveryType="archive")
             hcU.setItemCounts(ccItemNameD, deliveryType="cc")
             hcU.setItemCounts(prdItemNameD, deliveryType="prd")
+            #
+            enumRowLimit = self.__dR.getEnumRowLimit(dictionaryName)
+            hcU.setEnumTableRowLimit(enumRowLimit if enumRowLimit is not None else self.__enumRowLimit)
+            hcU.setInlineFigures(self.__inlineFigures)
+            #
+            fm = FigureManifest(pI.getDictCategoryImageManifestPath(), verbose=self.__verbose)
+            if fm.read():
+                hcU.setFigureManifest(fm)
+                logger.info("Using figure manifest for %s with %d figures", dictionaryName, fm.getFigureCount())
+            else:
+                logger.info("No figure manifest for %s - probing for category figures", dictionaryName)
 
             try:
                 tS = self.__dR.getTitle(dictionaryName=dictionaryName)
@@ -278,8 +416,10 @@ class HtmlGeneratorWf(object):
             subTitle = dApi.getDictionaryTitle()
             hg.writeHtmlFile("index", title="Dictionary Index", subTitle=subTitle, contentType="Index", htmlContentList=pageHtmlList)
             #
-            pageHtmlList = hcU.makeCategoryGroupIndex(leadingList=leadingGroupList)
-            hg.writeHtmlFile("index", title="Category Group Index", subTitle=subTitle, contentType="Groups", htmlContentList=pageHtmlList)
+            # Index pages are streamed to their output files panel by panel -
+            with hg.htmlFile("index", title="Category Group Index", subTitle=subTitle, contentType="Groups") as ofh:
+                if ofh:
+                    hcU.makeCategoryGroupIndex(leadingList=leadingGroupList, outputStream=ofh)
             groupNameList = dApi.getCategoryGroups()
             for groupName in groupNameList:
                 pageHtmlList = hcU.makeCategoryGroupPage(groupName)
@@ -287,29 +427,155 @@ class HtmlGeneratorWf(object):
 
             #
             #
-            pageHtmlList = hcU.makeCategoryAlphaIndex()
-            hg.writeHtmlFile("index", title="Category Index", subTitle=subTitle, contentType="Categories", htmlContentList=pageHtmlList)
-
-            pageHtmlList = hcU.makeItemCategoryAlphaIndex(openFirst=True)
-            hg.writeHtmlFile("index", title="Item Index", subTitle=subTitle, contentType="Items", htmlContentList=pageHtmlList)
+            if self.__lazyIndex:
+                pageHtmlList, fragments = hcU.makeCategoryAlphaIndexLazy()
+                self.__writeLazyIndex(hg, pageHtmlList, fragments, title="Category Index", subTitle=subTitle, contentType="Categories")
+                pageHtmlList, fragments = hcU.makeItemCategoryAlphaIndexLazy(openFirst=True)
+                self.__writeLazyIndex(hg, pageHtmlList, fragments, title="Item Index", subTitle=subTitle, contentType="Items")
+            else:
+                with hg.htmlFile("index", title="Category Index", subTitle=subTitle, contentType="Categories") as ofh:
+                    if ofh:
+                        hcU.makeCategoryAlphaIndex(outputStream=ofh)
+                with hg.htmlFile("index", title="Item Index", subTitle=subTitle, contentType="Items") as ofh:
+                    if ofh:
+                        hcU.makeItemCategoryAlphaIndex(openFirst=True, outputStream=ofh)
 
-            pageCount = 0
             categoryNameList = dApi.getCategoryList()
-            for categoryName in categoryNameList:
-                pageHtmlList = hcU.makeCategoryPage(categoryName)
-                hg.writeHtmlFile(categoryName, title="Data Category", subTitle=categoryName, contentType="Categories", htmlContentList=pageHtmlList, navBarContentType="none")
-                pageCount += 1
-                itemNameList = dApi.getItemNameList(categoryName)
-                for itemName in itemNameList:
-                    pageHtmlList = hcU.makeItemPage(itemName)
-                    hg.writeHtmlFile(itemName, title="Data Item", subTitle=itemName, contentType="Items", htmlContentList=pageHtmlList, navBarContentType="none")
-                    pageCount += 1
+            pm = pageSet = None
+            if self.__incremental:
+                pm = PageManifest(pI.getDictPageManifestPath(), verbose=self.__verbose)
+                pageSet = self.__updatePageManifest(pm, hcU, dApi, pI, categoryNameList, groupNameList)
+            if self.__numProc > 1:
+                pageCount, pageOk = self.__renderCategoryPagesMulti(hcU, hg, dApi, categoryNameList, pageSet=pageSet)
+            else:
+                pageCount, pageOk = renderCategoryPages(hcU, hg, dApi, categoryNameList, pageSet=pageSet)
             logger.debug("HTML page count %d", pageCount)
+            if pm is not None:
+                # a failed page is rendered again by the next build -
+                if not (pageOk and pm.write()):
+                    pm.remove()
             #
             pageHtmlList = hcU.makeSupportingDataIndex()
             subTitle = dApi.getDictionaryTitle()
             ok = hg.writeHtmlFile("index", title="Supporting Data", subTitle=subTitle, contentType="Data", htmlContentList=pageHtmlList)
+            #
+            if self.__searchIndex:
+                dsi = DictionarySearchIndex(dApi, pI, itemRecordsObj=hcU.getItemRecords(), verbose=self.__verbose)
+                ok = dsi.build() and dsi.write() and ok
 
         except Exception as e:
             logger.exception("Failing with %s", str(e))
         return ok
+
+    def __writeLazyIndex(self, hg, pageHtmlList, fragments, title, subTitle, contentType):
+        """Write an index page shell and the fragments it loads on demand, each fragment as it is rendered."""
+        ok = hg.writeHtmlFile("index", title=title, subTitle=subTitle, contentType=contentType, htmlContentList=pageHtmlList)
+        for fragmentName, fragmentHtmlList in fragments:
+            ok = hg.writeHtmlFragment(fragmentName, contentType, fragmentHtmlList) and ok
+        return ok
+
+    def __getRendererId(self, pathInfoObj):
+        """Return an identifier of the page templates and rendering code shared by all pages (see PageManifest)."""
+        hObj = hashlib.sha1()
+        for obj in [HtmlContentUtils, HtmlTemplates, HtmlMarkupUtils, HtmlPathInfo, renderCategoryPages]:
+            with open(inspect.getsourcefile(obj), "rb") as ifh:
+                hObj.update(ifh.read())
+        return "mmcif.sitegen %s %s %s" % (__version__, hObj.hexdigest(), pathInfoObj.getContentTypeObjUrl("", "Categories"))
+
+    def __updatePageManifest(self, pageManifestObj, hcU, dApi, pathInfoObj, categoryNameList, groupNameList):
+        """Update the page manifest with the input fingerprints of the current category and item pages and remove
+        the pages of deleted categories, items and groups.
+
+        Returns:
+            set: category and item pages to render {(contentObjName, contentType), ...}
+        """
+        pm = pageManifestObj
+        rendererId = self.__getRendererId(pathInfoObj)
+        if not pm.read() or pm.getRendererId() != rendererId:
+            logger.info("No page manifest for the current renderer - rendering all pages")
+            pm.clear()
+            pm.setRendererId(rendererId)
+        #
+        pageSet = set()
+        pageCount = 0
+        currentD = {"Categories": set(categoryNameList), "Items": set(), "Groups": set(groupNameList)}
+        for categoryName in categoryNameList:
+            itemNameList = dApi.getItemNameList(categoryName)
+            currentD["Items"].update(itemNameList)
+            for contentObjName, contentType in [(categoryName, "Categories")] + [(itemName, "Items") for itemName in itemNameList]:
+                pageCount += 1
+                fingerprint = hcU.getPageFingerprint(contentObjName, contentType)
+                if fingerprint != pm.getFingerprint(contentObjName, contentType) or not os.access(pathInfoObj.getContentTypeObjPath(contentObjName, contentType), os.F_OK):
+                    pageSet.add((contentObjName, contentType))
+                    pm.setFingerprint(contentObjName, contentType, fingerprint)
+        for groupName in groupNameList:
+            pm.setFingerprint(groupName, "Groups", None)
+        #
+        removeCount = 0
+        for contentType, nameSet in currentD.items():
+            for contentObjName in pm.getPageNameList(contentType):
+                if contentObjName not in nameSet:
+                    pm.removePage(contentObjName, contentType)
+                    removeCount += self.__removePage(pathInfoObj, contentObjName, contentType)
+        # deferred tables of changed items are written again as needed -
+        for contentObjName, contentType in pageSet:
+            if contentType == "Items":
+                self.__removePage(pathInfoObj, contentObjName, contentType, dataOnly=True)
+        logger.info("Incremental build of %s rendering %d of %d category and item pages removing %d pages", dApi.getDictionaryTitle(), len(pageSet), pageCount, removeCount)
+        return pageSet
+
+    def __removePage(self, pathInfoObj, contentObjName, contentType, dataOnly=False):
+        """Remove the page and page data files for the input content object.  Returns the number of pages removed."""
+        pthList = [] if dataOnly else [pathInfoObj.getContentTypeObjPath(contentObjName, contentType)]
+        if contentType == "Items":
+            pthList.extend([pathInfoObj.getContentTypeDataPath(contentObjName + suffix, contentType) for suffix in ["_enum", "_enumalt"]])
+        removeCount = 0
+        for pth in pthList:
+            try:
+                if os.path.exists(pth):
+                    os.remove(pth)
+                    removeCount += 1 if pth.endswith(".html") else 0
+            except Exception as e:
+                logger.error("Failing to remove %s with %s", pth, str(e))
+        return removeCount
+
+    def __renderCategoryPagesMulti(self, hcU, hg, dApi, categoryNameList, pageSet=None):
+        """Render category and item pages in a pool of forked worker processes.
+
+        Workers inherit the loaded dictionary and content utilities from this process. Categories
+        are dealt out in chunks of roughly equal page counts.  Falls back to serial rendering
+        where the fork start method is unavailable.
+        """
+        if "fork" not in multiprocessing.get_all_start_methods():
+            logger.warning("Process fork is not supported on this platform - rendering pages serially")
+            return renderCategoryPages(hcU, hg, dApi, categoryNameList, pageSet=pageSet)
+        #
+        pageCountD = {}
+        for categoryName in categoryNameList:
+            nameList = [(categoryName, "Categories")] + [(itemName, "Items") for itemName in dApi.getItemNameList(categoryName)]
+            pageCountD[categoryName] = len(nameList) if pageSet is None else len([ky for ky in nameList if ky in pageSet])
+        categoryNameList = [categoryName for categoryName in categoryNameList if pageCountD[categoryName]]
+        numChunks = min(len(categoryNameList), self.__numProc * 4)
+        if numChunks < 2:
+            return renderCategoryPages(hcU, hg, dApi, categoryNameList, pageSet=pageSet)
+        #
+        # Deal categories (largest first) to the chunk with the fewest pages -
+        chunkL = [[] for _ in range(numChunks)]
+        countL = [0] * numChunks
+        for categoryName in sorted(categoryNameList, key=lambda x: pageCountD[x], reverse=True):
+            ii = countL.index(min(countL))
+            chunkL[ii].append(categoryName)
+            countL[ii] += pageCountD[categoryName]
+        #
+        pageCount = 0
+        ok = True
+        _pageRenderContextD.update({"hcU": hcU, "hg": hg, "dApi": dApi, "pageSet": pageSet})
+        try:
+            with multiprocessing.get_context("fork").Pool(processes=self.__numProc) as pool:
+                for chunkPageCount, chunkOk in pool.imap_unordered(_renderCategoryPagesWorker, chunkL):
+                    pageCount += chunkPageCount
+                    ok = ok and chunkOk
+        finally:
+            _pageRenderContextD.clear()
+        logger.info("Rendered %d pages using %d processes", pageCount, self.__numProc)
+        return pageCount, ok
@@ -5,7 +5,19 @@
 # Version: 0.001
 #
 # Updates:
-#
+#  18-Oct-2026  write a manifest of the generated figures for each dictionary
+#  18-Oct-2026  run figure layouts concurrently after generating the dot instructions
+#  18-Oct-2026  optionally keep the dot instructions for each figure for debugging
+#  18-Oct-2026  optional persistent figure cache keyed by the dot instructions
+#  18-Oct-2026  select the in-process Graphviz library or dot executable layout backend
+#  18-Oct-2026  stream batches of figures through each dot process
+#  18-Oct-2026  add the built-in 'python' figure layout backend
+#  18-Oct-2026  optional minification of SVG figures with a report of the bytes saved
+#  19-Oct-2026  per-figure layout time and memory limits with simplified layouts of figures exceeding them
+#  19-Oct-2026  optional category relationship overview figures for each dictionary and category group
+#  19-Oct-2026  optional generation of the figures for each dictionary in a pool of job processes
+#  19-Oct-2026  optional incremental builds laying out only figures with changed inputs
+#  19-Oct-2026  keep concurrent dot executable layouts when the Graphviz library is installed, find dot on the PATH
 ##
 """
 Workflow for generating category neighbor diagram figures.
@@ -16,17 +28,24 @@ __email__ = "jwest@rcsb.rutgers.edu"
 __license__ = "Apache 2,0"
 
 
+import concurrent.futures
 import logging
 import os
+import shutil
 import time
 
 from mmcif.sitegen.dictionary import __version__
 from mmcif.sitegen.dictionary.DictionaryFileUtils import DictionaryFileUtils
 from mmcif.sitegen.dictionary.DictionaryItemCoverage import DictionaryItemCoverage
 from mmcif.sitegen.dictionary.DictionaryRegistry import DictionaryRegistry
+from mmcif.sitegen.dictionary.FigureCache import FigureCache
+from mmcif.sitegen.dictionary.FigureManifest import FigureManifest
 from mmcif.sitegen.dictionary.HtmlGenerator import HtmlGenerator
 from mmcif.sitegen.dictionary.HtmlPathInfo import HtmlPathInfo
 from mmcif.sitegen.dictionary.NeighborFigures import NeighborFigures
+from mmcif.sitegen.dictionary.OverviewFigures import OverviewFigures
+from mmcif.sitegen.dictionary.SvgMinifier import SvgMinifier
+from mmcif.sitegen.wf.DictionaryJobPool import DictionaryJobPool
 
 logger = logging.getLogger(__name__)
 
@@ -36,9 +55,66 @@ TOPDIR = os.path.dirname(os.path.dirname(HERE))
 
 
 class NeighborFiguresWf(object):
-    def __init__(self, websiteGenPath="/var/www/mmcif_website_generated", websiteFileAssetsPath="/var/www/mmcif_website_file_assets", testMode=False):
+    def __init__(
+        self,
+        websiteGenPath="/var/www/mmcif_website_generated",
+        websiteFileAssetsPath="/var/www/mmcif_website_file_assets",
+        testMode=False,
+        numProc=None,
+        keepDot=False,
+        figureCachePath=None,
+        layoutBackend="auto",
+        batchSize=100,
+        minifyFigures=False,
+        relativeFigureLinks=False,
+        layoutTimeout=None,
+        layoutMemoryLimit=None,
+        overviewFigures=False,
+        numJobs=1,
+        incremental=False,
+    ):
+        """Workflow to render category neighbor diagram figures.
+
+        Args:
+            numProc (int, optional): maximum number of concurrent figure layout processes for each dictionary
+                                     (default=None, the number of host cores divided by numJobs)
+            keepDot (bool, optional): write the dot instructions for each figure alongside the figure (default=False)
+            figureCachePath (str, optional): directory of a persistent cache of rendered figures keyed by their dot instructions
+                                             and layout options.  Layout is skipped for cached figures (default=None, no cache)
+            layoutBackend (str, optional): 'auto', 'library' or 'binary' to lay out figures in-process with the Graphviz library
+                                           (pygraphviz) when installed or with the dot executable, or 'python' to render SVG
+                                           figures with the built-in renderer (default='auto', see NeighborFigures).  Library
+                                           layouts are serialized, so for more than one layout process 'auto' runs the dot
+                                           executable when it is available
+            batchSize (int, optional): maximum number of figures streamed through each dot process, 1 to run dot for each figure (default=100)
+            minifyFigures (bool, optional): minify the SVG figures (default=False, see SvgMinifier)
+            relativeFigureLinks (bool, optional): rewrite the links in minified figures relative to the figure location (default=False)
+            layoutTimeout (float, optional): maximum time (seconds) for the dot layout of each figure (default=None, no limit)
+            layoutMemoryLimit (int, optional): maximum address space (MB) of each dot process (default=None, no limit)
+            overviewFigures (bool, optional): also render category relationship overview figures for each dictionary and
+                                              category group (default=False, see OverviewFigures)
+            numJobs (int, optional): number of processes generating the figures of different dictionaries concurrently,
+                                     largest dictionaries first (default=1, serial)
+            incremental (bool, optional): lay out only the figures with layout inputs changed since the previous build
+                                          and remove the figures of deleted categories (default=False, see
+                                          NeighborFigures.getFigureFingerprint())
+
+        Figures exceeding the layout limits are laid out again in a simplified form and recorded in the figure
+        manifest and the degraded figure report (getDegradedFigures()).
+        """
         self.__verbose = True
+        self.__keepDot = keepDot
+        self.__layoutBackend = layoutBackend
+        self.__layoutTimeout = layoutTimeout
+        self.__layoutMemoryLimit = layoutMemoryLimit
+        self.__overviewFigures = overviewFigures
+        self.__numJobs = numJobs if numJobs and numJobs > 1 else 1
+        self.__incremental = incremental
+        self.__batchSize = max(1, batchSize or 1)
+        self.__figureCache = FigureCache(figureCachePath, verbose=self.__verbose) if figureCachePath else None
+        self.__svgMinifier = SvgMinifier(relativeLinks=relativeFigureLinks, verbose=self.__verbose) if minifyFigures else None
         self.__testMode = testMode
+        self.__numProc = numProc if numProc and numProc > 0 else max(1, (os.cpu_count() or 1) // self.__numJobs)
         #
         # site path details --
         self.__pathDot = self.__findGraphvizDot()
@@ -65,6 +141,20 @@ class NeighborFiguresWf(object):
             self.__fullDictionaryNameList = self.__fullDictionaryNameList[:1]
 
         self.__startTimeD = {}
+        # Layout status for each figure {dictName: {(categoryName, variant): bool, ...}, ...}
+        self.__figureStatusD = {}
+        # Simplification of degraded figures {dictName: {(categoryName, variant): description, ...}, ...}
+        self.__degradedFigureD = {}
+
+    def getFigureStatus(self):
+        """Return the layout status of each figure {dictName: {(categoryName, variant): bool, ...}, ...}"""
+        return self.__figureStatusD
+
+    def getDegradedFigures(self):
+        """Return the simplification of each figure laid out in a simplified form after exceeding the layout limits
+        {dictName: {(categoryName, variant): description, ...}, ...}
+        """
+        return self.__degradedFigureD
 
     def __logBegin(self, taskName="task"):
         self.__startTimeD[taskName] = time.time()
@@ -76,29 +166,96 @@ class NeighborFiguresWf(object):
 
     def run(self):
         """Run workflow to render of all category-level figures for current dictionary list."""
+        ok = False
         try:
+            jobPool = DictionaryJobPool(numJobs=self.__numJobs, verbose=self.__verbose)
+            resultD = jobPool.run(self.__makeDictionaryFigures, self.__fullDictionaryNameList, sizeD=self.__getDictionarySizes())
             ok = True
-            for dictName in self.__fullDictionaryNameList:
-                logger.info("Starting figures generation for dictionary %s", dictName)
-                self.__logBegin(taskName=dictName)
-                dictPath = os.path.join(self.__pdbxResourcePath, dictName + ".dic")
-                pI = HtmlPathInfo(dictFilePath=dictPath, htmlDocsPath=self.__webGenPath, htmlTopDirectoryName=self.__dictTopDir, verbose=self.__verbose)
-                dfu = DictionaryFileUtils(dictFilePath=dictPath, verbose=self.__verbose)
-                dApi = dfu.getApi()
-                self.__makeDirectories(pathInfoObj=pI, purge=False)
-                categoryNameList = dApi.getCategoryList()
-                figureCount = self.__makeCategoryNeighborFiguresAuto(categoryNameList=categoryNameList, dApi=dApi, pathInfoObj=pI)
-                ok1 = figureCount > 0
-                ok = ok1 and ok
-                self.__logEnd(taskName=dictName)
+            cacheStatsD = {}
+            minifyStatsD = {}
+            for dictName, (rD, _) in resultD.items():
+                if not rD:
+                    ok = False
+                    continue
+                self.__figureStatusD[dictName] = rD["figureStatus"]
+                self.__degradedFigureD[dictName] = rD["degradedFigures"]
+                ok = rD["status"] and ok
+                for ky, val in rD["cacheStats"].items():
+                    cacheStatsD[ky] = cacheStatsD.get(ky, 0) + val
+                for ky, val in rD["minifyStats"].items():
+                    minifyStatsD[ky] = minifyStatsD.get(ky, 0) + val
+            if self.__figureCache is not None:
+                sD = cacheStatsD
+                logger.info(
+                    "Figure cache hits %d misses %d stored %d (%.1f%% hit rate, %d bytes reused)",
+                    sD.get("hits", 0),
+                    sD.get("misses", 0),
+                    sD.get("stores", 0),
+                    100.0 * sD.get("hits", 0) / max(1, sD.get("hits", 0) + sD.get("misses", 0)),
+                    sD.get("bytesRead", 0),
+                )
+            if self.__svgMinifier is not None:
+                sD = minifyStatsD
+                logger.info(
+                    "Minified %d figures from %d to %d bytes (%d bytes or %.1f%% saved)",
+                    sD.get("figures", 0),
+                    sD.get("bytesIn", 0),
+                    sD.get("bytesOut", 0),
+                    sD.get("bytesIn", 0) - sD.get("bytesOut", 0),
+                    100.0 * (sD.get("bytesIn", 0) - sD.get("bytesOut", 0)) / max(1, sD.get("bytesIn", 0)),
+                )
         except Exception as e:
             logger.exception("Failing with %s", str(e))
         return ok
 
+    def __getDictionarySizes(self):
+        """Return the file size of each dictionary as a measure of its figure generation cost."""
+        sizeD = {}
+        for dictName in self.__fullDictionaryNameList:
+            dictPath = os.path.join(self.__pdbxResourcePath, dictName + ".dic")
+            sizeD[dictName] = os.path.getsize(dictPath) if os.path.isfile(dictPath) else 0
+        return sizeD
+
+    def __getStatsDelta(self, startStatsD, obj):
+        if obj is None:
+            return {}
+        return {ky: val - startStatsD.get(ky, 0) for ky, val in obj.getStats().items()}
+
+    def __makeDictionaryFigures(self, dictName):
+        """Create the figures for the input dictionary (a dictionary job, see DictionaryJobPool).
+
+        Returns:
+            dict: {"status": bool, "figureStatus": {...}, "degradedFigures": {...}, "cacheStats": {...}, "minifyStats": {...}}
+                  with the figure cache and minification statistics for this dictionary
+        """
+        cacheStatsD = self.__figureCache.getStats() if self.__figureCache is not None else {}
+        minifyStatsD = self.__svgMinifier.getStats() if self.__svgMinifier is not None else {}
+        logger.info("Starting figures generation for dictionary %s", dictName)
+        self.__logBegin(taskName=dictName)
+        dictPath = os.path.join(self.__pdbxResourcePath, dictName + ".dic")
+        pI = HtmlPathInfo(dictFilePath=dictPath, htmlDocsPath=self.__webGenPath, htmlTopDirectoryName=self.__dictTopDir, verbose=self.__verbose)
+        dfu = DictionaryFileUtils(dictFilePath=dictPath, verbose=self.__verbose)
+        dApi = dfu.getApi()
+        self.__makeDirectories(pathInfoObj=pI, purge=False)
+        categoryNameList = dApi.getCategoryList()
+        statusD, degradedD = self.__makeCategoryNeighborFiguresAuto(categoryNameList=categoryNameList, dApi=dApi, pathInfoObj=pI)
+        ok = any(statusD.values())
+        if self.__overviewFigures:
+            ok = self.__makeOverviewFigures(dApi=dApi, pathInfoObj=pI) and ok
+        self.__logEnd(taskName=dictName)
+        return {
+            "status": ok,
+            "figureStatus": statusD,
+            "degradedFigures": degradedD,
+            "cacheStats": self.__getStatsDelta(cacheStatsD, self.__figureCache),
+            "minifyStats": self.__getStatsDelta(minifyStatsD, self.__svgMinifier),
+        }
+
     def __findGraphvizDot(self):
         pathDot = os.getenv("GRAPHVIZ_DOT_BINARY", default=None)
         pthList = [pathDot] if pathDot else []
         pthList.extend(["/usr/bin/dot", "/usr/local/bin/dot", "/opt/bin/dot"])
+        pthList.extend([pth for pth in [shutil.which("dot")] if pth])
         for pth in pthList:
             if os.path.isfile(pth) and os.access(pth, os.X_OK):
                 return pth
@@ -114,24 +271,51 @@ class NeighborFiguresWf(object):
         return itemCountD
 
     def __makeCategoryNeighborFiguresAuto(self, categoryNameList, dApi=None, pathInfoObj=None):
-        """Create neighbor figures for input categories using the input dictionary api and pathInfo objects."""
+        """Create neighbor figures for input categories using the input dictionary api and pathInfo objects.
+
+        The dot instructions for all figures are written first and the figure layouts are then run concurrently.
+
+        Returns:
+            (dict, dict): layout status for each figure {(categoryName, variant): bool, ...} and the simplification of
+                          each degraded figure {(categoryName, variant): description, ...}
+        """
+        statusD = {}
+        degradedD = {}
         try:
             # size=".7,.7"
             size = None
             #
-            nf = NeighborFigures(dictApiObj=dApi, pathInfoObj=pathInfoObj, pathDot=self.__pathDot, verbose=self.__verbose)
+            nf = NeighborFigures(
+                dictApiObj=dApi,
+                pathInfoObj=pathInfoObj,
+                pathDot=self.__pathDot,
+                keepDot=self.__keepDot,
+                figureCacheObj=self.__figureCache,
+                layoutBackend=self.__layoutBackend,
+                svgMinifierObj=self.__svgMinifier,
+                layoutTimeout=self.__layoutTimeout,
+                layoutMemoryLimit=self.__layoutMemoryLimit,
+                numWorkers=self.__numProc,
+                verbose=self.__verbose,
+            )
+            fm = FigureManifest(pathInfoObj.getDictCategoryImageManifestPath(), verbose=self.__verbose)
+            prevFm = None
+            if self.__incremental:
+                prevFm = FigureManifest(pathInfoObj.getDictCategoryImageManifestPath(), verbose=self.__verbose)
+                if not prevFm.read():
+                    logger.info("No figure manifest for %s - laying out all figures", dApi.getDictionaryTitle())
             for deliveryType in self.__deliveryTypeL:
                 nf.setItemCounts(self.__itemCountD[deliveryType], deliveryType=deliveryType)
             #
             dictTitle = dApi.getDictionaryTitle()
             dictVersion = dApi.getDictionaryVersion()
 
-            figureCount = 0
+            figureTaskList = []
             for categoryName in categoryNameList:
 
                 title = " <br/> <br/> Category Relationship Diagram for <b>%s</b> " % categoryName.upper()
                 subTitle = " in dictionary %s version %s " % (dictTitle, dictVersion)
-                ok = nf.makeNeighborFigure(
+                figureTask = nf.makeNeighborFigureDot(
                     categoryName,
                     graphTitle=title,
                     graphSubTitle=subTitle,
@@ -142,40 +326,40 @@ class NeighborFiguresWf(object):
                     filterDelivery=False,
                     deliveryType="archive",
                 )
-                if ok:
-                    figureCount += 1
+                if figureTask:
+                    figureTaskList.append(figureTask)
                 #
                 title = " <br/> <br/> Abbreviated Category Relationship Diagram for <b>%s</b> " % categoryName.upper()
                 subTitle = " in dictionary %s version %s <br/> including only data categories used in current PDB entries." % (dictTitle, dictVersion)
-                ok = nf.makeNeighborFigure(
+                figureTask = nf.makeNeighborFigureDot(
                     categoryName, graphTitle=title, graphSubTitle=subTitle, titleFormat="html", figFormat="svg", size=size, maxItems=20, filterDelivery=True, deliveryType="archive"
                 )
 
-                if ok:
-                    figureCount += 1
+                if figureTask:
+                    figureTaskList.append(figureTask)
 
                 if nf.getCategoryUseCount(categoryName, deliveryType="cc") > 0:
                     title = " <br/> <br/> Abbreviated Category Relationship Diagram for <b>%s</b> " % categoryName.upper()
                     subTitle = " in dictionary %s version %s <br/> including only data categories used in the chemical reference dictionary." % (dictTitle, dictVersion)
-                    ok = nf.makeNeighborFigure(
+                    figureTask = nf.makeNeighborFigureDot(
                         categoryName, graphTitle=title, graphSubTitle=subTitle, titleFormat="html", figFormat="svg", size=size, maxItems=20, filterDelivery=True, deliveryType="cc"
                     )
-                    if ok:
-                        figureCount += 1
+                    if figureTask:
+                        figureTaskList.append(figureTask)
 
                 if nf.getCategoryUseCount(categoryName, deliveryType="prd") > 0:
                     title = " <br/> <br/> Abbreviated Category Relationship Diagram for <b>%s</b> " % categoryName.upper()
                     subTitle = " in dictionary %s version %s <br/> including only data categories used in the BIRD reference dictionary." % (dictTitle, dictVersion)
-                    ok = nf.makeNeighborFigure(
+                    figureTask = nf.makeNeighborFigureDot(
                         categoryName, graphTitle=title, graphSubTitle=subTitle, titleFormat="html", figFormat="svg", size=size, maxItems=20, filterDelivery=True, deliveryType="prd"
                     )
-                    if ok:
-                        figureCount += 1
+                    if figureTask:
+                        figureTaskList.append(figureTask)
 
                 if nf.getCategoryUseCount(categoryName, deliveryType="family") > 0:
                     title = " <br/> <br/> Abbreviated Category Relationship Diagram for <b>%s</b> " % categoryName.upper()
                     subTitle = " in dictionary %s version %s <br/> including only data categories used in the BIRD family reference dictionary." % (dictTitle, dictVersion)
-                    ok = nf.makeNeighborFigure(
+                    figureTask = nf.makeNeighborFigureDot(
                         categoryName,
                         graphTitle=title,
                         graphSubTitle=subTitle,
@@ -186,13 +370,119 @@ class NeighborFiguresWf(object):
                         filterDelivery=True,
                         deliveryType="family",
                     )
-                    if ok:
-                        figureCount += 1
+                    if figureTask:
+                        figureTaskList.append(figureTask)
 
-            logger.debug("%s category count %d figure count %d", dictTitle, len(categoryNameList), figureCount)
+            # Figures with unchanged layout inputs are kept from the previous build -
+            sourceD = {}
+            layoutTaskList = figureTaskList
+            if prevFm is not None:
+                layoutTaskList = []
+                for figureTask in figureTaskList:
+                    ky = (figureTask["categoryName"], figureTask["variant"])
+                    sourceD[ky] = nf.getFigureFingerprint(figureTask)
+                    fD = prevFm.getFigure(*ky)
+                    if fD and fD.get("source") == sourceD[ky] and os.access(figureTask["figPath"], os.F_OK):
+                        statusD[ky] = True
+                        if fD.get("degraded"):
+                            degradedD[ky] = fD["degraded"]
+                    else:
+                        layoutTaskList.append(figureTask)
+            statusList = self.__layoutFigures(nf, layoutTaskList)
+            for ii, figureTask in enumerate(layoutTaskList):
+                if not statusList[ii] and figureTask["layoutError"] in ["timeout", "memory"]:
+                    statusList[ii], degradation = nf.layoutDegradedNeighborFigure(figureTask)
+                    if statusList[ii]:
+                        degradedD[(figureTask["categoryName"], figureTask["variant"])] = degradation
+            for figureTask, ok in zip(layoutTaskList, statusList):
+                statusD[(figureTask["categoryName"], figureTask["variant"])] = ok
+            for figureTask in figureTaskList:
+                ky = (figureTask["categoryName"], figureTask["variant"])
+                if statusD[ky]:
+                    fm.addFigure(figureTask["categoryName"], figureTask["variant"], figureTask["figPath"], degradation=degradedD.get(ky), source=sourceD.get(ky))
+            if prevFm is not None:
+                removeCount = self.__removeStaleFigures(prevFm, statusD, pathInfoObj)
+                logger.info("Incremental build of %s laying out %d of %d figures removing %d figures", dictTitle, len(layoutTaskList), len(figureTaskList), removeCount)
+            figureCount = sum(statusD.values())
+            logger.info(
+                "%s category count %d figure count %d failed %d degraded %d", dictTitle, len(categoryNameList), figureCount, len(statusD) - figureCount, len(degradedD)
+            )
+            for (categoryName, variant), degradation in sorted(degradedD.items()):
+                logger.warning("%s degraded figure %s (%s) laid out with %s", dictTitle, categoryName, variant, degradation)
+            if not fm.write():
+                logger.error("Failed writing figure manifest for %s", dictTitle)
         except Exception as e:
             logger.exception("Failing with %s", str(e))
-        return figureCount
+        return statusD, degradedD
+
+    def __removeStaleFigures(self, prevFigureManifestObj, statusD, pathInfoObj):
+        """Remove the figures in the previous figure manifest that are no longer generated.  Returns the number of figures removed."""
+        removeCount = 0
+        for categoryName, variant in prevFigureManifestObj.getFigureKeyList():
+            if (categoryName, variant) in statusD:
+                continue
+            figPath = os.path.join(pathInfoObj.getDictCategoryImagePath(), prevFigureManifestObj.getFigure(categoryName, variant)["fileName"])
+            try:
+                if os.path.exists(figPath):
+                    os.remove(figPath)
+                    removeCount += 1
+            except Exception as e:
+                logger.error("Failing to remove %s with %s", figPath, str(e))
+        return removeCount
+
+    def __makeOverviewFigures(self, dApi=None, pathInfoObj=None):
+        """Create the category relationship overview figures for the input dictionary and its category groups."""
+        ok = False
+        try:
+            of = OverviewFigures(
+                dictApiObj=dApi,
+                pathInfoObj=pathInfoObj,
+                pathDot=self.__pathDot,
+                figureCacheObj=self.__figureCache,
+                svgMinifierObj=self.__svgMinifier,
+                layoutTimeout=self.__layoutTimeout,
+                verbose=self.__verbose,
+            )
+            dictTitle = dApi.getDictionaryTitle()
+            title = "Category Relationship Overview for dictionary %s version %s" % (dictTitle, dApi.getDictionaryVersion())
+            statusD = of.makeOverviewFigures(graphTitle=title)
+            ok = statusD.get(None, False)
+            logger.info("%s overview figure status %r group figure count %d failed %d", dictTitle, ok, len(statusD) - 1, len([gN for gN, st in statusD.items() if gN and not st]))
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+        return ok
+
+    def __layoutFigures(self, nf, figureTaskList):
+        """Run the layout for each figure task with at most numProc concurrent layout processes (dot executable backend).
+
+        Figure tasks are divided into at most batchSize figures for each dot process, and into at least one batch
+        for each process if there are fewer tasks.
+
+        Returns:
+            list: status for each figure task
+        """
+        # In-process library layouts are serialized -
+        numWorkers = min(self.__numProc, len(figureTaskList)) if nf.getLayoutBackend() == "binary" else 1
+        if self.__batchSize < 2:
+            if numWorkers < 2:
+                return [nf.layoutNeighborFigure(figureTask) for figureTask in figureTaskList]
+            with concurrent.futures.ThreadPoolExecutor(max_workers=numWorkers) as executor:
+                statusList = list(executor.map(nf.layoutNeighborFigure, figureTaskList))
+            logger.debug("Completed %d figure layouts using %d processes", len(figureTaskList), numWorkers)
+            return statusList
+        #
+        batchSize = max(1, min(self.__batchSize, -(-len(figureTaskList) // max(1, numWorkers))))
+        batchList = [figureTaskList[ii : ii + batchSize] for ii in range(0, len(figureTaskList), batchSize)]
+        statusList = []
+        if numWorkers < 2:
+            for batch in batchList:
+                statusList.extend(nf.layoutNeighborFigureBatch(batch, batchSize=batchSize))
+            return statusList
+        with concurrent.futures.ThreadPoolExecutor(max_workers=numWorkers) as executor:
+            for sL in executor.map(lambda batch: nf.layoutNeighborFigureBatch(batch, batchSize=batchSize), batchList):
+                statusList.extend(sL)
+        logger.debug("Completed %d figure layouts in %d batches using %d processes", len(figureTaskList), len(batchList), numWorkers)
+        return statusList
 
     def __makeDirectories(self, pathInfoObj=None, purge=True):
         """Create file system structure for HTML dictionary rendering"""
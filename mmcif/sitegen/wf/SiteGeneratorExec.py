@@ -5,7 +5,20 @@
 #  Execution wrapper  --  PDBx/mmCIF site generator
 #
 #  Updates:
-#
+#   18-Oct-2026  add --search_index option
+#   18-Oct-2026  add --enum_row_limit option
+#   18-Oct-2026  add --figure_cache_path option
+#   18-Oct-2026  add --layout_backend option
+#   18-Oct-2026  add --figure_batch_size option
+#   18-Oct-2026  add the 'python' --layout_backend choice
+#   18-Oct-2026  add --minify_figures and --relative_figure_links options
+#   19-Oct-2026  add --layout_timeout and --layout_memory_limit options
+#   19-Oct-2026  add --overview_figures option
+#   19-Oct-2026  add --inline_figures option
+#   19-Oct-2026  add --jobs option
+#   19-Oct-2026  add --incremental option
+#   19-Oct-2026  add --num_proc option
+#   19-Oct-2026  add --lazy_index option
 ##
 __docformat__ = "restructuredtext en"
 __author__ = "John Westbrook"
@@ -35,6 +48,35 @@ def main():
     parser.add_argument("--web_file_assets_path", default=None, help="Top path for website source file assests")
     parser.add_argument("--html", default=False, action="store_true", help="Generate HTML content")
     parser.add_argument("--images", default=False, action="store_true", help="Generate image content")
+    parser.add_argument("--lazy_index", default=False, action="store_true", help="Render the alphabetical category and item index pages with lazily loaded sections (default=False)")
+    parser.add_argument("--search_index", default=False, action="store_true", help="Generate client-side search index with HTML content")
+    parser.add_argument("--enum_row_limit", default=None, type=int, help="Maximum number of enumeration table rows rendered in item pages (default=no limit)")
+    parser.add_argument("--figure_cache_path", default=None, help="Directory of a persistent cache of rendered figures (default=no cache)")
+    parser.add_argument(
+        "--layout_backend",
+        default="auto",
+        choices=["auto", "library", "binary", "python"],
+        help="Figure layout with the Graphviz library (pygraphviz), dot executable or built-in SVG renderer (default=auto)",
+    )
+    parser.add_argument("--figure_batch_size", default=100, type=int, help="Maximum number of figures laid out by each dot process (default=100)")
+    parser.add_argument("--minify_figures", default=False, action="store_true", help="Minify SVG figures (default=False)")
+    parser.add_argument("--relative_figure_links", default=False, action="store_true", help="Use links relative to the figure location in minified figures (default=False)")
+    parser.add_argument("--layout_timeout", default=None, type=float, help="Maximum time (seconds) for the layout of each figure (default=no limit)")
+    parser.add_argument("--layout_memory_limit", default=None, type=int, help="Maximum memory (MB) for the layout of each figure (default=no limit)")
+    parser.add_argument(
+        "--inline_figures", default=False, action="store_true", help="Embed the primary relationship figure in category pages (requires figures without relative links, default=False)"
+    )
+    parser.add_argument("--overview_figures", default=False, action="store_true", help="Render category relationship overview figures (default=False)")
+    parser.add_argument("--jobs", default=1, type=int, help="Number of dictionaries rendered concurrently in separate processes (default=1)")
+    parser.add_argument(
+        "--num_proc",
+        default=None,
+        type=int,
+        help="Number of processes rendering the pages or laying out the figures of each dictionary (default=1 for pages, available CPUs divided by --jobs for figures)",
+    )
+    parser.add_argument(
+        "--incremental", default=False, action="store_true", help="Render only the pages and figures with inputs changed since the previous build (default=False)"
+    )
     parser.add_argument("--test_mode_flag", default=False, action="store_true", help="Test mode flag (default=False)")
     #
     args = parser.parse_args()
@@ -45,6 +87,21 @@ def main():
         testModeFlag = args.test_mode_flag
         doHtml = args.html
         doImages = args.images
+        doSearchIndex = args.search_index
+        lazyIndex = args.lazy_index
+        enumRowLimit = args.enum_row_limit
+        inlineFigures = args.inline_figures
+        figureCachePath = args.figure_cache_path
+        layoutBackend = args.layout_backend
+        figureBatchSize = args.figure_batch_size
+        minifyFigures = args.minify_figures
+        relativeFigureLinks = args.relative_figure_links
+        layoutTimeout = args.layout_timeout
+        layoutMemoryLimit = args.layout_memory_limit
+        overviewFigures = args.overview_figures
+        numJobs = args.jobs
+        numProc = args.num_proc
+        incremental = args.incremental
     except Exception as e:
         logger.exception("Argument processing problem %s", str(e))
         parser.print_help(sys.stderr)
@@ -55,12 +112,38 @@ def main():
         exit(1)
     # ----------------------- - ----------------------- - ----------------------- - ----------------------- - ----------------------- -
     if doHtml:
-        hgWf = HtmlGeneratorWf(websiteGenPath=websiteGenPath, websiteFileAssetsPath=websiteFileAssetsPath, testMode=testModeFlag)
+        hgWf = HtmlGeneratorWf(
+            websiteGenPath=websiteGenPath,
+            websiteFileAssetsPath=websiteFileAssetsPath,
+            testMode=testModeFlag,
+            searchIndex=doSearchIndex,
+            lazyIndex=lazyIndex,
+            enumRowLimit=enumRowLimit,
+            inlineFigures=inlineFigures,
+            numJobs=numJobs,
+            numProc=numProc,
+            incremental=incremental,
+        )
         ok = hgWf.run()
         logger.info("Completed HTML generation actions with status %r", ok)
 
     if doImages:
-        nfWf = NeighborFiguresWf(websiteGenPath=websiteGenPath, websiteFileAssetsPath=websiteFileAssetsPath, testMode=testModeFlag)
+        nfWf = NeighborFiguresWf(
+            websiteGenPath=websiteGenPath,
+            websiteFileAssetsPath=websiteFileAssetsPath,
+            testMode=testModeFlag,
+            figureCachePath=figureCachePath,
+            layoutBackend=layoutBackend,
+            batchSize=figureBatchSize,
+            minifyFigures=minifyFigures,
+            relativeFigureLinks=relativeFigureLinks,
+            layoutTimeout=layoutTimeout,
+            layoutMemoryLimit=layoutMemoryLimit,
+            overviewFigures=overviewFigures,
+            numJobs=numJobs,
+            numProc=numProc,
+            incremental=incremental,
+        )
         ok = nfWf.run()
         logger.info("Completed image generation actions with status %r", ok)
 